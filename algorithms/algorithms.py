@@ -1,26 +1,32 @@
-from spirtes.block_sprites import BlockSprite
-
-
-class InsertionSort:
-    def __init__(self, blocks):
-        self.counter = 0
-        self.blocks = blocks
-        self.block_len = len(self.blocks)
-
-    def sort(self) -> list[BlockSprite]:
-        if self.counter >= self.block_len:
-            return self.blocks
-        for index in range(1, self.block_len):
-            current_value = self.blocks[self.counter]
-            position = self.counter
-            while (
-                position > 0 and self.blocks[position - 1].height > current_value.height
-            ):
-                self.blocks[position] = self.blocks[position - 1]
+import random
+from array import array
+from typing import Iterator
+
+from algorithms.steps import Op, SortingAlgorithm, Step
+
+
+class InsertionSort(SortingAlgorithm):
+    extra_loop = True
+
+    def steps(self) -> Iterator[Step]:
+        values, order = self.values, self.model.order
+        for index in range(self.block_len):
+            current_value = values[index]
+            current_element = order[index]
+            position = index
+            while position > 0:
+                yield Step(Op.COMPARE, position - 1, position)
+                if values[position - 1] <= current_value:
+                    break
+                values[position] = values[position - 1]
+                order[position] = order[position - 1]
+                yield Step(Op.WRITE, position, value=order[position])
                 position -= 1
-            self.blocks[position] = current_value
-            self.counter += 1
-            return self.blocks
+            if position != index:
+                values[position] = current_value
+                order[position] = current_element
+                yield Step(Op.WRITE, position, value=current_element)
+            yield Step(Op.PASS, index)
 
     @staticmethod
     def algorithm_info():
@@ -33,25 +39,20 @@ class InsertionSort:
         ]
 
 
-class SelectionSort:
-    def __init__(self, blocks):
-        self.counter = 0
-        self.blocks = blocks
-        self.block_len = len(self.blocks)
-
-    def sort(self) -> list[BlockSprite]:
-        if self.counter >= self.block_len:
-            return self.blocks
-        min_index = self.counter
-        for i in range(self.counter + 1, self.block_len):
-            if self.blocks[i].height < self.blocks[min_index].height:
-                min_index = i
-        self.blocks[self.counter], self.blocks[min_index] = (
-            self.blocks[min_index],
-            self.blocks[self.counter],
-        )
-        self.counter += 1
-        return self.blocks
+class SelectionSort(SortingAlgorithm):
+    def steps(self) -> Iterator[Step]:
+        values, order = self.values, self.model.order
+        for index in range(self.block_len):
+            min_index = index
+            for i in range(index + 1, self.block_len):
+                yield Step(Op.COMPARE, i, min_index)
+                if values[i] < values[min_index]:
+                    min_index = i
+            if min_index != index:
+                values[index], values[min_index] = values[min_index], values[index]
+                order[index], order[min_index] = order[min_index], order[index]
+                yield Step(Op.SWAP, index, min_index)
+            yield Step(Op.PASS, index)
 
     @staticmethod
     def algorithm_info():
@@ -70,20 +71,17 @@ class SelectionSort:
         ]
 
 
-class BubbleSort:
-    def __init__(self, blocks):
-        self.counter = 0
-        self.blocks = blocks
-        self.block_len = len(self.blocks)
-
-    def sort(self) -> list[BlockSprite]:
-        if self.counter >= self.block_len:
-            return self.blocks
-        for j in range(self.block_len - self.counter - 1):
-            if self.blocks[j].height > self.blocks[j + 1].height:
-                self.blocks[j], self.blocks[j + 1] = self.blocks[j + 1], self.blocks[j]
-        self.counter += 1
-        return self.blocks
+class BubbleSort(SortingAlgorithm):
+    def steps(self) -> Iterator[Step]:
+        values, order = self.values, self.model.order
+        for index in range(self.block_len):
+            for j in range(self.block_len - index - 1):
+                yield Step(Op.COMPARE, j, j + 1)
+                if values[j] > values[j + 1]:
+                    values[j], values[j + 1] = values[j + 1], values[j]
+                    order[j], order[j + 1] = order[j + 1], order[j]
+                    yield Step(Op.SWAP, j, j + 1)
+            yield Step(Op.PASS, index)
 
     @staticmethod
     def algorithm_info():
@@ -93,3 +91,451 @@ class BubbleSort:
             "Time complexity: Best: O(n), Average: O(n^2), Worst: O(n^2)",
             "Space Complexity: O(1)",
         ]
+
+
+class MergeSort(SortingAlgorithm):
+    def steps(self) -> Iterator[Step]:
+        values, order = self.values, self.model.order
+        n = self.block_len
+        buffer = array("i", bytes(4 * n))
+        aux_values = self.tracked(buffer)
+        aux_order = array("i", bytes(4 * n))
+        self.aux_lanes = {"Buffer": buffer}
+        width = 1
+        while width < n:
+            for low in range(0, n - width, 2 * width):
+                middle = low + width
+                high = min(low + 2 * width, n)
+                for k in range(low, high):
+                    aux_values[k] = values[k]
+                    aux_order[k] = order[k]
+                    yield Step(Op.AUX_WRITE, k, value=aux_order[k])
+                i, j = low, middle
+                for k in range(low, high):
+                    if i < middle and j < high:
+                        yield Step(Op.COMPARE, i, j)
+                        take_left = aux_values[i] <= aux_values[j]
+                    else:
+                        take_left = i < middle
+                    if take_left:
+                        source = i
+                        i += 1
+                    else:
+                        source = j
+                        j += 1
+                    values[k] = aux_values[source]
+                    order[k] = aux_order[source]
+                    yield Step(Op.WRITE, k, value=order[k])
+                yield Step(Op.PASS, low)
+            width *= 2
+
+    @staticmethod
+    def algorithm_info():
+        return [
+            "Merge sort divides the list into runs and repeatedly merges neighbouring sorted runs into longer ones.",
+            "This visualization merges bottom-up: runs of 1, then 2, then 4 and so on until one run remains.",
+            "Each merge copies its runs into the auxiliary buffer shown on the right and writes them back in order.",
+            "Time complexity: Best: Ω(n log n), Average: Θ(n log n), Worst: O(n log n)",
+            "Space Complexity: O(n)",
+        ]
+
+
+class QuickSort(SortingAlgorithm):
+    pivots = ("last", "first", "middle", "median3", "random")
+    settings = ("pivot",)
+
+    def __init__(self, blocks, pivot="last", seed=None, count_ops=False):
+        if pivot not in self.pivots:
+            raise ValueError(f"Unknown pivot strategy: {pivot}")
+        self.pivot = pivot
+        self.random = random.Random(seed)
+        super().__init__(blocks, count_ops)
+
+    def choose_pivot(self, low, high):
+        if self.pivot == "first":
+            return low
+        if self.pivot == "middle":
+            return (low + high) // 2
+        if self.pivot == "random":
+            return self.random.randint(low, high)
+        if self.pivot == "median3":
+            values = self.values
+            middle = (low + high) // 2
+            candidates = sorted((low, middle, high), key=values.__getitem__)
+            return candidates[1]
+        return high
+
+    def steps(self) -> Iterator[Step]:
+        values, order = self.values, self.model.order
+        ranges = [(0, self.block_len - 1)]
+        while ranges:
+            low, high = ranges.pop()
+            if low >= high:
+                continue
+            pivot_index = self.choose_pivot(low, high)
+            if pivot_index != high:
+                values[pivot_index], values[high] = values[high], values[pivot_index]
+                order[pivot_index], order[high] = order[high], order[pivot_index]
+                yield Step(Op.SWAP, pivot_index, high)
+            pivot = values[high]
+            store = low
+            for i in range(low, high):
+                yield Step(Op.COMPARE, i, high)
+                if values[i] < pivot:
+                    if i != store:
+                        values[i], values[store] = values[store], values[i]
+                        order[i], order[store] = order[store], order[i]
+                        yield Step(Op.SWAP, store, i)
+                    store += 1
+            if store != high:
+                values[store], values[high] = values[high], values[store]
+                order[store], order[high] = order[high], order[store]
+                yield Step(Op.SWAP, store, high)
+            yield Step(Op.PASS, store)
+            # Push the larger side first so the smaller one is handled next,
+            # which keeps the pending range list O(log n).
+            left, right = (low, store - 1), (store + 1, high)
+            if left[1] - left[0] > right[1] - right[0]:
+                ranges.extend((left, right))
+            else:
+                ranges.extend((right, left))
+
+    @staticmethod
+    def algorithm_info():
+        return [
+            "Quicksort picks a pivot element and partitions the list so smaller elements come before it and the "
+            "rest after it.",
+            "The two partitions are then sorted the same way. Each step in this visualization is one partition.",
+            "The pivot can be the first, last, middle, median of three or a random element.",
+            "Time complexity: Best: Ω(n log n), Average: Θ(n log n), Worst: O(n^2)",
+            "Space Complexity: O(log n)",
+        ]
+
+
+class HeapSort(SortingAlgorithm):
+    def sift_down(self, start, end):
+        values, order = self.values, self.model.order
+        root = start
+        while True:
+            child = 2 * root + 1
+            if child >= end:
+                return
+            if child + 1 < end:
+                yield Step(Op.COMPARE, child, child + 1)
+                if values[child] < values[child + 1]:
+                    child += 1
+            yield Step(Op.COMPARE, root, child)
+            if values[root] >= values[child]:
+                return
+            values[root], values[child] = values[child], values[root]
+            order[root], order[child] = order[child], order[root]
+            yield Step(Op.SWAP, root, child)
+            root = child
+
+    def steps(self) -> Iterator[Step]:
+        values, order = self.values, self.model.order
+        n = self.block_len
+        if n < 2:
+            return
+        for start in range(n // 2 - 1, -1, -1):
+            yield from self.sift_down(start, n)
+        yield Step(Op.PASS, 0)
+        for end in range(n - 1, 0, -1):
+            values[0], values[end] = values[end], values[0]
+            order[0], order[end] = order[end], order[0]
+            yield Step(Op.SWAP, 0, end)
+            yield from self.sift_down(0, end)
+            yield Step(Op.PASS, end)
+
+    @staticmethod
+    def algorithm_info():
+        return [
+            "Heapsort first rearranges the list into a max-heap, a tree stored in the list where every parent is at "
+            "least as large as its children.",
+            "It then repeatedly swaps the largest element at the root to the end of the list and restores the heap "
+            "on the rest.",
+            "Time complexity: Best: Ω(n log n), Average: Θ(n log n), Worst: O(n log n)",
+            "Space Complexity: O(1)",
+        ]
+
+
+class ShellSort(SortingAlgorithm):
+    gap_sequences = ("shell", "knuth", "hibbard", "ciura")
+    settings = ("gaps",)
+
+    def __init__(self, blocks, gaps="ciura", count_ops=False):
+        if gaps not in self.gap_sequences:
+            raise ValueError(f"Unknown gap sequence: {gaps}")
+        self.gap_sequence = gaps
+        super().__init__(blocks, count_ops)
+
+    def gaps(self):
+        n = self.block_len
+        if self.gap_sequence == "shell":
+            gaps = []
+            gap = n // 2
+            while gap > 0:
+                gaps.append(gap)
+                gap //= 2
+            return gaps or [1]
+        if self.gap_sequence == "knuth":
+            gaps = [1]
+            while gaps[-1] * 3 + 1 < n:
+                gaps.append(gaps[-1] * 3 + 1)
+        elif self.gap_sequence == "hibbard":
+            gaps = [1]
+            while gaps[-1] * 2 + 1 < n:
+                gaps.append(gaps[-1] * 2 + 1)
+        else:
+            gaps = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+            while gaps[-1] < n:
+                gaps.append(int(gaps[-1] * 2.25))
+            gaps = [gap for gap in gaps if gap < n] or [1]
+        return gaps[::-1]
+
+    def steps(self) -> Iterator[Step]:
+        values, order = self.values, self.model.order
+        for gap in self.gaps():
+            for index in range(gap, self.block_len):
+                current_value = values[index]
+                current_element = order[index]
+                position = index
+                while position >= gap:
+                    yield Step(Op.COMPARE, position - gap, position)
+                    if values[position - gap] <= current_value:
+                        break
+                    values[position] = values[position - gap]
+                    order[position] = order[position - gap]
+                    yield Step(Op.WRITE, position, value=order[position])
+                    position -= gap
+                if position != index:
+                    values[position] = current_value
+                    order[position] = current_element
+                    yield Step(Op.WRITE, position, value=current_element)
+            yield Step(Op.PASS, gap)
+
+    @staticmethod
+    def algorithm_info():
+        return [
+            "Shell sort is a generalization of insertion sort that first sorts elements far apart from each other.",
+            "Each step runs a gapped insertion sort, shrinking the gap until a final pass with a gap of 1.",
+            "The gap sequence can be Shell's, Knuth's, Hibbard's or Ciura's.",
+            "Time complexity: Best: Ω(n log n), Average: depends on the gaps, Worst: O(n^(3/2)) with Knuth's gaps",
+            "Space Complexity: O(1)",
+        ]
+
+
+class DistributionSort(SortingAlgorithm):
+    """Base class for the non-comparison sorts of non-negative integers.
+
+    ``distribute`` is a stable counting pass: it counts keys into the
+    ``Buckets`` lane, scatters the elements into the ``Buffer`` lane and
+    copies them back, ending each of the three phases with a pass. These
+    sorts make few passes, so they are only done once the run is finished.
+    """
+
+    def __init__(self, blocks, count_ops=False):
+        super().__init__(blocks, count_ops)
+        if self.block_len and min(self.model.values) < 0:
+            raise ValueError(f"{type(self).__name__} needs non-negative values")
+
+    @property
+    def done(self) -> bool:
+        return self.finished
+
+    def make_lanes(self, buckets):
+        bucket_counts = array("i", bytes(4 * buckets))
+        buffer = array("i", bytes(4 * self.block_len))
+        self.aux_lanes = {"Buckets": bucket_counts, "Buffer": buffer}
+        self.buffer_order = array("i", bytes(4 * self.block_len))
+        return self.tracked(bucket_counts), self.tracked(buffer)
+
+    def distribute(self, low, high, key, counts, buffer):
+        """Stable sort of positions ``low..high-1`` by ``key(value)``.
+
+        Returns the start of every bucket followed by ``high``.
+        """
+        values, order = self.values, self.model.order
+        buffer_order = self.buffer_order
+        for bucket in range(len(counts)):
+            counts[bucket] = 0
+        for i in range(low, high):
+            bucket = key(values[i])
+            counts[bucket] += 1
+            yield Step(Op.AUX_WRITE, bucket, value=order[i])
+        yield Step(Op.PASS, low)
+        starts = []
+        total = low
+        for bucket in range(len(counts)):
+            starts.append(total)
+            total += counts[bucket]
+        bounds = starts + [high]
+        for i in range(low, high):
+            value = values[i]
+            bucket = key(value)
+            position = starts[bucket]
+            starts[bucket] += 1
+            buffer[position] = value
+            buffer_order[position] = order[i]
+            yield Step(Op.AUX_WRITE, position, value=order[i])
+        yield Step(Op.PASS, low)
+        for i in range(low, high):
+            values[i] = buffer[i]
+            order[i] = buffer_order[i]
+            yield Step(Op.WRITE, i, value=order[i])
+        yield Step(Op.PASS, low)
+        return bounds
+
+
+class CountingSort(DistributionSort):
+    def steps(self) -> Iterator[Step]:
+        if not self.block_len:
+            return
+        smallest, largest = min(self.model.values), max(self.model.values)
+        counts, buffer = self.make_lanes(largest - smallest + 1)
+        yield from self.distribute(
+            0, self.block_len, lambda value: value - smallest, counts, buffer
+        )
+
+    @staticmethod
+    def algorithm_info():
+        return [
+            "Counting sort counts how many times each value occurs, without comparing elements to each other.",
+            "The counts (top lane on the right) give every value its final position, and the elements are copied",
+            "through the buffer (bottom lane) in order. Equal values keep their relative order.",
+            "Time complexity: Θ(n + k) for values spanning a range of k",
+            "Space Complexity: O(n + k)",
+        ]
+
+
+class LSDRadixSort(DistributionSort):
+    def __init__(self, blocks, radix=10, count_ops=False):
+        if radix < 2:
+            raise ValueError(f"Radix must be at least 2, got {radix}")
+        self.radix = radix
+        super().__init__(blocks, count_ops)
+
+    def steps(self) -> Iterator[Step]:
+        if not self.block_len:
+            return
+        radix = self.radix
+        largest = max(self.model.values)
+        counts, buffer = self.make_lanes(radix)
+        exponent = 1
+        while True:
+            yield from self.distribute(
+                0,
+                self.block_len,
+                lambda value: value // exponent % radix,
+                counts,
+                buffer,
+            )
+            exponent *= radix
+            if exponent > largest:
+                return
+
+    @staticmethod
+    def algorithm_info():
+        return [
+            "LSD radix sort sorts by one digit at a time, starting from the least significant digit.",
+            "Each digit is a stable counting pass into one bucket per digit value (top lane on the right),",
+            "so the order from earlier digits is kept for equal digits. The radix sets the number of buckets.",
+            "Time complexity: Θ(d(n + r)) for d digits in radix r",
+            "Space Complexity: O(n + r)",
+        ]
+
+
+class MSDRadixSort(DistributionSort):
+    def __init__(self, blocks, radix=10, count_ops=False):
+        if radix < 2:
+            raise ValueError(f"Radix must be at least 2, got {radix}")
+        self.radix = radix
+        super().__init__(blocks, count_ops)
+
+    def steps(self) -> Iterator[Step]:
+        if not self.block_len:
+            return
+        radix = self.radix
+        largest = max(self.model.values)
+        exponent = 1
+        while exponent * radix <= largest:
+            exponent *= radix
+        counts, buffer = self.make_lanes(radix)
+        ranges = [(0, self.block_len, exponent)]
+        while ranges:
+            low, high, exponent = ranges.pop()
+            if high - low < 2 or not exponent:
+                continue
+            bounds = yield from self.distribute(
+                low,
+                high,
+                lambda value: value // exponent % radix,
+                counts,
+                buffer,
+            )
+            # Reversed so the leftmost bucket is refined first.
+            for bucket in range(radix - 1, -1, -1):
+                ranges.append((bounds[bucket], bounds[bucket + 1], exponent // radix))
+
+    @staticmethod
+    def algorithm_info():
+        return [
+            "MSD radix sort splits the list into buckets by its most significant digit,",
+            "then sorts each bucket the same way by the next digit until every bucket holds one value.",
+            "Each split is a stable counting pass; the radix sets the number of buckets per split.",
+            "Time complexity: O(d(n + r)) for d digits in radix r",
+            "Space Complexity: O(n + r)",
+        ]
+
+
+class BucketSort(DistributionSort):
+    def __init__(self, blocks, buckets=None, count_ops=False):
+        if buckets is not None and buckets < 1:
+            raise ValueError(f"Need at least one bucket, got {buckets}")
+        self.buckets = buckets
+        super().__init__(blocks, count_ops)
+
+    def steps(self) -> Iterator[Step]:
+        n = self.block_len
+        if not n:
+            return
+        values, order = self.values, self.model.order
+        smallest, largest = min(self.model.values), max(self.model.values)
+        buckets = self.buckets or max(1, int(n**0.5))
+        span = largest - smallest + 1
+        counts, buffer = self.make_lanes(buckets)
+        bounds = yield from self.distribute(
+            0, n, lambda value: (value - smallest) * buckets // span, counts, buffer
+        )
+        # Insertion sort inside each bucket, one pass per bucket.
+        for bucket in range(buckets):
+            low, high = bounds[bucket], bounds[bucket + 1]
+            if high - low < 2:
+                continue
+            for index in range(low + 1, high):
+                current_value = values[index]
+                current_element = order[index]
+                position = index
+                while position > low:
+                    yield Step(Op.COMPARE, position - 1, position)
+                    if values[position - 1] <= current_value:
+                        break
+                    values[position] = values[position - 1]
+                    order[position] = order[position - 1]
+                    yield Step(Op.WRITE, position, value=order[position])
+                    position -= 1
+                if position != index:
+                    values[position] = current_value
+                    order[position] = current_element
+                    yield Step(Op.WRITE, position, value=current_element)
+            yield Step(Op.PASS, low)
+
+    @staticmethod
+    def algorithm_info():
+        return [
+            "Bucket sort spreads the values over buckets that each cover an equal slice of the value range,",
+            "then insertion sorts each bucket. The top lane on the right shows how many values land in each bucket.",
+            "With evenly spread values every bucket stays small.",
+            "Time complexity: Best and Average: Θ(n) for evenly spread values, Worst: O(n^2)",
+            "Space Complexity: O(n + b) for b buckets",
+        ]
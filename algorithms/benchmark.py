@@ -0,0 +1,232 @@
+import argparse
+import csv
+import itertools
+import json
+import sys
+import time
+from typing import NamedTuple, Optional
+
+from algorithms import datasets
+from algorithms.model import BoardModel
+from algorithms.registry import registry
+from algorithms.steps import Op
+
+FIELDS = [
+    "algorithm",
+    "distribution",
+    "size",
+    "seed",
+    "completed",
+    "seconds",
+    "steps",
+    "comparisons",
+    "swaps",
+    "writes",
+    "reads",
+    "array_writes",
+    "variant",
+]
+
+
+class Result(NamedTuple):
+    algorithm: str
+    distribution: str
+    size: int
+    seed: int
+    completed: bool
+    seconds: float
+    steps: int
+    comparisons: int
+    swaps: int
+    writes: int
+    reads: Optional[int] = None
+    array_writes: Optional[int] = None
+    variant: str = ""
+
+
+def run_one(
+    name,
+    distribution,
+    size,
+    seed=0,
+    time_limit=None,
+    count_ops=False,
+    cache_dir=None,
+    options=None,
+):
+    # Counting element reads and writes slows the run down, so the timings of
+    # counted and uncounted runs are not comparable.
+    values = datasets.load(distribution, size, seed, cache_dir)
+    options = options or {}
+    sorter = registry.load(name)(BoardModel(values), count_ops=count_ops, **options)
+    counts = [0] * len(Op)
+    step = sorter.step
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    start = time.perf_counter()
+    steps = 0
+    while True:
+        result = step()
+        if result is None:
+            break
+        counts[result.op] += 1
+        steps += 1
+        if deadline is not None and not steps & 0xFFF:
+            if time.perf_counter() > deadline:
+                break
+    seconds = time.perf_counter() - start
+    counted = sorter.counts
+    return Result(
+        name,
+        distribution,
+        size,
+        seed,
+        sorter.finished,
+        seconds,
+        steps,
+        counts[Op.COMPARE],
+        counts[Op.SWAP],
+        counts[Op.WRITE] + counts[Op.AUX_WRITE],
+        None if counted is None else counted.reads,
+        None if counted is None else counted.writes,
+        ",".join(f"{key}={value}" for key, value in options.items()),
+    )
+
+
+def run(
+    algorithms,
+    distributions,
+    sizes,
+    seed=0,
+    time_limit=None,
+    count_ops=False,
+    cache_dir=None,
+    options=None,
+):
+    # ``options`` maps a setting such as "pivot" to the values to try; every
+    # algorithm that accepts a setting is run once per combination.
+    results = []
+    for name in algorithms:
+        for variant in variants(registry.load(name), options):
+            for distribution in distributions:
+                for size in sizes:
+                    results.append(
+                        run_one(
+                            name,
+                            distribution,
+                            size,
+                            seed,
+                            time_limit,
+                            count_ops,
+                            cache_dir,
+                            variant,
+                        )
+                    )
+    return results
+
+
+def variants(algorithm_class, options):
+    accepted = algorithm_class.select_options(options)
+    names = list(accepted)
+    return [
+        dict(zip(names, values))
+        for values in itertools.product(*(accepted[name] for name in names))
+    ]
+
+
+def write_results(results, path, fmt):
+    stream = sys.stdout if path == "-" else open(path, "w", newline="")
+    try:
+        if fmt == "json":
+            json.dump([r._asdict() for r in results], stream, indent=2)
+            stream.write("\n")
+        else:
+            writer = csv.DictWriter(stream, fieldnames=FIELDS)
+            writer.writeheader()
+            for r in results:
+                writer.writerow(r._asdict())
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+
+def parse_list(text):
+    return [item.strip() for item in text.split(",") if item.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m algorithms.benchmark",
+        description="Run the sorting algorithms headless and record timings.",
+    )
+    parser.add_argument("--algorithms", default=",".join(registry.keys()))
+    parser.add_argument("--distributions", default="random")
+    parser.add_argument("--sizes", default="9,100,1000")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=None,
+        help="Stop a single run after this many seconds and mark it incomplete.",
+    )
+    parser.add_argument(
+        "--count-ops",
+        action="store_true",
+        help="Also count element reads and writes (slower, affects timings).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=datasets.DEFAULT_CACHE_DIR,
+        help=f"Where inputs of {datasets.CACHE_MIN_SIZE} or more elements are cached.",
+    )
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument(
+        "--pivots",
+        default=None,
+        help="Comma separated QuickSort pivot strategies to compare.",
+    )
+    parser.add_argument(
+        "--gaps",
+        default=None,
+        help="Comma separated ShellSort gap sequences to compare.",
+    )
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--output", default="-")
+    args = parser.parse_args(argv)
+
+    algorithms = parse_list(args.algorithms)
+    distributions = parse_list(args.distributions)
+    for name in algorithms:
+        if name not in registry.keys():
+            parser.error(f"unknown algorithm {name!r}")
+    for distribution in distributions:
+        if distribution not in datasets.DISTRIBUTIONS:
+            parser.error(f"unknown distribution {distribution!r}")
+    sizes = [int(size) for size in parse_list(args.sizes)]
+    options = {}
+    if args.pivots:
+        options["pivot"] = parse_list(args.pivots)
+        for pivot in options["pivot"]:
+            if pivot not in registry.load("quick").pivots:
+                parser.error(f"unknown pivot strategy {pivot!r}")
+    if args.gaps:
+        options["gaps"] = parse_list(args.gaps)
+        for gaps in options["gaps"]:
+            if gaps not in registry.load("shell").gap_sequences:
+                parser.error(f"unknown gap sequence {gaps!r}")
+
+    cache_dir = None if args.no_cache else args.cache_dir
+    results = run(
+        algorithms,
+        distributions,
+        sizes,
+        args.seed,
+        args.time_limit,
+        args.count_ops,
+        cache_dir,
+        options,
+    )
+    write_results(results, args.output, args.format)
+
+
+if __name__ == "__main__":
+    main()
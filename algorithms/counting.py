@@ -0,0 +1,37 @@
+class OpCounts:
+    """Running totals of the work an algorithm has done."""
+
+    __slots__ = ("reads", "writes", "comparisons", "swaps")
+
+    def __init__(self):
+        self.reads = 0
+        self.writes = 0
+        self.comparisons = 0
+        self.swaps = 0
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class CountingArray:
+    """Wraps an array and counts element reads and writes into ``counts``.
+
+    Swapping two elements through it counts as two reads and two writes.
+    """
+
+    __slots__ = ("data", "counts")
+
+    def __init__(self, data, counts):
+        self.data = data
+        self.counts = counts
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        self.counts.reads += 1
+        return self.data[index]
+
+    def __setitem__(self, index, value):
+        self.counts.writes += 1
+        self.data[index] = value
@@ -0,0 +1,160 @@
+import ast
+import os
+import random
+import sys
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+
+# Inputs at least this large are cached on disk by default; smaller ones are
+# cheaper to regenerate than to read back.
+CACHE_MIN_SIZE = 10_000
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "sorting-visualizer",
+    "datasets",
+)
+
+NPY_MAGIC = b"\x93NUMPY"
+
+
+def shuffled(size, rng):
+    values = list(range(1, size + 1))
+    rng.shuffle(values)
+    return values
+
+
+def sorted_values(size, rng):
+    return list(range(1, size + 1))
+
+
+def reversed_values(size, rng):
+    return list(range(size, 0, -1))
+
+
+def nearly_sorted(size, rng, swaps=None):
+    values = list(range(1, size + 1))
+    if swaps is None:
+        swaps = max(1, size // 20)
+    for _ in range(swaps if size else 0):
+        i, j = rng.randrange(size), rng.randrange(size)
+        values[i], values[j] = values[j], values[i]
+    return values
+
+
+def uniform(size, rng):
+    return [rng.randint(1, size) for _ in range(size)]
+
+
+def few_unique(size, rng, unique=8):
+    unique = max(1, min(unique, size))
+    levels = [1 + k * (size - 1) // max(unique - 1, 1) for k in range(unique)]
+    return [rng.choice(levels) for _ in range(size)]
+
+
+def sawtooth(size, rng, teeth=4):
+    # Ascending runs that restart from the bottom; the seed only picks where
+    # the first run starts.
+    tooth = max(1, -(-size // max(teeth, 1)))
+    phase = rng.randrange(tooth)
+    return [1 + ((i + phase) % tooth) * size // tooth for i in range(size)]
+
+
+def zipf(size, rng, exponent=1.1):
+    # Value k is drawn with probability proportional to 1 / k**exponent, so
+    # small values repeat a lot and large ones are rare.
+    cumulative = list(accumulate(1 / k**exponent for k in range(1, size + 1)))
+    total = cumulative[-1] if cumulative else 0
+    return [
+        min(bisect_left(cumulative, rng.random() * total), size - 1) + 1
+        for _ in range(size)
+    ]
+
+
+DISTRIBUTIONS = {
+    "random": shuffled,
+    "sorted": sorted_values,
+    "reversed": reversed_values,
+    "nearly-sorted": nearly_sorted,
+    "uniform": uniform,
+    "few-unique": few_unique,
+    "sawtooth": sawtooth,
+    "zipf": zipf,
+}
+
+
+def generate(distribution, size, seed):
+    """Values in ``1..size`` drawn from ``distribution``, fixed by ``seed``."""
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution: {distribution}")
+    return array("i", DISTRIBUTIONS[distribution](size, random.Random(seed)))
+
+
+def cache_path(cache_dir, distribution, size, seed):
+    return os.path.join(cache_dir, f"{distribution}-{size}-{seed}.npy")
+
+
+def load(distribution, size, seed, cache_dir=DEFAULT_CACHE_DIR):
+    """Like ``generate``, but reads and writes large inputs from ``cache_dir``.
+
+    Unseeded inputs are never cached. Pass ``cache_dir=None`` to always
+    regenerate.
+    """
+    if cache_dir is None or seed is None or size < CACHE_MIN_SIZE:
+        return generate(distribution, size, seed)
+    path = cache_path(cache_dir, distribution, size, seed)
+    try:
+        values = read_npy(path)
+    except (OSError, ValueError, SyntaxError):
+        values = None
+    if values is not None and len(values) == size:
+        return values
+    values = generate(distribution, size, seed)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        write_npy(path, values)
+    except OSError:
+        pass
+    return values
+
+
+def write_npy(path, values):
+    # Minimal NumPy .npy (format 1.0) writer for a 1-D int32 array, so the
+    # cache works without numpy and numpy.load() can still read it.
+    shape = f"({len(values)},)"
+    header = f"{{'descr': '<i4', 'fortran_order': False, 'shape': {shape}, }}"
+    padding = 64 - (len(NPY_MAGIC) + 4 + len(header) + 1) % 64
+    header = header + " " * padding + "\n"
+    data = array("i", values)
+    if sys.byteorder == "big":
+        data.byteswap()
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(NPY_MAGIC + b"\x01\x00")
+        f.write(len(header).to_bytes(2, "little"))
+        f.write(header.encode("latin1"))
+        f.write(data.tobytes())
+    os.replace(temporary, path)
+
+
+def read_npy(path):
+    with open(path, "rb") as f:
+        if f.read(len(NPY_MAGIC)) != NPY_MAGIC:
+            raise ValueError(f"{path} is not a .npy file")
+        major, _ = f.read(2)
+        length_bytes = 2 if major == 1 else 4
+        header_length = int.from_bytes(f.read(length_bytes), "little")
+        header = ast.literal_eval(f.read(header_length).decode("latin1"))
+        if (
+            header.get("descr") != "<i4"
+            or header.get("fortran_order")
+            or len(header.get("shape", ())) != 1
+        ):
+            raise ValueError(f"{path} does not hold a 1-D int32 array")
+        values = array("i")
+        values.frombytes(f.read())
+    if sys.byteorder == "big":
+        values.byteswap()
+    if len(values) != header["shape"][0]:
+        raise ValueError(f"{path} is truncated")
+    return values
@@ -0,0 +1,39 @@
+from array import array
+
+
+class BoardModel:
+    """Flat, array-backed board the algorithms sort.
+
+    ``values`` holds the sort keys in their current positions and ``order``
+    holds, for each position, the id (original index) of the element there.
+    Both are moved in lockstep, so anything drawing the board can map
+    positions back to its own per-element objects through ``order``.
+    """
+
+    def __init__(self, values):
+        self.values = array("i", values)
+        self.order = array("i", range(len(self.values)))
+        self.initial = array("i", self.values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def swap(self, i, j):
+        values, order = self.values, self.order
+        values[i], values[j] = values[j], values[i]
+        order[i], order[j] = order[j], order[i]
+
+    def write(self, i, element):
+        self.values[i] = self.initial[element]
+        self.order[i] = element
+
+    def copy(self):
+        model = BoardModel.__new__(BoardModel)
+        model.values = array("i", self.values)
+        model.order = array("i", self.order)
+        model.initial = self.initial
+        return model
+
+    def is_sorted(self):
+        values = self.values
+        return all(values[k] <= values[k + 1] for k in range(len(values) - 1))
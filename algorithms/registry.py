@@ -0,0 +1,220 @@
+from importlib import import_module
+from importlib.metadata import entry_points
+
+# Installed packages add sorts by exposing an AlgorithmSpec under this entry
+# point group, e.g. in pyproject.toml:
+#
+#   [project.entry-points."sorting_visualizer.algorithms"]
+#   gnome = "gnome_sort.spec:GNOME"
+#
+# Every plugin's entry point is loaded on the first lookup, so the module it
+# names should hold only the spec; the spec's target is imported on first use.
+ENTRY_POINT_GROUP = "sorting_visualizer.algorithms"
+
+
+class AlgorithmSpec:
+    """Metadata for one sort, with its implementation imported on first use.
+
+    ``target`` is a ``"module:attribute"`` path to the SortingAlgorithm
+    subclass. ``key`` is the command-line name and ``name`` the button label.
+    """
+
+    __slots__ = (
+        "key",
+        "name",
+        "target",
+        "stable",
+        "complexity",
+        "aux_memory",
+        "_class",
+    )
+
+    def __init__(self, key, name, target, stable, complexity, aux_memory):
+        self.key = key
+        self.name = name
+        self.target = target
+        self.stable = stable
+        self.complexity = complexity
+        self.aux_memory = aux_memory
+        self._class = None
+
+    def __repr__(self):
+        return f"AlgorithmSpec({self.key!r}, {self.target!r})"
+
+    @property
+    def loaded(self):
+        return self._class is not None
+
+    def load(self):
+        if self._class is None:
+            module, _, attribute = self.target.partition(":")
+            self._class = getattr(import_module(module), attribute)
+        return self._class
+
+
+BUILTIN = [
+    AlgorithmSpec(
+        "insertion",
+        "Insertion Sort",
+        "algorithms.algorithms:InsertionSort",
+        True,
+        "O(n^2)",
+        "O(1)",
+    ),
+    AlgorithmSpec(
+        "selection",
+        "Selection Sort",
+        "algorithms.algorithms:SelectionSort",
+        False,
+        "O(n^2)",
+        "O(1)",
+    ),
+    AlgorithmSpec(
+        "bubble",
+        "Bubble Sort",
+        "algorithms.algorithms:BubbleSort",
+        True,
+        "O(n^2)",
+        "O(1)",
+    ),
+    AlgorithmSpec(
+        "merge",
+        "Merge Sort",
+        "algorithms.algorithms:MergeSort",
+        True,
+        "O(n log n)",
+        "O(n)",
+    ),
+    AlgorithmSpec(
+        "quick",
+        "Quick Sort",
+        "algorithms.algorithms:QuickSort",
+        False,
+        "O(n log n) average, O(n^2) worst",
+        "O(log n)",
+    ),
+    AlgorithmSpec(
+        "heap",
+        "Heap Sort",
+        "algorithms.algorithms:HeapSort",
+        False,
+        "O(n log n)",
+        "O(1)",
+    ),
+    AlgorithmSpec(
+        "shell",
+        "Shell Sort",
+        "algorithms.algorithms:ShellSort",
+        False,
+        "O(n^(3/2))",
+        "O(1)",
+    ),
+    AlgorithmSpec(
+        "counting",
+        "Counting Sort",
+        "algorithms.algorithms:CountingSort",
+        True,
+        "O(n + k)",
+        "O(n + k)",
+    ),
+    AlgorithmSpec(
+        "lsd-radix",
+        "LSD Radix Sort",
+        "algorithms.algorithms:LSDRadixSort",
+        True,
+        "O(d(n + r))",
+        "O(n + r)",
+    ),
+    AlgorithmSpec(
+        "msd-radix",
+        "MSD Radix Sort",
+        "algorithms.algorithms:MSDRadixSort",
+        True,
+        "O(d(n + r))",
+        "O(n + dr)",
+    ),
+    AlgorithmSpec(
+        "bucket",
+        "Bucket Sort",
+        "algorithms.algorithms:BucketSort",
+        True,
+        "O(n) average, O(n^2) worst",
+        "O(n)",
+    ),
+]
+
+
+def group_entry_points(group):
+    found = entry_points()
+    if hasattr(found, "select"):
+        return found.select(group=group)
+    # Python 3.9 and older return a dict of groups.
+    return found.get(group, ())
+
+
+class AlgorithmRegistry:
+    """The built-in sorts plus any found through entry points.
+
+    Discovery runs once, on first lookup. Plugins whose entry point fails to
+    load, or that reuse a key or name already taken, are skipped and listed
+    in ``errors``.
+    """
+
+    def __init__(self, builtin=BUILTIN, group=ENTRY_POINT_GROUP):
+        self.builtin = list(builtin)
+        self.group = group
+        self._specs = None
+        self.errors = []
+
+    def specs(self):
+        if self._specs is None:
+            self._specs = {}
+            self.errors = []
+            for spec in self.builtin:
+                self._specs[spec.key] = spec
+            self.discover()
+        return list(self._specs.values())
+
+    def discover(self):
+        names = {spec.name for spec in self._specs.values()}
+        for entry_point in group_entry_points(self.group):
+            try:
+                spec = entry_point.load()
+                if not isinstance(spec, AlgorithmSpec):
+                    raise TypeError(f"{spec!r} is not an AlgorithmSpec")
+            except Exception as error:
+                self.errors.append((entry_point.name, error))
+                continue
+            if spec.key in self._specs or spec.name in names:
+                error = ValueError(f"{spec.key!r} is already registered")
+                self.errors.append((entry_point.name, error))
+                continue
+            self._specs[spec.key] = spec
+            names.add(spec.name)
+
+    def refresh(self):
+        self._specs = None
+
+    def keys(self):
+        return [spec.key for spec in self.specs()]
+
+    def names(self):
+        return [spec.name for spec in self.specs()]
+
+    def get(self, key):
+        self.specs()
+        if key not in self._specs:
+            raise KeyError(f"Unknown algorithm: {key}")
+        return self._specs[key]
+
+    def named(self, name):
+        for spec in self.specs():
+            if spec.name == name:
+                return spec
+        raise KeyError(f"Unknown algorithm: {name}")
+
+    def load(self, key):
+        return self.get(key).load()
+
+
+registry = AlgorithmRegistry()
@@ -0,0 +1,137 @@
+from enum import IntEnum
+from typing import Iterator, NamedTuple, Optional
+
+from algorithms.counting import CountingArray, OpCounts
+from algorithms.model import BoardModel
+
+
+class Op(IntEnum):
+    COMPARE = 0
+    SWAP = 1
+    WRITE = 2
+    PASS = 3
+    AUX_WRITE = 4
+
+
+class Step(NamedTuple):
+    op: Op
+    i: int
+    j: int = -1
+    value: object = None
+
+
+# The ops each granularity stops after. A pass always ends a step, so sorts
+# without comparisons or swaps still advance pass by pass.
+GRANULARITIES = {
+    "comparison": (Op.COMPARE, Op.PASS),
+    "swap": (Op.SWAP, Op.WRITE, Op.AUX_WRITE, Op.PASS),
+    "pass": (Op.PASS,),
+}
+
+
+class SortingAlgorithm:
+    """Base class for the step engine.
+
+    Subclasses implement ``steps()`` as a generator that mutates ``self.model``
+    in place and yields a ``Step`` describing each operation it just performed.
+    Every outer pass ends with an ``Op.PASS`` step. ``Op.WRITE`` steps carry
+    the id of the element written in ``value``; ``Op.AUX_WRITE`` steps do the
+    same for writes into an auxiliary buffer. Algorithms that use auxiliary
+    memory expose it for display in ``aux_lanes``.
+
+    ``blocks`` may be a ``BoardModel`` or a list of objects with a ``height``
+    (such as ``BlockSprite``). In the latter case the heights are copied into a
+    model and the list is only used as a view, reordered on demand.
+
+    With ``count_ops`` the algorithm tallies comparisons, swaps and element
+    reads and writes into ``counts``. Algorithms read and write keys through
+    ``self.values``, which is the model's raw array when counting is off.
+
+    ``extra_loop`` asks the GUI for one more Next press after ``done`` before
+    showing the result. ``settings`` names the constructor keywords that pick
+    a strategy (such as QuickSort's ``pivot``), which the command line can set.
+    """
+
+    extra_loop = False
+    settings = ()
+
+    @classmethod
+    def select_options(cls, options):
+        """The entries of ``options`` this class accepts as keywords."""
+        return {
+            name: value
+            for name, value in (options or {}).items()
+            if name in cls.settings and value is not None
+        }
+
+    def __init__(self, blocks, count_ops=False):
+        self.counter = 0
+        if isinstance(blocks, BoardModel):
+            self.model = blocks
+            self.items = None
+        else:
+            self.model = BoardModel(block.height for block in blocks)
+            self.items = list(blocks)
+        self.block_len = len(self.model)
+        self.position = 0
+        self.finished = False
+        self.aux_lanes = {}
+        self.counts = OpCounts() if count_ops else None
+        self.values = self.tracked(self.model.values)
+        if count_ops:
+            self.step = self.counted_step
+        self._steps = self.steps()
+
+    def tracked(self, values):
+        if self.counts is None:
+            return values
+        return CountingArray(values, self.counts)
+
+    @property
+    def blocks(self) -> list:
+        if self.items is None:
+            return list(self.model.values)
+        items = self.items
+        return [items[element] for element in self.model.order]
+
+    def steps(self) -> Iterator[Step]:
+        raise NotImplementedError
+
+    def step(self) -> Optional[Step]:
+        step = next(self._steps, None)
+        if step is None:
+            self.finished = True
+            return None
+        self.position += 1
+        if step.op is Op.PASS:
+            self.counter += 1
+        return step
+
+    def counted_step(self) -> Optional[Step]:
+        step = SortingAlgorithm.step(self)
+        if step is not None:
+            if step.op is Op.COMPARE:
+                self.counts.comparisons += 1
+            elif step.op is Op.SWAP:
+                self.counts.swaps += 1
+        return step
+
+    @property
+    def done(self) -> bool:
+        return self.finished or self.counter >= self.block_len
+
+    def advance(self, granularity="pass") -> Optional[Step]:
+        """Step until the next op that ends a step at ``granularity``.
+
+        Returns that step, or None once the run has finished.
+        """
+        stops = GRANULARITIES[granularity]
+        step = self.step()
+        while step is not None and step.op not in stops:
+            step = self.step()
+        return step
+
+    def sort(self) -> list:
+        if not self.done:
+            self.advance()
+        return self.blocks
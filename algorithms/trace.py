@@ -0,0 +1,105 @@
+from array import array
+from bisect import bisect_right
+
+from algorithms.model import BoardModel
+from algorithms.steps import Op
+
+
+class Trace:
+    """Operation log of one run with periodic keyframes for fast seeking.
+
+    The run is recorded lazily from its own algorithm instance, so recording
+    never disturbs a sorter that is driving the screen. Every
+    ``keyframe_interval`` steps the element order is snapshotted; ``seek()``
+    restores the nearest keyframe at or before the target and replays at most
+    ``keyframe_interval`` operations onto ``cursor``.
+    """
+
+    def __init__(self, algorithm_class, values, keyframe_interval=None, options=None):
+        self.algorithm = algorithm_class(BoardModel(values), **(options or {}))
+        self.initial = self.algorithm.model.initial
+        self.keyframe_interval = keyframe_interval or max(1024, len(self.initial))
+        self.ops = array("b")
+        self.first = array("i")
+        self.second = array("i")
+        self.pass_ends = array("i")
+        self.keyframes = [array("i", self.algorithm.model.order)]
+        self.cursor = BoardModel(values)
+        self.position = 0
+        self.finished = False
+
+    def __len__(self):
+        return len(self.ops)
+
+    def __getstate__(self):
+        # The running generator cannot be pickled, so a trace sent to another
+        # process keeps what was recorded but cannot record further.
+        state = self.__dict__.copy()
+        state["algorithm"] = None
+        return state
+
+    def record(self, limit=None):
+        if self.algorithm is None:
+            return 0
+        step = self.algorithm.step
+        ops, first, second = self.ops, self.first, self.second
+        interval = self.keyframe_interval
+        order = self.algorithm.model.order
+        recorded = 0
+        while limit is None or recorded < limit:
+            result = step()
+            if result is None:
+                self.finished = True
+                break
+            ops.append(result.op)
+            first.append(result.i)
+            second.append(result.j if result.value is None else result.value)
+            if result.op is Op.PASS:
+                self.pass_ends.append(len(ops))
+            if not len(ops) % interval:
+                self.keyframes.append(array("i", order))
+            recorded += 1
+        return recorded
+
+    def comparisons_between(self, start, stop):
+        return self.ops[start:stop].count(Op.COMPARE)
+
+    def passes_at(self, position):
+        return bisect_right(self.pass_ends, position)
+
+    def seek(self, position):
+        if position > len(self.ops) and not self.finished:
+            self.record(position - len(self.ops))
+        position = max(0, min(position, len(self.ops)))
+        interval = self.keyframe_interval
+        keyframe = position // interval
+        if not keyframe * interval <= self.position <= position:
+            self.restore_keyframe(keyframe)
+        self.replay(self.position, position)
+        return self.cursor
+
+    def restore_keyframe(self, keyframe):
+        order = self.keyframes[keyframe]
+        initial = self.initial
+        self.cursor.order = array("i", order)
+        self.cursor.values = array("i", (initial[element] for element in order))
+        self.position = keyframe * self.keyframe_interval
+
+    def replay(self, start, stop):
+        cursor = self.cursor
+        ops, first, second = self.ops, self.first, self.second
+        for k in range(start, stop):
+            op = ops[k]
+            if op == Op.SWAP:
+                cursor.swap(first[k], second[k])
+            elif op == Op.WRITE:
+                cursor.write(first[k], second[k])
+        self.position = stop
+
+
+def record_trace(
+    algorithm_class, values, limit=None, keyframe_interval=None, options=None
+):
+    trace = Trace(algorithm_class, values, keyframe_interval, options)
+    trace.record(limit)
+    return trace
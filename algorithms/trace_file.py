@@ -0,0 +1,261 @@
+import mmap
+import struct
+import zlib
+from array import array
+
+from algorithms.model import BoardModel
+from algorithms.steps import Op
+
+MAGIC = b"SVTR"
+END_MAGIC = b"SVTE"
+VERSION = 1
+
+# op, i, j (j is the element id for writes)
+RECORD = struct.Struct("<Bii")
+HEADER = struct.Struct("<4sHH")
+BOARD = struct.Struct("<III")
+# records offset/length, keyframe offset/length, records, passes
+INDEX_ENTRY = struct.Struct("<QIQIII")
+FOOTER = struct.Struct("<QIQ4s")
+
+
+class TraceWriter:
+    """Streams a run to disk as zlib-compressed chunks of fixed-width records.
+
+    Layout: header (magic, version, algorithm name, board size, chunk size,
+    keyframe stride, initial board), the chunks, a chunk index and a fixed
+    size footer pointing at the index. Every ``keyframe_stride`` chunks the
+    element order at the start of the chunk is stored too, so a reader can
+    restore any step without replaying from the beginning.
+    """
+
+    def __init__(
+        self, path, algorithm_name, values, chunk_records=65536, keyframe_stride=None
+    ):
+        self.model = BoardModel(values)
+        n = len(self.model)
+        self.chunk_records = chunk_records
+        if keyframe_stride is None:
+            # Roughly one keyframe's worth of bytes per stride of records.
+            keyframe_stride = max(1, -(-4 * n // (RECORD.size * chunk_records)))
+        self.keyframe_stride = keyframe_stride
+        self.file = open(path, "wb")
+        name = algorithm_name.encode()
+        self.file.write(HEADER.pack(MAGIC, VERSION, len(name)))
+        self.file.write(name)
+        self.file.write(BOARD.pack(n, chunk_records, keyframe_stride))
+        self.file.write(self.model.initial.tobytes())
+        self.index = []
+        self.records = 0
+        self.buffer = bytearray()
+        self.buffered = 0
+        self.passes = 0
+        self.keyframe = array("i", self.model.order)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, op, i, j):
+        if not self.buffered and len(self.index) % self.keyframe_stride == 0:
+            self.keyframe = array("i", self.model.order)
+        self.buffer += RECORD.pack(op, i, j)
+        self.buffered += 1
+        if op == Op.SWAP:
+            self.model.swap(i, j)
+        elif op == Op.WRITE:
+            self.model.write(i, j)
+        elif op == Op.PASS:
+            self.passes += 1
+        if self.buffered >= self.chunk_records:
+            self.flush_chunk()
+
+    def flush_chunk(self):
+        if not self.buffered:
+            return
+        keyframe_offset = keyframe_length = 0
+        if len(self.index) % self.keyframe_stride == 0:
+            data = zlib.compress(self.keyframe.tobytes())
+            keyframe_offset = self.file.tell()
+            keyframe_length = len(data)
+            self.file.write(data)
+        data = zlib.compress(bytes(self.buffer))
+        offset = self.file.tell()
+        self.file.write(data)
+        self.index.append(
+            (offset, len(data), keyframe_offset, keyframe_length, self.buffered, self.passes)
+        )
+        self.records += self.buffered
+        self.buffer = bytearray()
+        self.buffered = 0
+        self.passes = 0
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.flush_chunk()
+        index_offset = self.file.tell()
+        for entry in self.index:
+            self.file.write(INDEX_ENTRY.pack(*entry))
+        self.file.write(FOOTER.pack(index_offset, len(self.index), self.records, END_MAGIC))
+        self.file.close()
+
+
+def write_trace(path, algorithm_name, trace, chunk_records=65536):
+    with TraceWriter(path, algorithm_name, trace.initial, chunk_records) as writer:
+        for op, i, j in zip(trace.ops, trace.first, trace.second):
+            writer.append(op, i, j)
+
+
+def record_to_file(
+    path, algorithm_class, values, limit=None, chunk_records=65536, options=None
+):
+    """Run an algorithm straight to disk without keeping its trace in memory."""
+    sorter = algorithm_class(BoardModel(values), **(options or {}))
+    with TraceWriter(path, algorithm_class.__name__, values, chunk_records) as writer:
+        step = sorter.step
+        append = writer.append
+        count = 0
+        while limit is None or count < limit:
+            result = step()
+            if result is None:
+                break
+            append(result.op, result.i, result.j if result.value is None else result.value)
+            count += 1
+    return count
+
+
+class TraceFile:
+    """Read-only, memory-mapped view of a file written by ``TraceWriter``.
+
+    Only the header and chunk index are parsed up front; chunks and keyframes
+    are decompressed on demand, so traces much larger than memory can be
+    played back and seeked. It offers the same ``seek()``, ``cursor`` and
+    ``passes_at()`` interface as ``Trace``.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, name_length = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a sort trace")
+        if version != VERSION:
+            raise ValueError(f"Unsupported trace version: {version}")
+        offset = HEADER.size
+        self.algorithm_name = self.data[offset : offset + name_length].decode()
+        offset += name_length
+        n, self.chunk_records, self.keyframe_stride = BOARD.unpack_from(self.data, offset)
+        offset += BOARD.size
+        self.initial = array("i")
+        self.initial.frombytes(self.data[offset : offset + 4 * n])
+
+        index_offset, chunks, self.records, end = FOOTER.unpack_from(
+            self.data, len(self.data) - FOOTER.size
+        )
+        if end != END_MAGIC:
+            raise ValueError(f"{path} is truncated")
+        self.index = [
+            INDEX_ENTRY.unpack_from(self.data, index_offset + k * INDEX_ENTRY.size)
+            for k in range(chunks)
+        ]
+        self.pass_totals = []
+        total = 0
+        for entry in self.index:
+            self.pass_totals.append(total)
+            total += entry[5]
+        self.finished = True
+        self.cursor = BoardModel(self.initial)
+        self.position = 0
+        self._chunk_number = None
+        self._chunk = None
+
+    def __len__(self):
+        return self.records
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    @property
+    def chunk_count(self):
+        return len(self.index)
+
+    def record(self, limit=None):
+        return 0
+
+    def chunk(self, number):
+        if number != self._chunk_number:
+            offset, length = self.index[number][:2]
+            self._chunk = zlib.decompress(self.data[offset : offset + length])
+            self._chunk_number = number
+        return self._chunk
+
+    def chunk_records_of(self, number):
+        return RECORD.iter_unpack(self.chunk(number))
+
+    def __iter__(self):
+        for number in range(self.chunk_count):
+            yield from self.chunk_records_of(number)
+
+    def records_between(self, start, stop):
+        stop = min(stop, self.records)
+        while start < stop:
+            number = start // self.chunk_records
+            chunk = self.chunk(number)
+            first = start - number * self.chunk_records
+            last = min(stop - number * self.chunk_records, self.index[number][4])
+            yield from RECORD.iter_unpack(
+                chunk[first * RECORD.size : last * RECORD.size]
+            )
+            start += last - first
+
+    def comparisons_between(self, start, stop):
+        return sum(1 for op, _, _ in self.records_between(start, stop) if op == Op.COMPARE)
+
+    def passes_at(self, position):
+        position = min(position, self.records)
+        number = min(position // self.chunk_records, max(self.chunk_count - 1, 0))
+        if not self.index:
+            return 0
+        start = number * self.chunk_records
+        passes = self.pass_totals[number]
+        for op, _, _ in self.records_between(start, position):
+            passes += op == Op.PASS
+        return passes
+
+    def keyframe(self, number):
+        keyframe = number - number % self.keyframe_stride
+        _, _, offset, length = self.index[keyframe][:4]
+        order = array("i")
+        order.frombytes(zlib.decompress(self.data[offset : offset + length]))
+        return keyframe * self.chunk_records, order
+
+    def seek(self, position):
+        position = max(0, min(position, self.records))
+        number = min(position // self.chunk_records, self.chunk_count - 1)
+        if number < 0:
+            return self.cursor
+        restore_from = number - number % self.keyframe_stride
+        if not restore_from * self.chunk_records <= self.position <= position:
+            start, order = self.keyframe(number)
+            initial = self.initial
+            self.cursor.order = order
+            self.cursor.values = array("i", (initial[element] for element in order))
+            self.position = start
+        cursor = self.cursor
+        for op, i, j in self.records_between(self.position, position):
+            if op == Op.SWAP:
+                cursor.swap(i, j)
+            elif op == Op.WRITE:
+                cursor.write(i, j)
+        self.position = position
+        return cursor
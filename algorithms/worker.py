@@ -0,0 +1,225 @@
+import multiprocessing
+import queue
+import threading
+from array import array
+from time import perf_counter
+from typing import Optional
+
+from algorithms.model import BoardModel
+from algorithms.steps import GRANULARITIES, Op, Step
+
+DONE = None
+
+
+def produce(algorithm_class, values, batches, stop, batch_size, options=None):
+    # Runs in the worker. Each batch is a flat array of (op, i, j) triples,
+    # where j holds the element id for writes.
+    sorter = algorithm_class(BoardModel(values), **(options or {}))
+    step = sorter.step
+    batch = array("i")
+    while not stop.is_set():
+        result = step()
+        if result is None:
+            break
+        batch.extend(
+            (result.op, result.i, result.j if result.value is None else result.value)
+        )
+        if len(batch) >= 3 * batch_size:
+            if not put(batches, batch, stop):
+                return
+            batch = array("i")
+    if len(batch):
+        put(batches, batch, stop)
+    put(batches, DONE, stop)
+
+
+def put(batches, item, stop):
+    # A full queue blocks the producer, which is what keeps memory flat; the
+    # timeout only lets it notice a stop request.
+    while not stop.is_set():
+        try:
+            batches.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+class SortWorker:
+    """Runs an algorithm in a background thread or process.
+
+    The worker pushes batches of operations into a bounded queue and the
+    caller replays them onto ``model`` with ``drain()``, so the algorithm
+    never runs on the render thread. It mirrors the parts of
+    ``SortingAlgorithm`` that Screen uses, so it can stand in for one.
+    """
+
+    def __init__(
+        self,
+        algorithm_class,
+        blocks,
+        mode="thread",
+        batch_size=1024,
+        max_batches=8,
+        options=None,
+    ):
+        self.algorithm_class = algorithm_class
+        if isinstance(blocks, BoardModel):
+            self.model = blocks
+            self.items = None
+        else:
+            self.model = BoardModel(block.height for block in blocks)
+            self.items = list(blocks)
+        self.block_len = len(self.model)
+        self.counter = 0
+        self.position = 0
+        self.finished = False
+        self.aux_lanes = {}
+        # Operation counting stays off in the worker.
+        self.counts = None
+        self.pending = array("i")
+        self.pending_index = 0
+
+        values = list(self.model.values)
+        if mode == "thread":
+            self.batches = queue.Queue(max_batches)
+            self.stop_event = threading.Event()
+            self.runner = threading.Thread(
+                target=produce,
+                args=(
+                    algorithm_class,
+                    values,
+                    self.batches,
+                    self.stop_event,
+                    batch_size,
+                    options,
+                ),
+                daemon=True,
+            )
+        elif mode == "process":
+            context = multiprocessing.get_context("spawn")
+            self.batches = context.Queue(max_batches)
+            self.stop_event = context.Event()
+            self.runner = context.Process(
+                target=produce,
+                args=(
+                    algorithm_class,
+                    values,
+                    self.batches,
+                    self.stop_event,
+                    batch_size,
+                    options,
+                ),
+                daemon=True,
+            )
+        else:
+            raise ValueError(f"Unknown worker mode: {mode}")
+        self.runner.start()
+
+    def algorithm_info(self):
+        return self.algorithm_class.algorithm_info()
+
+    @property
+    def blocks(self) -> list:
+        if self.items is None:
+            return list(self.model.values)
+        items = self.items
+        return [items[element] for element in self.model.order]
+
+    @property
+    def done(self) -> bool:
+        # Evaluated with the algorithm's own rule, since some runs end after
+        # their last pass and others only when the generator is exhausted.
+        return self.algorithm_class.done.fget(self)
+
+    def next_batch(self, block):
+        try:
+            batch = self.batches.get(block=block, timeout=1 if block else None)
+        except queue.Empty:
+            if block and not self.runner.is_alive():
+                # The producer died without sending DONE.
+                self.finished = True
+            return False
+        if batch is DONE:
+            self.finished = True
+            return False
+        self.pending = batch
+        self.pending_index = 0
+        return True
+
+    def drain(self, max_steps, deadline=None, block=False, until_pass=False):
+        """Apply up to ``max_steps`` queued operations to ``model``.
+
+        Returns ``(steps applied, finished)``. Stops early at ``deadline`` (a
+        ``perf_counter`` time) or, with ``until_pass``, after a pass boundary.
+        """
+        model = self.model
+        done = 0
+        while done < max_steps and not self.finished:
+            if self.pending_index >= len(self.pending):
+                if not self.next_batch(block):
+                    break
+            batch, k = self.pending, self.pending_index
+            stop = min(len(batch), k + 3 * (max_steps - done))
+            passed = False
+            while k < stop:
+                op, i, j = batch[k], batch[k + 1], batch[k + 2]
+                k += 3
+                if op == Op.SWAP:
+                    model.swap(i, j)
+                elif op == Op.WRITE:
+                    model.write(i, j)
+                elif op == Op.PASS:
+                    self.counter += 1
+                    if until_pass:
+                        passed = True
+                        break
+            done += (k - self.pending_index) // 3
+            self.pending_index = k
+            if passed or (deadline is not None and perf_counter() > deadline):
+                break
+        self.position += done
+        return done, self.finished
+
+    def step(self) -> Optional[Step]:
+        if self.pending_index >= len(self.pending) and not self.next_batch(True):
+            return None
+        step = self.pending_step(self.pending_index)
+        self.drain(1, block=True)
+        return step
+
+    def pending_step(self, k):
+        op = Op(self.pending[k])
+        i, j = self.pending[k + 1], self.pending[k + 2]
+        if op in (Op.WRITE, Op.AUX_WRITE):
+            return Step(op, i, value=j)
+        return Step(op, i, j)
+
+    def advance(self, granularity="pass") -> Optional[Step]:
+        if granularity == "pass":
+            # A whole pass is applied in one drain; stepping it op by op costs
+            # a call per operation and stalls the caller on large boards.
+            done, _ = self.drain(float("inf"), block=True, until_pass=True)
+            return self.pending_step(self.pending_index - 3) if done else None
+        stops = GRANULARITIES[granularity]
+        step = self.step()
+        while step is not None and step.op not in stops:
+            step = self.step()
+        return step
+
+    def sort(self) -> list:
+        if not self.done:
+            self.drain(float("inf"), block=True, until_pass=True)
+        return self.blocks
+
+    def stop(self):
+        self.stop_event.set()
+        try:
+            while True:
+                self.batches.get_nowait()
+        except (queue.Empty, OSError, ValueError):
+            pass
+        self.runner.join(timeout=1)
+        if isinstance(self.runner, multiprocessing.process.BaseProcess):
+            if self.runner.is_alive():
+                self.runner.terminate()
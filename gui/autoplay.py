@@ -0,0 +1,64 @@
+from time import perf_counter
+
+
+class AutoPlayer:
+    """Runs algorithm steps every frame at a configurable rate.
+
+    ``steps_per_frame`` may be fractional: the remainder carries over, so 0.25
+    runs one step every fourth frame. Each frame also stops once
+    ``budget_ms`` has been spent, so slow steps spread over several frames
+    instead of stalling the frame clock.
+    """
+
+    min_steps_per_frame = 1 / 64
+    max_steps_per_frame = 8192
+
+    def __init__(self, steps_per_frame=1.0, budget_ms=8.0):
+        self.steps_per_frame = steps_per_frame
+        self.budget = budget_ms / 1000
+        self.playing = False
+        self.carry = 0.0
+
+    def toggle(self):
+        self.playing = not self.playing
+        self.carry = 0.0
+
+    def stop(self):
+        self.playing = False
+        self.carry = 0.0
+
+    def faster(self):
+        self.steps_per_frame = min(self.steps_per_frame * 2, self.max_steps_per_frame)
+
+    def slower(self):
+        self.steps_per_frame = max(self.steps_per_frame / 2, self.min_steps_per_frame)
+
+    def due_steps(self):
+        self.carry += self.steps_per_frame
+        due = int(self.carry)
+        self.carry -= due
+        return due
+
+    def run(self, step):
+        due = self.due_steps()
+        deadline = perf_counter() + self.budget
+        done = 0
+        while done < due:
+            if step() is None:
+                self.stop()
+                break
+            done += 1
+            # Checking the clock every step would cost more than cheap steps.
+            if not done & 31 and perf_counter() > deadline:
+                break
+        return done
+
+    def run_batched(self, drain):
+        # For sources that apply many steps per call, such as SortWorker.drain.
+        due = self.due_steps()
+        if not due:
+            return 0
+        done, finished = drain(due, perf_counter() + self.budget)
+        if finished:
+            self.stop()
+        return done
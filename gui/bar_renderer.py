@@ -0,0 +1,60 @@
+import pygame
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - numpy is optional
+    numpy = None
+
+
+class BarRenderer:
+    """Draws a whole board into one surface with a single vectorized pass.
+
+    Used instead of one ``BlockSprite`` per element once boards get large.
+    Bars hang down from the top of ``rect`` like the block sprites do. When
+    there are more values than pixel columns, each column shows the tallest
+    value it covers.
+    """
+
+    def __init__(self, rect, colors, background, max_value):
+        if numpy is None:
+            raise RuntimeError("BarRenderer requires numpy")
+        self.rect = pygame.Rect(rect)
+        self.surface = pygame.Surface(self.rect.size).convert()
+        self.colors = numpy.array(
+            [self.surface.map_rgb(color) for color in colors], dtype=numpy.uint32
+        )
+        self.background = self.surface.map_rgb(background)
+        self.scale = self.rect.height / max(max_value, 1)
+        self.rows = numpy.arange(self.rect.height, dtype=numpy.int32)
+        self._columns = None
+
+    @staticmethod
+    def available():
+        return numpy is not None
+
+    def column_starts(self, length):
+        if self._columns is None or self._columns[0] != length:
+            width = self.rect.width
+            starts = numpy.arange(width, dtype=numpy.int64) * length // width
+            self._columns = (length, starts)
+        return self._columns[1]
+
+    def render(self, model):
+        length = len(model)
+        if not length:
+            self.surface.fill(self.background)
+            return self.surface
+        values = numpy.frombuffer(model.values, dtype=numpy.int32)
+        order = numpy.frombuffer(model.order, dtype=numpy.int32)
+        starts = self.column_starts(length)
+        if length > self.rect.width:
+            column_values = numpy.maximum.reduceat(values, starts)
+        else:
+            column_values = values[starts]
+        heights = (column_values * self.scale).astype(numpy.int32)
+        column_colors = self.colors[order[starts] % len(self.colors)]
+        mask = self.rows[None, :] < heights[:, None]
+        pixels = pygame.surfarray.pixels2d(self.surface)
+        pixels[...] = numpy.where(mask, column_colors[:, None], self.background)
+        del pixels
+        return self.surface
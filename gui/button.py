@@ -1,5 +1,7 @@
 import pygame
 
+from gui.fonts import get_font, render_text
+
 
 class Button:
     def __init__(self, pos, width, height, text, window):
@@ -9,7 +11,7 @@ class Button:
         self.text = text
         self.window = window
 
-        self.font = pygame.font.SysFont("segoeui", 16)
+        self.font_size = 16
         self.button_color = (87, 155, 177)
         self.hover_color = (225, 215, 198)
         self.click_color = (236, 232, 221)
@@ -21,30 +23,39 @@ class Button:
         self.bottom_rect = pygame.Rect(self.pos, (width, height))
         self.bottom_color = self.hover_color
 
-        self.text_surf = self.font.render(self.text, True, self.text_color)
-        self.text_rect = self.text_surf.get_rect(center=self.top_rect.center)
+        # The label is rendered on first draw, so building buttons does not
+        # load fonts.
+        self._text_surf = None
+        self._text_rect = None
 
         self.clicked = False
 
+    @property
+    def font(self):
+        return get_font(self.font_size)
+
+    @property
+    def text_surf(self):
+        if self._text_surf is None:
+            self._text_surf = render_text(self.text, self.font_size, self.text_color)
+        return self._text_surf
+
+    @property
+    def text_rect(self):
+        if self._text_rect is None:
+            self._text_rect = self.text_surf.get_rect(center=self.top_rect.center)
+        return self._text_rect
+
     def draw_button(self):
         pygame.draw.rect(
             self.window, self.bottom_color, self.bottom_rect, border_radius=12
         )
         pygame.draw.rect(self.window, self.top_color, self.top_rect, border_radius=12)
         self.window.blit(self.text_surf, self.text_rect)
-        self.check_button_clicked()
-
-    def check_button_clicked(self):
-        mouse_pos = pygame.mouse.get_pos()
-        if self.top_rect.collidepoint(mouse_pos):
-            self.top_color = self.hover_color
-            if pygame.mouse.get_pressed()[0]:
-                self.clicked = True
-                return True
-            else:
-                if self.clicked:
-                    self.clicked = False
-                    return True
-        else:
-            self.top_color = self.button_color
-        return False
+
+    def reset(self):
+        self.clicked = False
+        self.set_hovered(False)
+
+    def set_hovered(self, hovered):
+        self.top_color = self.hover_color if hovered else self.button_color
@@ -0,0 +1,86 @@
+from collections import defaultdict
+
+
+class EventDispatcher:
+    """Routes mouse positions to widgets through a uniform grid.
+
+    Each widget's ``top_rect`` is bucketed into every ``cell_size`` square it
+    overlaps, so a hit test only looks at the few widgets sharing the cell
+    under the cursor rather than at every widget on screen. Widgets need a
+    ``top_rect`` and a ``set_hovered(hovered)`` method.
+    """
+
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        self.widget_cells = {}
+        self.hovered = None
+        self.pressed = None
+
+    def cells_for(self, rect):
+        size = self.cell_size
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield cx, cy
+
+    def add(self, widget):
+        if widget in self.widget_cells:
+            return
+        cells = list(self.cells_for(widget.top_rect))
+        for cell in cells:
+            self.cells[cell].append(widget)
+        self.widget_cells[widget] = cells
+
+    def remove(self, widget):
+        for cell in self.widget_cells.pop(widget, ()):
+            self.cells[cell].remove(widget)
+            if not self.cells[cell]:
+                del self.cells[cell]
+        if self.hovered is widget:
+            widget.set_hovered(False)
+            self.hovered = None
+        if self.pressed is widget:
+            self.pressed = None
+
+    def clear(self):
+        for widget in list(self.widget_cells):
+            self.remove(widget)
+
+    def widget_at(self, pos):
+        x, y = pos
+        cell = (x // self.cell_size, y // self.cell_size)
+        # Later widgets are drawn on top, so they win overlapping hits.
+        for widget in reversed(self.cells.get(cell, ())):
+            if widget.top_rect.collidepoint(pos):
+                return widget
+        return None
+
+    def hover(self, pos):
+        """Returns the widgets whose hover state changed."""
+        widget = self.widget_at(pos)
+        if widget is self.hovered:
+            return []
+        changed = []
+        if self.hovered is not None:
+            self.hovered.set_hovered(False)
+            changed.append(self.hovered)
+        if widget is not None:
+            widget.set_hovered(True)
+            changed.append(widget)
+        self.hovered = widget
+        return changed
+
+    def press(self, pos):
+        self.hover(pos)
+        self.pressed = self.hovered
+        if self.pressed is not None:
+            self.pressed.clicked = True
+        return self.pressed
+
+    def release(self, pos):
+        self.hover(pos)
+        pressed, self.pressed = self.pressed, None
+        if pressed is None:
+            return None
+        pressed.clicked = False
+        return pressed if pressed is self.hovered else None
@@ -0,0 +1,145 @@
+import argparse
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pygame
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - Pillow is only needed for GIFs
+    Image = None
+
+
+def encode_png(data, size, path):
+    surface = pygame.image.fromstring(data, size, "RGB")
+    pygame.image.save(surface, path)
+    return path
+
+
+def quantize_frame(data, size):
+    image = Image.frombytes("RGB", size, data)
+    return image.quantize(colors=256, dither=Image.Dither.NONE)
+
+
+def export_frames(
+    algorithm_name,
+    output_dir,
+    board_size=9,
+    seed=0,
+    every=1,
+    gif_path=None,
+    frame_ms=100,
+    workers=None,
+    max_frames=None,
+):
+    """Render a run headless and write every ``every``-th step as a PNG.
+
+    Frames are drawn through Screen's normal draw path on the SDL dummy
+    driver and handed to a process pool for encoding, so rendering the next
+    frames overlaps with compressing the previous ones. With ``gif_path`` the
+    frames are also assembled into an animated GIF (requires Pillow). The
+    output only depends on the arguments, so a fixed seed gives identical
+    files.
+    """
+    if gif_path and Image is None:
+        raise RuntimeError("GIF export requires Pillow")
+    owns_display = not pygame.display.get_init()
+    if owns_display:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.display.init()
+    pygame.font.init()
+    from gui.screen import Screen
+
+    os.makedirs(output_dir, exist_ok=True)
+    screen = Screen(board_size=board_size, seed=seed)
+    screen.start_up_creation(algorithm_name)
+    screen.shown_alg_info = True
+    size = screen.window.get_size()
+
+    context = multiprocessing.get_context("spawn")
+    workers = workers or os.cpu_count() or 1
+    paths = []
+    gif_frames = []
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+
+        def submit_frame():
+            screen.sync_to_sorter()
+            screen.draw_frame()
+            data = pygame.image.tostring(screen.window, "RGB")
+            path = os.path.join(output_dir, f"frame_{len(paths):06d}.png")
+            paths.append(path)
+            pending.append(pool.submit(encode_png, data, size, path))
+            if gif_path:
+                pending.append(pool.submit(quantize_frame, data, size))
+            # Bound the frames in flight so memory stays flat on long runs.
+            while len(pending) > 4 * workers:
+                collect(pending.popleft())
+
+        def collect(future):
+            result = future.result()
+            if not isinstance(result, str):
+                gif_frames.append(result)
+
+        submit_frame()
+        steps = 0
+        while not screen.sort_method.finished:
+            if max_frames is not None and len(paths) >= max_frames:
+                break
+            if screen.sort_method.step() is None:
+                break
+            steps += 1
+            if not steps % every:
+                submit_frame()
+        if steps % every and (max_frames is None or len(paths) < max_frames):
+            submit_frame()
+        while pending:
+            collect(pending.popleft())
+
+    if gif_path and gif_frames:
+        gif_frames[0].save(
+            gif_path,
+            save_all=True,
+            append_images=gif_frames[1:],
+            duration=frame_ms,
+            loop=0,
+            optimize=False,
+        )
+    if owns_display:
+        pygame.quit()
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m gui.export",
+        description="Render a sorting run headless to PNG frames and an optional GIF.",
+    )
+    parser.add_argument("--algorithm", default="Bubble Sort")
+    parser.add_argument("--size", type=int, default=9)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--every", type=int, default=1, help="Keep every Nth step.")
+    parser.add_argument("--output", default="frames")
+    parser.add_argument("--gif", default=None, help="Also write an animated GIF.")
+    parser.add_argument("--frame-ms", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-frames", type=int, default=None)
+    args = parser.parse_args(argv)
+    paths = export_frames(
+        args.algorithm,
+        args.output,
+        board_size=args.size,
+        seed=args.seed,
+        every=max(args.every, 1),
+        gif_path=args.gif,
+        frame_ms=args.frame_ms,
+        workers=args.workers,
+        max_frames=args.max_frames,
+    )
+    print(f"Wrote {len(paths)} frames to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import pygame
+
+from gui.lru import BoundedLRU, surface_bytes
+
+DEFAULT_FONT = "segoeui"
+
+
+class FontRegistry:
+    """Process-wide cache of loaded fonts keyed by (name, size).
+
+    Fonts are loaded on first use and the least recently used one is dropped
+    once ``maxsize`` is reached. Font objects do not survive ``pygame.quit()``,
+    so the cache empties itself when pygame shuts down.
+    """
+
+    def __init__(self, maxsize=16):
+        self._fonts = BoundedLRU(maxsize)
+
+    def __len__(self):
+        return len(self._fonts)
+
+    def get(self, size, name=DEFAULT_FONT):
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts.put(key, pygame.font.SysFont(name, size))
+        return font
+
+    def clear(self):
+        self._fonts.clear()
+
+
+fonts = FontRegistry()
+
+
+def get_font(size, name=DEFAULT_FONT):
+    return fonts.get(size, name)
+
+
+class TextRenderCache:
+    """LRU cache of rendered text surfaces keyed by (text, size, color, font).
+
+    Bounded both by entry count and by the pixel memory of the cached
+    surfaces. Surfaces are shared between callers and must not be drawn on.
+    """
+
+    def __init__(self, maxsize=256, max_bytes=8 * 1024 * 1024):
+        self._surfaces = BoundedLRU(maxsize, max_bytes, surface_bytes)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    @property
+    def bytes(self):
+        return self._surfaces.bytes
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def render(self, text, size, color, name=DEFAULT_FONT):
+        key = (text, size, tuple(color), name)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = fonts.get(size, name).render(text, True, color)
+        return self._surfaces.put(key, surface)
+
+    def stats(self):
+        return {
+            "entries": len(self._surfaces),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+        }
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+text_cache = TextRenderCache()
+
+
+def render_text(text, size, color, name=DEFAULT_FONT):
+    return text_cache.render(text, size, color, name)
@@ -0,0 +1,37 @@
+from array import array
+
+import pygame
+
+
+class BoardLayout:
+    """Bar widths and positions for a board of ``length`` elements.
+
+    Element ``i`` starts at ``rect.left + i * rect.width // length``, so the
+    leftover pixels are spread across the board rather than piling up at
+    the right edge. Bars are never wider than ``max_bar_width``. When there
+    are more elements than pixel columns the layout is ``aggregated``: bars
+    are one pixel wide and neighbouring elements share a column.
+    """
+
+    max_bar_width = 75
+    arrow_width = 25
+
+    def __init__(self, rect, length):
+        self.rect = pygame.Rect(rect)
+        self.length = length
+        self.aggregated = length > self.rect.width
+        span = min(self.rect.width, self.max_bar_width * length)
+        self.bar_width = max(span // length, 1) if length else self.max_bar_width
+        left = self.rect.left
+        self.xs = array("i", (left + i * span // length for i in range(length)))
+        offset = (self.bar_width - self.arrow_width) // 2
+        self.arrow_xs = array("i", (x + offset for x in self.xs))
+
+    @classmethod
+    def for_window(cls, size, length):
+        # The bottom 90 pixels hold the counts, speed and timeline rows.
+        width, height = size
+        return cls((75, 50, max(width - 225, 1), max(height - 140, 1)), length)
+
+    def arrow_x(self, index):
+        return self.arrow_xs[max(0, min(index, self.length - 1))]
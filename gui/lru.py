@@ -0,0 +1,55 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class BoundedLRU:
+    """Least recently used cache bounded by entry count and total byte size.
+
+    ``sizeof`` gives the byte size of a value; without it only the entry
+    count is bounded. Cached pygame objects do not survive ``pygame.quit()``,
+    so the cache empties itself when pygame shuts down.
+    """
+
+    def __init__(self, maxsize, max_bytes=None, sizeof=None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._entries = OrderedDict()
+        self._quit_registered = False
+        self.bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        if not self._quit_registered:
+            # pygame forgets quit callbacks once it has run them.
+            pygame.register_quit(self.clear)
+            self._quit_registered = True
+        self._entries[key] = value
+        if self.sizeof:
+            self.bytes += self.sizeof(value)
+        while self._entries and (
+            len(self._entries) > self.maxsize
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            if self.sizeof:
+                self.bytes -= self.sizeof(evicted)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+        self._quit_registered = False
+        self.bytes = 0
+
+
+def surface_bytes(surface):
+    return surface.get_pitch() * surface.get_height()
@@ -0,0 +1,70 @@
+import pygame
+
+from gui.lru import BoundedLRU, surface_bytes
+
+
+class SurfacePool:
+    """LRU cache of solid-color surfaces keyed by (width, height, color).
+
+    Sprites of the same size and color share one surface, so the surfaces
+    must not be drawn on. Bounded by entry count and pixel memory.
+    """
+
+    def __init__(self, maxsize=4096, max_bytes=32 * 1024 * 1024):
+        self._surfaces = BoundedLRU(maxsize, max_bytes, surface_bytes)
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    @property
+    def bytes(self):
+        return self._surfaces.bytes
+
+    def get(self, width, height, color):
+        key = (width, height, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface((width, height))
+            surface.fill(color)
+            self._surfaces.put(key, surface)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+surfaces = SurfacePool()
+
+
+class SpritePool:
+    """Free list of sprites that are reset in place instead of reallocated.
+
+    ``factory`` builds a new sprite from the ``acquire`` arguments and the
+    sprite's ``reset`` method takes the same arguments.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.free = []
+        self.created = 0
+
+    def __len__(self):
+        return len(self.free)
+
+    def acquire(self, *args):
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args)
+            return sprite
+        self.created += 1
+        return self.factory(*args)
+
+    def release(self, sprites):
+        for sprite in sprites:
+            sprite.kill()
+            self.free.append(sprite)
+
+    def release_group(self, group):
+        sprites = group.sprites()
+        group.empty()
+        self.release(sprites)
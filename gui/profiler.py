@@ -0,0 +1,110 @@
+import csv
+from array import array
+from time import perf_counter
+
+
+class FrameProfiler:
+    """Times the phases of each frame into a fixed-size ring buffer.
+
+    A frame runs from ``begin_frame`` to ``end_frame``; each ``mark`` closes
+    the phase that started at the previous mark. Only the last ``capacity``
+    frames are kept and nothing is allocated per frame.
+    """
+
+    phases = ("events", "step", "draw", "flip")
+
+    def __init__(self, capacity=600):
+        self.capacity = capacity
+        self.columns = {
+            name: array("d", [0.0]) * capacity for name in self.phases + ("frame",)
+        }
+        self.steps = array("q", [0]) * capacity
+        self.count = 0
+        self.next = 0
+        self.frame_start = 0.0
+        self.last_mark = 0.0
+
+    def __len__(self):
+        return self.count
+
+    def begin_frame(self):
+        self.frame_start = self.last_mark = perf_counter()
+        for name in self.phases:
+            self.columns[name][self.next] = 0.0
+
+    def mark(self, phase):
+        now = perf_counter()
+        self.columns[phase][self.next] += now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self, steps=0):
+        self.columns["frame"][self.next] = perf_counter() - self.frame_start
+        self.steps[self.next] = steps
+        self.next = (self.next + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def slots(self):
+        start = (self.next - self.count) % self.capacity
+        return [(start + k) % self.capacity for k in range(self.count)]
+
+    def frame_times(self):
+        frames = self.columns["frame"]
+        return [frames[k] for k in self.slots()]
+
+    def percentile(self, p):
+        times = sorted(self.frame_times())
+        if not times:
+            return 0.0
+        return times[min(int(p / 100 * len(times)), len(times) - 1)]
+
+    def steps_per_second(self):
+        elapsed = sum(self.frame_times())
+        if not elapsed:
+            return 0.0
+        return sum(self.steps[k] for k in self.slots()) / elapsed
+
+    def summary(self):
+        return (
+            f"frame p50 {self.percentile(50) * 1000:.1f} ms"
+            f"  p99 {self.percentile(99) * 1000:.1f} ms",
+            f"{self.steps_per_second():,.0f} steps/s",
+        )
+
+    def write_csv(self, path):
+        names = self.phases + ("frame",)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow([f"{name}_ms" for name in names] + ["steps"])
+            for k in self.slots():
+                row = [f"{self.columns[name][k] * 1000:.4f}" for name in names]
+                writer.writerow(row + [self.steps[k]])
+        return path
+
+
+class StartupTimer:
+    """Wall time of each startup phase, from ``start`` to the first frame.
+
+    Each ``mark`` closes the phase that started at the previous mark.
+    """
+
+    def __init__(self, start=None):
+        self.start = perf_counter() if start is None else start
+        self.last = self.start
+        self.phases = []
+
+    def mark(self, name):
+        now = perf_counter()
+        self.phases.append((name, now - self.last))
+        self.last = now
+
+    @property
+    def total(self):
+        return self.last - self.start
+
+    def report(self):
+        width = max([len(name) for name, _ in self.phases] + [len("total")])
+        lines = [
+            f"{name:<{width}} {seconds * 1000:8.1f} ms" for name, seconds in self.phases
+        ]
+        lines.append(f"{'total':<{width}} {self.total * 1000:8.1f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,213 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pygame
+
+from algorithms import datasets
+from algorithms.trace import record_trace
+from gui.autoplay import AutoPlayer
+from gui.bar_renderer import BarRenderer
+from spirtes.text_sprites import TextSprite
+
+
+class RaceLane:
+    def __init__(self, name, future, surface, colors, background, max_value):
+        self.name = name
+        self.future = future
+        self.surface = surface
+        self.colors = colors
+        self.background = background
+        self.trace = None
+        self.position = 0
+        self.comparisons = 0
+        board_rect = pygame.Rect(0, 24, surface.get_width(), surface.get_height() - 24)
+        self.board_surface = surface.subsurface(board_rect)
+        self.max_value = max_value
+        self.renderer = None
+        if BarRenderer.available():
+            self.renderer = BarRenderer(board_rect, colors, background, max_value)
+
+    @property
+    def finished(self):
+        return self.trace is not None and self.position >= len(self.trace)
+
+    def poll(self):
+        if self.trace is None and self.future is not None and self.future.done():
+            self.trace = self.future.result()
+        return self.trace is not None
+
+    def advance(self, steps):
+        if not self.poll() or not steps:
+            return
+        start = self.position
+        self.position = min(self.position + steps, len(self.trace))
+        self.comparisons += self.trace.comparisons_between(start, self.position)
+
+    def status(self):
+        if self.trace is None:
+            return f"{self.name}: recording..."
+        text = f"{self.name}: {self.position:,} steps, {self.comparisons:,} comparisons"
+        if self.finished:
+            text += " - done" if self.trace.finished else " - step limit reached"
+        return text
+
+    def draw(self):
+        self.surface.fill(self.background)
+        label = TextSprite(self.status(), 18, (0, 0, 0), 4, 0)
+        self.surface.blit(label.image, label.rect)
+        if self.trace is None:
+            return
+        model = self.trace.seek(self.position)
+        if self.renderer:
+            self.board_surface.blit(self.renderer.render(model), (0, 0))
+        else:
+            draw_bars(self.board_surface, model, self.colors, self.max_value)
+
+
+def draw_bars(surface, model, colors, max_value):
+    # Fallback for small boards when numpy is not available.
+    width, height = surface.get_size()
+    length = len(model)
+    scale = height / max(max_value, 1)
+    for i in range(length):
+        left = i * width // length
+        right = (i + 1) * width // length
+        color = colors[model.order[i] % len(colors)]
+        bar = (left, 0, max(right - left, 1), int(model.values[i] * scale))
+        pygame.draw.rect(surface, color, bar)
+
+
+class RaceScreen:
+    """Runs several algorithms on the same board side by side.
+
+    Each algorithm's trace is recorded in its own worker process; lanes start
+    playing as their traces arrive and all advance by the same number of
+    operations per frame, so they can be compared step for step. Passing
+    ``traces`` instead replays already recorded traces (such as ``TraceFile``).
+    ``options`` sets strategies such as QuickSort's pivot for the algorithms
+    that accept them.
+    """
+
+    def __init__(
+        self,
+        algorithms=(),
+        board_size=100,
+        seed=None,
+        max_steps=5_000_000,
+        workers=None,
+        traces=(),
+        distribution="random",
+        options=None,
+    ):
+        self.algorithms = algorithms
+        self.fps = 60
+        self.game_running = True
+        self.window = pygame.display.set_mode((900, 500))
+        pygame.display.set_caption("Algorithm Visualizer - Race")
+        self.background = (248, 244, 234)
+        self.colors = [
+            (0, 0, 0),
+            (127, 127, 127),
+            (255, 0, 0),
+            (0, 255, 0),
+            (0, 0, 255),
+            (255, 255, 0),
+            (0, 255, 255),
+            (255, 0, 255),
+            (165, 42, 42),
+            (102, 0, 204),
+        ]
+        if traces:
+            board = list(traces[0][1].initial)
+        else:
+            values = datasets.load(distribution, board_size, seed)
+            board = [1 + (value - 1) * 450 // board_size for value in values]
+        self.board = board
+        self.max_steps = max_steps
+        self.autoplayer = AutoPlayer(steps_per_frame=max(1, len(board) // 10))
+        self.autoplayer.playing = True
+        self.executor = None
+        if algorithms:
+            self.executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        self.lanes = []
+        lane_count = max(len(algorithms) + len(traces), 1)
+        lane_height = self.window.get_height() // lane_count
+        sources = []
+        for name, cls in algorithms:
+            future = self.executor.submit(
+                record_trace,
+                cls,
+                board,
+                max_steps,
+                options=cls.select_options(options),
+            )
+            sources.append((name, future, None))
+        sources += [(name, None, trace) for name, trace in traces]
+        for k, (name, future, trace) in enumerate(sources):
+            rect = pygame.Rect(0, k * lane_height, self.window.get_width(), lane_height)
+            rect.inflate_ip(-8, -8)
+            lane = RaceLane(
+                name,
+                future,
+                self.window.subsurface(rect),
+                self.colors,
+                self.background,
+                max(self.board, default=1),
+            )
+            lane.trace = trace
+            self.lanes.append(lane)
+
+    @property
+    def finished(self):
+        return all(lane.finished for lane in self.lanes)
+
+    def update(self):
+        if not self.autoplayer.playing:
+            return
+        steps = self.autoplayer.due_steps()
+        for lane in self.lanes:
+            lane.advance(steps)
+
+    def draw(self):
+        self.window.fill(self.background)
+        for lane in self.lanes:
+            lane.draw()
+
+    def event_handler(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.game_running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    self.game_running = False
+                elif event.key == pygame.K_SPACE:
+                    self.autoplayer.playing = not self.autoplayer.playing
+                elif event.key in (pygame.K_UP, pygame.K_RIGHT):
+                    self.autoplayer.faster()
+                elif event.key in (pygame.K_DOWN, pygame.K_LEFT):
+                    self.autoplayer.slower()
+
+    def start(self, startup=None):
+        # With a StartupTimer, only the first frame is shown and timed.
+        clock = pygame.time.Clock()
+        try:
+            while self.game_running:
+                self.event_handler()
+                if not self.game_running:
+                    break
+                self.update()
+                self.draw()
+                pygame.display.flip()
+                if startup:
+                    startup.mark("first frame")
+                    break
+                clock.tick(self.fps)
+        finally:
+            self.shutdown()
+        pygame.quit()
+
+    def shutdown(self):
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
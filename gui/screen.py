@@ -1,23 +1,45 @@
-from random import shuffle
+import os
+import threading
+from functools import partial
+from random import Random
+from time import perf_counter, strftime
 
 import pygame
 
-from algorithms.algorithms import InsertionSort, SelectionSort, BubbleSort
+from algorithms import datasets
+from algorithms.model import BoardModel
+from algorithms.registry import registry
+from algorithms.steps import GRANULARITIES, Op
+from algorithms.trace import Trace
+from gui.autoplay import AutoPlayer
+from gui.fonts import render_text
+from gui.profiler import FrameProfiler
 from spirtes.block_sprites import BlockSprite
 from spirtes.text_sprites import TextSprite
 from gui.button import Button
+from gui.dispatch import EventDispatcher
+from gui.layout import BoardLayout
+from gui.pool import SpritePool
+from gui.timeline import Timeline
 
 
 class Screen:
-    def __init__(self):
+    def __init__(
+        self,
+        board_size=9,
+        worker_mode=None,
+        seed=None,
+        distribution="random",
+        options=None,
+        count_ops=False,
+    ):
         self.pause_game = False
         self.game_running = True
         self.fps = 60
         self.index = 0
-        self.window = pygame.display.set_mode((900, 500))
+        self.window = pygame.display.set_mode((900, 500), pygame.RESIZABLE)
         pygame.display.set_caption("Algorithm Visualizer")
         self.background = (248, 244, 234)
-        self.pos_list = [75, 150, 225, 300, 375, 450, 525, 600, 675]
         self.colors = [
             (0, 0, 0),
             (127, 127, 127),
@@ -32,142 +54,580 @@ class Screen:
         ]
         self.board = None
         self.board_length = None
+        self.board_size = board_size
+        # Bar widths and x positions, recomputed when the board or the window
+        # changes size.
+        self.layout = BoardLayout.for_window(self.window.get_size(), board_size)
+        self.random = Random(seed)
+        self.distribution = distribution
+        # Above this many elements the board is drawn by a single BarRenderer
+        # instead of one BlockSprite per element.
+        self.bulk_render_threshold = 500
+        self.bar_renderer = None
+        # "thread" or "process" runs the algorithm off the render thread and
+        # feeds its operations back through a bounded queue.
+        self.worker_mode = worker_mode
+        # Strategy settings such as {"pivot": "median3"}; each algorithm takes
+        # only the ones it declares in its ``settings``.
+        self.options = dict(options or {})
+        self.sort_options = {}
+        # Counting reads and writes slows every step down, so the counts row
+        # is shown only when asked for.
+        self.count_ops = count_ops
         self.blocks = []
         self.blocks_created = False
         self.alg_buttons = []
         self.alg_button_pressed = False
         self.next_button = None
+        # Mouse events are routed to whichever button is under the cursor;
+        # buttons are registered only while they are on screen.
+        self.dispatcher = EventDispatcher()
         self.shown_alg_info = False
         self.sort_method = None
+        self.sort_class = None
         self.complete = False
         self.extra_loop = False
+        self.full_redraw = True
+        self.dirty_rects = []
+        self.trace = None
+        self.save_thread = None
+        # Steps recorded up front when a run starts; the timeline grows past
+        # this on demand when it is dragged to the end.
+        self.trace_preview_steps = 10_000
+        self.timeline = None
+        self.scrub_position = None
+        self.live_index = 0
+        self.autoplayer = AutoPlayer()
+        # With a worker, a Next click at pass granularity only sets the pass
+        # to reach; each frame then applies what fits in the frame budget.
+        self.pass_target = None
+        # How far one Next click goes; G cycles through the granularities.
+        # Below a full pass the indices touched by the last step are outlined.
+        self.granularity = "pass"
+        self.highlight = ()
+        self.highlight_color = (0, 0, 0)
+        # F3 shows frame timings from the last few seconds, F4 saves them.
+        self.profiler = FrameProfiler()
+        self.show_profile = False
+        self.profile_lines = []
+        self.profile_rect = pygame.Rect(0, 0, 220, 40)
+        # Auxiliary memory (e.g. merge sort's buffer) is drawn to the right of
+        # the board, one lane per buffer.
+        self.aux_lane_rect = self.aux_lane_rect_for(self.window.get_size())
+        self.aux_lane_color = (87, 155, 177)
+
+        # Sprites are handed back to these pools when a run ends and reset in
+        # place by the next run instead of being reallocated.
+        self.block_pool = SpritePool(BlockSprite)
+        self.text_pool = SpritePool(TextSprite)
 
         self.block_sprites = pygame.sprite.Group()
         self.complete_sprite = pygame.sprite.GroupSingle()
         self.arrow_sprite = pygame.sprite.GroupSingle()
         self.index_sprite = pygame.sprite.GroupSingle()
+        self.speed_sprite = pygame.sprite.GroupSingle()
+        self.counts_sprite = pygame.sprite.GroupSingle()
         self.algorithm_info = pygame.sprite.Group()
 
     def create_board(self):
-        randomized_board = [i for i in range(1, 451, 50)]
-        shuffle(randomized_board)
-        self.board = randomized_board
+        size = self.board_size
+        # Every board gets a fresh seed, so there is nothing to gain from the
+        # on-disk dataset cache here; it would only fill up with one-off files.
+        values = datasets.generate(
+            self.distribution, size, self.random.randrange(2**32)
+        )
+        # Datasets hold values in 1..size; stretch them to block heights.
+        self.board = [1 + (value - 1) * 450 // size for value in values]
         self.board_length = len(self.board)
+        self.layout = BoardLayout.for_window(self.window.get_size(), self.board_length)
+
+    @property
+    def pos_list(self):
+        return list(self.layout.xs)
+
+    @staticmethod
+    def aux_lane_rect_for(size):
+        return pygame.Rect(size[0] - 140, 50, 130, 280)
+
+    @property
+    def bulk_render(self):
+        if self.board_length is None or self.board_length <= self.bulk_render_threshold:
+            return False
+        # Imported on first use to keep the module off the startup path. This
+        # does not defer numpy, which importing pygame already loads.
+        from gui.bar_renderer import BarRenderer
+
+        return BarRenderer.available()
 
     def create_blocks(self):
-        x_pos = 75
+        if self.bulk_render:
+            from gui.bar_renderer import BarRenderer
+
+            self.bar_renderer = BarRenderer(
+                self.layout.rect, self.colors, self.background, max(self.board)
+            )
+            return
         for i in range(self.board_length):
             num = abs(i % 10)
             color = self.colors[num]
-            block = BlockSprite(x_pos, self.board[i], color)
+            block = self.block_pool.acquire(
+                self.layout.xs[i],
+                self.board[i],
+                color,
+                self.layout.bar_width,
+                self.block_scale,
+            )
             self.blocks.append(block)
             self.block_sprites.add(block)
-            x_pos += 75
+
+    @property
+    def block_scale(self):
+        # Pixels per unit of value, so the tallest bar fills the board.
+        return self.layout.rect.height / max(self.board, default=1)
 
     def create_index_display(self):
-        index_display = TextSprite(f"Index: {self.index}", 30, (0, 0, 0), 0, 450)
+        index_display = self.text_pool.acquire(
+            f"Index: {self.index}", 30, (0, 0, 0), 0, 450
+        )
         self.index_sprite.add(index_display)
 
-    def create_index_arrow(self, x=100):
-        arrow_display = TextSprite(f"↓", 40, (0, 0, 0), x, 0)
+    def create_index_arrow(self, x=None):
+        if x is None:
+            x = self.layout.arrow_x(0)
+        arrow_display = self.text_pool.acquire("↓", 40, (0, 0, 0), x, 0)
         self.arrow_sprite.add(arrow_display)
 
     def create_algorithm_info_display(self):
         alg_text = self.sort_method.algorithm_info()
         y = 50
         for text in alg_text:
-            algorithm_info_display = TextSprite(f"{text}", 18, (0, 0, 0), 50, y)
+            algorithm_info_display = self.text_pool.acquire(
+                f"{text}", 18, (0, 0, 0), 50, y
+            )
             self.algorithm_info.add(algorithm_info_display)
             y += 50
 
     def create_sorting_buttons(self):
-        algorithms = ["Insertion Sort", "Selection Sort", "Bubble Sort"]
-        x = 100
-        for alg in algorithms:
-            button = Button((x, 100), 100, 100, alg, self.window)
+        algorithms = registry.names()
+        per_row = 6
+        for i, alg in enumerate(algorithms):
+            x = 100 + (i % per_row) * 125
+            y = 100 + (i // per_row) * 125
+            button = Button((x, y), 100, 100, alg, self.window)
             self.alg_buttons.append(button)
-            x += 125
+            self.dispatcher.add(button)
 
     def create_next_button(self):
-        button = Button((750, 350), 100, 100, "Next", self.window)
-        self.next_button = button
+        if self.next_button is None:
+            self.next_button = Button((750, 350), 100, 100, "Next", self.window)
+        self.next_button.reset()
+        self.dispatcher.add(self.next_button)
+
+    def create_speed_display(self):
+        if self.autoplayer.playing:
+            text = f"Auto: {self.autoplayer.steps_per_frame:g} steps/frame"
+        else:
+            text = f"Space: auto-play  G: per {self.granularity}"
+        y = self.layout.rect.bottom + 30
+        speed_display = self.text_pool.acquire(text, 18, (0, 0, 0), 150, y)
+        self.speed_sprite.add(speed_display)
+
+    def update_speed_display(self):
+        self.mark_group_dirty(self.speed_sprite)
+        self.text_pool.release_group(self.speed_sprite)
+        self.create_speed_display()
+        self.mark_group_dirty(self.speed_sprite)
+
+    def create_counts_display(self):
+        counts = self.sort_method.counts
+        if counts is None:
+            return
+        text = (
+            f"Comparisons: {counts.comparisons}  Swaps: {counts.swaps}"
+            f"  Reads: {counts.reads}  Writes: {counts.writes}"
+        )
+        y = self.layout.rect.bottom + 8
+        self.counts_sprite.add(self.text_pool.acquire(text, 18, (0, 0, 0), 150, y))
+
+    def update_counts_display(self):
+        self.mark_group_dirty(self.counts_sprite)
+        self.text_pool.release_group(self.counts_sprite)
+        self.create_counts_display()
+        self.mark_group_dirty(self.counts_sprite)
+
+    def create_timeline(self):
+        y = self.layout.rect.bottom + 60
+        self.timeline = Timeline((150, y), 550, 16, self.window)
+        self.update_timeline()
 
     def create_complete_banner(self):
-        complete_banner = TextSprite("Complete!", 100, (0, 0, 0), 200, 0)
+        self.text_pool.release_group(self.complete_sprite)
+        complete_banner = self.text_pool.acquire("Complete!", 100, (0, 0, 0), 200, 0)
         self.complete_sprite.add(complete_banner)
 
     def update_blocks(self):
+        xs = self.layout.xs
         for i, block in enumerate(self.blocks):
-            block.x = self.pos_list[i]
-            block.rect.topleft = [block.x, block.y]
+            x = xs[i]
+            if block.x != x:
+                self.mark_dirty(block.rect)
+                block.x = x
+                block.rect.topleft = [block.x, block.y]
+                self.mark_dirty(block.rect)
 
     def update_buttons(self):
         for b in self.alg_buttons:
             b.draw_button()
 
     def update_index_display(self):
-        if self.index < 8:
+        if self.index < self.board_length - 1:
             self.index += 1
-        self.index_sprite.empty()
+        self.refresh_index_display()
+
+    def sync_index(self):
+        # The index follows completed passes, so finer steps within a pass
+        # leave the arrow where it is.
+        self.index = min(self.sort_method.counter, self.board_length - 1)
+        self.refresh_index_display()
+        self.update_arrow_display()
+
+    def refresh_index_display(self):
+        self.mark_group_dirty(self.index_sprite)
+        self.text_pool.release_group(self.index_sprite)
         self.create_index_display()
+        self.mark_group_dirty(self.index_sprite)
         self.index_sprite.draw(self.window)
 
     def update_arrow_display(self):
-        if self.index >= self.board_length:
+        if self.index >= self.layout.length:
             return
-        index_pos = {
-            0: 100,
-            1: 175,
-            2: 250,
-            3: 325,
-            4: 400,
-            5: 475,
-            6: 550,
-            7: 625,
-            8: 700,
-        }
-        self.arrow_sprite.empty()
-        self.create_index_arrow(index_pos[self.index])
+        self.mark_group_dirty(self.arrow_sprite)
+        self.text_pool.release_group(self.arrow_sprite)
+        self.create_index_arrow(self.layout.arrow_x(self.index))
+        self.mark_group_dirty(self.arrow_sprite)
         self.arrow_sprite.draw(self.window)
 
     def set_sorting_method(self, name):
-        sorting_dict = {
-            "Insertion Sort": InsertionSort,
-            "Selection Sort": SelectionSort,
-            "Bubble Sort": BubbleSort,
-        }
-        if sorting_dict[name] == InsertionSort:
-            self.extra_loop = True
-        self.sort_method = sorting_dict[name](self.blocks)
-
-    def start(self):
+        # Plugin implementations are imported here, on first use.
+        sort_class = registry.named(name).load()
+        self.extra_loop = sort_class.extra_loop
+        self.sort_class = sort_class
+        options = sort_class.select_options(self.options)
+        self.sort_options = options
+        blocks = BoardModel(self.board) if self.bulk_render else self.blocks
+        if self.worker_mode:
+            from algorithms.worker import SortWorker
+
+            self.sort_method = SortWorker(
+                sort_class, blocks, mode=self.worker_mode, options=options
+            )
+        else:
+            self.sort_method = sort_class(blocks, count_ops=self.count_ops, **options)
+        if self.board is not None:
+            self.trace = Trace(sort_class, self.board, options=options)
+            self.trace.record(self.trace_preview_steps)
+
+    def advance_sort(self):
+        step = None
+        if not self.sort_method.done:
+            step = self.sort_method.advance(self.granularity)
+        self.set_highlight(step)
+        if self.bar_renderer:
+            self.mark_dirty(self.bar_renderer.rect)
+        else:
+            self.blocks = self.sort_method.blocks
+            self.update_blocks()
+        self.mark_aux_lanes_dirty()
+        self.update_counts_display()
+        self.update_timeline()
+
+    def cycle_granularity(self):
+        names = list(GRANULARITIES)
+        self.granularity = names[(names.index(self.granularity) + 1) % len(names)]
+        self.set_highlight(None)
+        self.update_speed_display()
+
+    def highlight_rects(self):
+        layout = self.layout
+        return [
+            pygame.Rect(
+                layout.xs[i], layout.rect.top, layout.bar_width, layout.rect.height
+            )
+            for i in self.highlight
+        ]
+
+    def set_highlight(self, step):
+        for rect in self.highlight_rects():
+            self.mark_dirty(rect)
+        if step is None or self.granularity == "pass":
+            self.highlight = ()
+        elif step.op in (Op.COMPARE, Op.SWAP):
+            self.highlight = (step.i, step.j)
+        elif step.op is Op.WRITE:
+            self.highlight = (step.i,)
+        else:
+            self.highlight = ()
+        for rect in self.highlight_rects():
+            self.mark_dirty(rect)
+
+    def draw_highlight(self):
+        for rect in self.highlight_rects():
+            pygame.draw.rect(self.window, self.highlight_color, rect, 2)
+
+    def mark_aux_lanes_dirty(self):
+        if self.sort_method.aux_lanes:
+            self.mark_dirty(self.aux_lane_rect)
+
+    def update_timeline(self):
+        if not self.timeline or not self.trace:
+            return
+        if self.scrub_position is None:
+            position = self.sort_method.position
+        else:
+            position = self.scrub_position
+        length = max(len(self.trace), position)
+        if (length, position) != (self.timeline.length, self.timeline.position):
+            self.timeline.set_range(length, position)
+            self.mark_dirty(self.timeline.rect.inflate(8, 8))
+
+    def can_step(self):
+        return (
+            self.alg_button_pressed
+            and self.shown_alg_info
+            and not self.complete
+            and self.sort_method is not None
+        )
+
+    def toggle_autoplay(self):
+        if not self.can_step():
+            return
+        if self.scrub_position is not None:
+            self.resume_live()
+        self.set_highlight(None)
+        self.pass_target = None
+        self.autoplayer.toggle()
+        self.update_speed_display()
+
+    def sync_to_sorter(self):
+        self.show_model(self.sort_method.model)
+        self.mark_aux_lanes_dirty()
+        self.sync_index()
+        self.update_counts_display()
+        self.update_timeline()
+
+    def autoplay_frame(self):
+        if not self.can_step() or self.scrub_position is not None:
+            self.autoplayer.stop()
+            return
+        if self.worker_mode:
+            done = self.autoplayer.run_batched(self.sort_method.drain)
+        else:
+            done = self.autoplayer.run(self.sort_method.step)
+        if done:
+            self.sync_to_sorter()
+        if not self.autoplayer.playing:
+            self.update_speed_display()
+
+    def pass_frame(self):
+        if not self.can_step() or self.scrub_position is not None:
+            self.pass_target = None
+            return
+        sorter = self.sort_method
+        deadline = perf_counter() + self.autoplayer.budget
+        applied = 0
+        while self.pass_target is not None:
+            done, _ = sorter.drain(float("inf"), deadline, until_pass=True)
+            applied += done
+            if sorter.done or sorter.counter >= self.pass_target:
+                self.pass_target = None
+            elif not done or perf_counter() > deadline:
+                break
+        if applied:
+            self.sync_to_sorter()
+        if self.pass_target is None and sorter.done and not self.extra_loop:
+            self.complete = True
+
+    def scrub_to(self, x):
+        position = self.timeline.position_at(x)
+        if position >= len(self.trace) and not self.trace.finished:
+            self.trace.record(max(len(self.trace), self.trace_preview_steps))
+        model = self.trace.seek(position)
+        self.set_highlight(None)
+        if self.scrub_position is None:
+            self.live_index = self.index
+        self.scrub_position = self.trace.position
+        self.show_model(model)
+        self.index = min(
+            self.trace.passes_at(self.scrub_position), self.board_length - 1
+        )
+        self.refresh_index_display()
+        self.update_arrow_display()
+        self.update_timeline()
+
+    def resume_live(self):
+        self.scrub_position = None
+        self.index = self.live_index
+        self.show_model(self.sort_method.model)
+        self.refresh_index_display()
+        self.update_arrow_display()
+        self.update_timeline()
+
+    def show_model(self, model):
+        if self.bar_renderer:
+            self.mark_dirty(self.bar_renderer.rect)
+        else:
+            items = self.sort_method.items
+            self.blocks = [items[element] for element in model.order]
+            self.update_blocks()
+
+    def mark_dirty(self, rect):
+        self.dirty_rects.append(pygame.Rect(rect))
+
+    def mark_group_dirty(self, group):
+        for sprite in group:
+            self.mark_dirty(sprite.rect)
+
+    def mark_hover_changes(self, pos):
+        for button in self.dispatcher.hover(pos):
+            self.mark_dirty(button.top_rect)
+
+    def draw_frame(self):
+        self.window.fill(self.background)
+        if not self.pause_game:
+            if not self.alg_button_pressed:
+                self.update_buttons()
+            if self.alg_button_pressed:
+                if self.blocks_created and not self.shown_alg_info:
+                    self.algorithm_info.draw(self.window)
+                elif self.blocks_created and self.shown_alg_info:
+                    self.draw_sprites()
+                self.next_button.draw_button()
+        else:
+            self.next_button.draw_button()
+            self.complete_sprite.draw(self.window)
+        if self.show_profile:
+            self.draw_profile_overlay()
+
+    def render(self):
+        # Repaint everything only after a state change; otherwise repaint and
+        # push just the regions that changed, and nothing at all when idle.
+        if self.full_redraw:
+            self.draw_frame()
+            self.profiler.mark("draw")
+            pygame.display.flip()
+        elif self.dirty_rects:
+            self.window.set_clip(self.dirty_rects[0].unionall(self.dirty_rects))
+            self.draw_frame()
+            self.window.set_clip(None)
+            self.profiler.mark("draw")
+            pygame.display.update(self.dirty_rects)
+        self.profiler.mark("flip")
+        self.full_redraw = False
+        self.dirty_rects = []
+
+    def start(self, startup=None):
+        # With a StartupTimer, only the first frame is shown and timed.
         self.window.fill(self.background)
         self.create_sorting_buttons()
+        if startup:
+            startup.mark("buttons")
         clock = pygame.time.Clock()
+        profiler = self.profiler
         while self.game_running:
+            profiler.begin_frame()
+            position = self.step_position()
             self.event_handler()
-            self.window.fill(self.background)
+            if not self.game_running:
+                break
+            profiler.mark("events")
+            if self.autoplayer.playing:
+                self.autoplay_frame()
+            elif self.pass_target is not None:
+                self.pass_frame()
             if self.complete:
                 self.cleanup()
                 self.next_button.draw_button()
                 self.create_complete_banner()
-            if not self.pause_game:
-                if not self.alg_button_pressed:
-                    self.update_buttons()
-                if self.alg_button_pressed:
-                    if self.blocks_created and not self.shown_alg_info:
-                        self.algorithm_info.draw(self.window)
-                    elif self.blocks_created and self.shown_alg_info:
-                        self.window.fill(self.background)
-                        self.draw_sprites()
-                    self.next_button.draw_button()
-            else:
-                self.next_button.draw_button()
-                self.complete_sprite.draw(self.window)
-            pygame.display.flip()
+            profiler.mark("step")
+            if self.show_profile and profiler.next % 30 == 0:
+                self.update_profile_overlay()
+            self.render()
+            if startup:
+                startup.mark("first frame")
+                break
             clock.tick(self.fps)
+            profiler.end_frame(max(self.step_position() - position, 0))
+        self.stop_worker()
         pygame.quit()
 
+    def step_position(self):
+        return self.sort_method.position if self.sort_method else 0
+
+    def toggle_profile(self):
+        self.show_profile = not self.show_profile
+        self.update_profile_overlay()
+
+    def update_profile_overlay(self):
+        self.profile_lines = [
+            render_text(line, 16, (0, 0, 0)) for line in self.profiler.summary()
+        ]
+        self.profile_rect.topright = (self.window.get_width() - 5, 5)
+        self.mark_dirty(self.profile_rect)
+
+    def draw_profile_overlay(self):
+        pygame.draw.rect(self.window, (225, 215, 198), self.profile_rect)
+        y = self.profile_rect.top + 2
+        for line in self.profile_lines:
+            self.window.blit(line, (self.profile_rect.left + 4, y))
+            y += line.get_height()
+
+    def dump_profile(self, path=None):
+        if path is None:
+            path = strftime("profile-%Y%m%d-%H%M%S.csv")
+        return self.profiler.write_csv(path)
+
+    def save_trace(self, path=None):
+        # A fully recorded trace is written from memory; otherwise the run is
+        # re-recorded straight to disk. Either can take a while on large
+        # boards, so it happens on a background thread and the window keeps
+        # responding meanwhile.
+        if self.sort_class is None or self.board is None:
+            return None
+        if self.save_thread is not None and self.save_thread.is_alive():
+            return None
+        from algorithms.trace_file import record_to_file, write_trace
+
+        if path is None:
+            path = f"{self.sort_class.__name__}-{self.board_length}.svtr"
+        if self.trace is not None and self.trace.finished:
+            write = partial(
+                write_trace, algorithm_name=self.sort_class.__name__, trace=self.trace
+            )
+        else:
+            write = partial(
+                record_to_file,
+                algorithm_class=self.sort_class,
+                values=self.board,
+                options=self.sort_options,
+            )
+        self.save_thread = threading.Thread(
+            target=self.write_trace_file, args=(path, write), daemon=True
+        )
+        self.save_thread.start()
+        return path
+
+    @staticmethod
+    def write_trace_file(path, write):
+        # Written under a temporary name, so quitting mid-save never leaves a
+        # truncated trace behind.
+        part = f"{path}.part"
+        write(part)
+        os.replace(part, path)
+
+    def stop_worker(self):
+        if self.worker_mode and self.sort_method is not None:
+            self.sort_method.stop()
+
     def event_handler(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -177,34 +637,113 @@ class Screen:
                 if event.key == pygame.K_ESCAPE:
                     self.game_running = False
                     pygame.quit()
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if self.next_button:
-                    if self.next_button.check_button_clicked():
-                        if self.pause_game:
-                            self.pause_game = False
+                elif event.key == pygame.K_SPACE:
+                    self.toggle_autoplay()
+                elif event.key == pygame.K_g:
+                    self.cycle_granularity()
+                elif event.key == pygame.K_F3:
+                    self.toggle_profile()
+                elif event.key == pygame.K_F4:
+                    self.dump_profile()
+                elif event.key == pygame.K_s and self.alg_button_pressed:
+                    self.save_trace()
+                elif event.key in (pygame.K_UP, pygame.K_RIGHT):
+                    self.autoplayer.faster()
+                    self.update_speed_display()
+                elif event.key in (pygame.K_DOWN, pygame.K_LEFT):
+                    self.autoplayer.slower()
+                    self.update_speed_display()
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                self.full_redraw = True
+            elif event.type == pygame.VIDEORESIZE:
+                self.resize(event.size)
+            elif event.type == pygame.MOUSEMOTION:
+                self.mark_hover_changes(event.pos)
+                if self.timeline and self.timeline.dragging:
+                    self.scrub_to(event.pos[0])
+            elif (
+                event.type == pygame.MOUSEBUTTONUP
+                and event.button == pygame.BUTTON_LEFT
+            ):
+                if self.timeline:
+                    self.timeline.dragging = False
+                self.mark_hover_changes(event.pos)
+                self.dispatcher.release(event.pos)
+            elif (
+                event.type == pygame.MOUSEBUTTONDOWN
+                and event.button == pygame.BUTTON_LEFT
+            ):
+                if (
+                    self.timeline
+                    and self.shown_alg_info
+                    and self.alg_button_pressed
+                    and self.timeline.rect.collidepoint(event.pos)
+                ):
+                    self.timeline.dragging = True
+                    self.scrub_to(event.pos[0])
+                    continue
+                self.mark_hover_changes(event.pos)
+                clicked = self.dispatcher.press(event.pos)
+                if clicked is None:
+                    continue
+                self.mark_dirty(clicked.top_rect)
+                if clicked is self.next_button:
+                    if self.pause_game:
+                        self.pause_game = False
+                        self.full_redraw = True
 
-                        if not self.shown_alg_info:
-                            self.shown_alg_info = True
+                    if not self.shown_alg_info:
+                        self.shown_alg_info = True
+                        self.full_redraw = True
 
-                        elif not self.complete and self.alg_button_pressed:
-                            if self.sort_method.counter >= len(self.blocks):
+                    elif not self.complete and self.alg_button_pressed:
+                        if self.scrub_position is not None:
+                            self.resume_live()
+                        if self.sort_method.done:
+                            self.complete = True
+                        elif self.worker_mode and self.granularity == "pass":
+                            start = self.pass_target or self.sort_method.counter
+                            self.pass_target = start + 1
+                        else:
+                            self.advance_sort()
+                            self.sync_index()
+                            if (
+                                self.sort_method.done
+                                and not self.extra_loop
+                            ):
                                 self.complete = True
-                            else:
-                                self.blocks = self.sort_method.sort()
-                                self.update_blocks()
-                                self.update_index_display()
-                                self.update_arrow_display()
-                                if (
-                                    self.sort_method.counter == len(self.blocks)
-                                    and not self.extra_loop
-                                ):
-                                    self.complete = True
-                for b in self.alg_buttons:
-                    button_pressed = b.check_button_clicked()
-                    if button_pressed:
-                        self.start_up_creation(b.text)
+                elif clicked in self.alg_buttons:
+                    self.start_up_creation(clicked.text)
+
+    def resize(self, size):
+        length = self.board_length or self.board_size
+        self.layout = BoardLayout.for_window(size, length)
+        self.aux_lane_rect = self.aux_lane_rect_for(size)
+        if self.blocks:
+            scale = self.block_scale
+            for block in self.blocks:
+                block.set_size(self.layout.bar_width, scale)
+            self.update_blocks()
+        if self.bar_renderer:
+            from gui.bar_renderer import BarRenderer
+
+            self.bar_renderer = BarRenderer(
+                self.layout.rect, self.colors, self.background, max(self.board)
+            )
+        if self.arrow_sprite:
+            self.update_arrow_display()
+        # The footer rows sit below the board, which moves with the window.
+        if self.speed_sprite:
+            self.update_speed_display()
+        if self.counts_sprite:
+            self.update_counts_display()
+        if self.timeline:
+            self.create_timeline()
+        self.full_redraw = True
 
     def start_up_creation(self, text):
+        for button in self.alg_buttons:
+            self.dispatcher.remove(button)
         self.create_board()
         self.create_blocks()
         self.create_index_display()
@@ -212,25 +751,79 @@ class Screen:
         self.set_sorting_method(text)
         self.create_algorithm_info_display()
         self.create_next_button()
+        self.create_timeline()
+        self.update_speed_display()
+        self.update_counts_display()
         self.alg_button_pressed = True
         self.blocks_created = True
+        self.full_redraw = True
 
     def draw_sprites(self):
+        if self.bar_renderer:
+            if self.scrub_position is None:
+                model = self.sort_method.model
+            else:
+                model = self.trace.cursor
+            self.window.blit(self.bar_renderer.render(model), self.bar_renderer.rect)
         self.block_sprites.draw(self.window)
+        self.draw_highlight()
         self.index_sprite.draw(self.window)
         self.arrow_sprite.draw(self.window)
+        if self.timeline:
+            self.timeline.draw()
+        self.speed_sprite.draw(self.window)
+        self.counts_sprite.draw(self.window)
+        self.draw_aux_lanes()
+
+    def draw_aux_lanes(self):
+        if not self.sort_method or not self.sort_method.aux_lanes:
+            return
+        lanes = self.sort_method.aux_lanes
+        area = self.aux_lane_rect
+        lane_height = area.height // len(lanes)
+        for k, lane in enumerate(lanes.values()):
+            if not len(lane):
+                continue
+            top = area.top + k * lane_height
+            columns = min(len(lane), area.width)
+            bar_width = max(area.width // columns, 1)
+            scale = (lane_height - 4) / max(max(lane), 1)
+            for column in range(columns):
+                value = lane[column * len(lane) // columns]
+                if value:
+                    height = max(int(value * scale), 1)
+                    pygame.draw.rect(
+                        self.window,
+                        self.aux_lane_color,
+                        (area.left + column * bar_width, top, bar_width - 1 or 1, height),
+                    )
 
     def cleanup(self):
+        self.stop_worker()
         self.window.fill(self.background)
-        self.block_sprites.empty()
-        self.index_sprite.empty()
-        self.arrow_sprite.empty()
-        self.algorithm_info.empty()
+        self.block_pool.release_group(self.block_sprites)
+        self.text_pool.release_group(self.index_sprite)
+        self.text_pool.release_group(self.arrow_sprite)
+        self.text_pool.release_group(self.algorithm_info)
         self.blocks = []
+        self.bar_renderer = None
+        self.trace = None
+        self.timeline = None
+        self.scrub_position = None
+        self.pass_target = None
+        self.autoplayer.stop()
+        self.text_pool.release_group(self.speed_sprite)
+        self.text_pool.release_group(self.counts_sprite)
+        self.highlight = ()
         self.index = 0
         self.shown_alg_info = False
         self.complete = False
         self.blocks_created = False
         self.alg_button_pressed = False
+        if self.next_button is not None:
+            self.dispatcher.remove(self.next_button)
+        for button in self.alg_buttons:
+            self.dispatcher.add(button)
         self.pause_game = False
         self.extra_loop = False
+        self.full_redraw = True
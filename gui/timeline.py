@@ -0,0 +1,43 @@
+import pygame
+
+
+class Timeline:
+    def __init__(self, pos, width, height, window):
+        self.pos = pos
+        self.width = width
+        self.height = height
+        self.window = window
+
+        self.track_color = (225, 215, 198)
+        self.fill_color = (87, 155, 177)
+        self.handle_color = (0, 0, 0)
+
+        self.rect = pygame.Rect(self.pos, (self.width, self.height))
+        self.length = 0
+        self.position = 0
+        self.dragging = False
+
+    def set_range(self, length, position):
+        self.length = max(length, 0)
+        self.position = max(0, min(position, self.length))
+
+    def position_at(self, x):
+        if not self.length:
+            return 0
+        fraction = (x - self.rect.left) / max(self.rect.width - 1, 1)
+        return round(max(0.0, min(fraction, 1.0)) * self.length)
+
+    def handle_x(self):
+        if not self.length:
+            return self.rect.left
+        return self.rect.left + round(
+            self.position / self.length * (self.rect.width - 1)
+        )
+
+    def draw(self):
+        pygame.draw.rect(self.window, self.track_color, self.rect, border_radius=6)
+        filled = pygame.Rect(self.rect.topleft, (self.handle_x() - self.rect.left, self.height))
+        pygame.draw.rect(self.window, self.fill_color, filled, border_radius=6)
+        handle = pygame.Rect(0, self.rect.top - 4, 6, self.height + 8)
+        handle.centerx = self.handle_x()
+        pygame.draw.rect(self.window, self.handle_color, handle)
@@ -1,11 +1,116 @@
-import pygame
-from gui.screen import Screen
+import argparse
 
+from algorithms.datasets import DISTRIBUTIONS
+from algorithms.registry import registry
+from gui.profiler import StartupTimer
 
-def main():
-    pygame.init()
-    screen = Screen()
-    screen.start()
+
+def init_pygame():
+    import pygame
+
+    # Only the subsystems the app uses. pygame.init() would also open the
+    # audio device and scan for joysticks, which slows every cold start.
+    pygame.display.init()
+    pygame.font.init()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sorting algorithm visualizer")
+    parser.add_argument(
+        "--size", type=int, default=9, help="Number of elements on the board."
+    )
+    parser.add_argument(
+        "--worker",
+        choices=["thread", "process"],
+        default=None,
+        help="Run the algorithm in a background thread or process.",
+    )
+    parser.add_argument(
+        "--race",
+        default=None,
+        help="Comma separated algorithms to race side by side, e.g. merge,quick,heap.",
+    )
+    parser.add_argument(
+        "--replay",
+        nargs="+",
+        default=None,
+        help="Play back one or more .svtr trace files saved with the S key.",
+    )
+    parser.add_argument(
+        "--distribution",
+        choices=list(DISTRIBUTIONS),
+        default="random",
+        help="How the starting board is generated.",
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--pivot", default=None, help="QuickSort pivot strategy, e.g. median3."
+    )
+    parser.add_argument(
+        "--gaps", default=None, help="ShellSort gap sequence, e.g. knuth."
+    )
+    parser.add_argument(
+        "--count-ops",
+        action="store_true",
+        help="Count comparisons, swaps, reads and writes below the board (slower).",
+    )
+    parser.add_argument(
+        "--measure-startup",
+        action="store_true",
+        help="Show the first frame, print how long each startup phase took and exit.",
+    )
+    args = parser.parse_args(argv)
+    names = []
+    if args.race:
+        names = [name.strip() for name in args.race.split(",") if name.strip()]
+        for name in names:
+            if name not in registry.keys():
+                parser.error(f"unknown algorithm {name!r}")
+    # The sort classes are imported only to check a choice that was made.
+    if args.pivot and args.pivot not in registry.load("quick").pivots:
+        parser.error(f"unknown pivot strategy {args.pivot!r}")
+    if args.gaps and args.gaps not in registry.load("shell").gap_sequences:
+        parser.error(f"unknown gap sequence {args.gaps!r}")
+    options = {"pivot": args.pivot, "gaps": args.gaps}
+    startup = StartupTimer()
+    # The window modules pull in pygame, so only the one for this mode is
+    # imported, and only once the arguments are known to be valid.
+    if args.replay or args.race:
+        from gui.race import RaceScreen
+    else:
+        from gui.screen import Screen
+    startup.mark("imports")
+    init_pygame()
+    startup.mark("init")
+    if args.replay:
+        from algorithms.trace_file import TraceFile
+
+        traces = [TraceFile(path) for path in args.replay]
+        screen = RaceScreen(traces=[(t.algorithm_name, t) for t in traces])
+    elif args.race:
+        algorithms = [(name, registry.load(name)) for name in names]
+        screen = RaceScreen(
+            algorithms,
+            board_size=args.size,
+            seed=args.seed,
+            distribution=args.distribution,
+            options=options,
+        )
+    else:
+        screen = Screen(
+            board_size=args.size,
+            worker_mode=args.worker,
+            seed=args.seed,
+            distribution=args.distribution,
+            options=options,
+            count_ops=args.count_ops,
+        )
+    startup.mark("window")
+    if args.measure_startup:
+        screen.start(startup)
+        print(startup.report())
+    else:
+        screen.start()
 
 
 if __name__ == "__main__":
@@ -1,15 +1,35 @@
 import pygame
 
+from gui.pool import surfaces
+
 
 class BlockSprite(pygame.sprite.Sprite):
-    def __init__(self, x_pos, value, color):
+    """One bar of the board.
+
+    ``height`` is the element's value, which is what the algorithms compare;
+    the bar is drawn ``value * scale`` pixels tall, so a board of any range
+    fits the layout.
+    """
+
+    def __init__(self, x_pos, value, color, width=75, scale=1.0):
         super().__init__()
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x_pos, value, color, width, scale)
+
+    def reset(self, x_pos, value, color, width=75, scale=1.0):
         self.x = x_pos
         self.y = 50
-        self.width = 75
         self.height = value
-        self.image = pygame.Surface([self.width, self.height])
         self.color = color
-        self.image.fill(self.color)
-        self.rect = self.image.get_rect()
+        self.width = None
+        self.set_size(width, scale)
         self.rect.topleft = [self.x, self.y]
+
+    def set_size(self, width, scale):
+        bar_height = max(round(self.height * scale), 1)
+        if (width, bar_height) == (self.width, self.rect.height):
+            return
+        self.width = width
+        # The surface is shared with every block of the same size and color.
+        self.image = surfaces.get(self.width, bar_height, self.color)
+        self.rect.size = (self.width, bar_height)
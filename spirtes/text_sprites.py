@@ -1,21 +1,29 @@
 import pygame
 
+from gui.fonts import get_font, render_text
+
 
 class TextSprite(pygame.sprite.Sprite):
     def __init__(
         self, text: str, size: int, color: tuple[int, int, int], x: int, y: int
     ):
         super().__init__()
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(text, size, color, x, y)
+
+    def reset(self, text, size, color, x, y):
         self.color = color
-        self.font = pygame.font.SysFont("segoeui", size)
+        self.font = get_font(size)
         self.text = text
         self.x = x
         self.y = y
-        self.image = self.font.render(str(self.text), True, self.color)
-        self.rect = self.image.get_rect()
+        self.size = size
+        self.image = render_text(str(self.text), self.size, self.color)
+        self.rect.size = self.image.get_size()
         self.rect.topleft = [self.x, self.y]
 
     def update_text(self, text):
         self.text = text
-        self.image = self.font.render(str(self.text), True, self.color)
+        self.image = render_text(str(self.text), self.size, self.color)
+        self.rect = self.image.get_rect()
         self.rect.topleft = [self.x, self.y]
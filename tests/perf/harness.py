@@ -0,0 +1,89 @@
+import json
+import os
+import platform
+from time import perf_counter
+
+BASELINES = os.path.join(os.path.dirname(__file__), "baselines.json")
+ENABLED = bool(os.environ.get("SORTVIS_PERF"))
+UPDATE = bool(os.environ.get("SORTVIS_PERF_UPDATE"))
+TOLERANCE = float(os.environ.get("SORTVIS_PERF_TOLERANCE", "0.25"))
+
+
+def best_time(function, repeats=5):
+    best = float("inf")
+    for _ in range(repeats):
+        start = perf_counter()
+        function()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def reference_workload():
+    # Plain interpreter work (indexing, comparisons, swaps on a list), close
+    # to what the algorithms do, so the ratio to it carries across machines.
+    values = list(range(2000, 0, -1))
+    for i in range(len(values) - 1):
+        for j in range(i + 1, min(i + 50, len(values))):
+            if values[j] < values[i]:
+                values[i], values[j] = values[j], values[i]
+
+
+_calibration = None
+
+
+def calibration():
+    """Seconds one reference workload takes on this machine."""
+    global _calibration
+    if _calibration is None:
+        _calibration = best_time(reference_workload, repeats=7)
+    return _calibration
+
+
+def relative(seconds):
+    return seconds / calibration()
+
+
+class Baselines:
+    """Relative costs from baselines.json, checked against new measurements.
+
+    Every metric is a cost (lower is better) divided by the calibration
+    time. A measurement fails when it exceeds its baseline by more than
+    ``TOLERANCE``. With ``SORTVIS_PERF_UPDATE`` set, measurements are
+    written back instead of checked.
+    """
+
+    def __init__(self, path=BASELINES):
+        self.path = path
+        try:
+            with open(path) as f:
+                self.data = json.load(f)
+        except FileNotFoundError:
+            self.data = {"metrics": {}}
+        self.measured = {}
+
+    def check(self, name, cost):
+        self.measured[name] = cost
+        baseline = self.data["metrics"].get(name)
+        if UPDATE or baseline is None:
+            return None
+        limit = baseline * (1 + TOLERANCE)
+        if cost > limit:
+            return (
+                f"{name}: {cost:.4g} is {cost / baseline - 1:.0%} slower than the "
+                f"baseline {baseline:.4g} (tolerance {TOLERANCE:.0%})"
+            )
+        return None
+
+    def save(self):
+        if not UPDATE or not self.measured:
+            return
+        self.data["metrics"].update(
+            {name: round(cost, 6) for name, cost in sorted(self.measured.items())}
+        )
+        self.data["recorded_with"] = {
+            "python": platform.python_version(),
+            "calibration_seconds": round(calibration(), 6),
+        }
+        with open(self.path, "w") as f:
+            json.dump(self.data, f, indent=2, sort_keys=True)
+            f.write("\n")
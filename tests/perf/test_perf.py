@@ -0,0 +1,90 @@
+import os
+import unittest
+
+from algorithms.datasets import generate
+from algorithms.model import BoardModel
+from algorithms.registry import registry
+from tests.perf.harness import ENABLED, Baselines, best_time, relative
+
+baselines = Baselines() if ENABLED else None
+
+
+def tearDownModule():
+    if baselines is not None:
+        baselines.save()
+
+
+@unittest.skipUnless(ENABLED, "set SORTVIS_PERF=1 to run the performance suite")
+class TestStepThroughput(unittest.TestCase):
+    size = 2000
+    steps = 100_000
+
+    def measure(self, cls):
+        values = generate("random", self.size, 0)
+        taken = [0]
+
+        def run():
+            step = cls(BoardModel(values)).step
+            count = 0
+            while count < self.steps and step() is not None:
+                count += 1
+            taken[0] = count
+
+        seconds = best_time(run)
+        return relative(seconds) * self.steps / taken[0]
+
+    def test_algorithms(self):
+        failures = []
+        for spec in registry.specs():
+            name = spec.key
+            with self.subTest(algorithm=name):
+                failure = baselines.check(f"steps/{name}", self.measure(spec.load()))
+                if failure:
+                    failures.append(failure)
+        assert not failures, "\n".join(failures)
+
+
+@unittest.skipUnless(ENABLED, "set SORTVIS_PERF=1 to run the performance suite")
+class TestFrameTime(unittest.TestCase):
+    sizes = (9, 100, 1000)
+    frames = 60
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        import pygame
+
+        pygame.init()
+
+    def measure(self, size):
+        from gui.screen import Screen
+
+        screen = Screen(board_size=size, seed=0)
+        screen.start_up_creation("Bubble Sort")
+        screen.shown_alg_info = True
+
+        def run():
+            for _ in range(self.frames):
+                screen.sort_method.step()
+                screen.sync_to_sorter()
+                screen.full_redraw = True
+                screen.render()
+
+        try:
+            seconds = best_time(run, repeats=3)
+        finally:
+            screen.cleanup()
+        return relative(seconds) / self.frames
+
+    def test_draw_path(self):
+        failures = []
+        for size in self.sizes:
+            with self.subTest(size=size):
+                failure = baselines.check(f"frame/{size}", self.measure(size))
+                if failure:
+                    failures.append(failure)
+        assert not failures, "\n".join(failures)
+
+
+if __name__ == "__main__":
+    unittest.main()
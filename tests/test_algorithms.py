@@ -1,6 +1,21 @@
 import unittest
 
-from algorithms.algorithms import InsertionSort, SelectionSort, BubbleSort
+from algorithms.algorithms import (
+    InsertionSort,
+    SelectionSort,
+    BubbleSort,
+    MergeSort,
+    QuickSort,
+    HeapSort,
+    ShellSort,
+    CountingSort,
+    LSDRadixSort,
+    MSDRadixSort,
+    BucketSort,
+)
+from algorithms.counting import CountingArray
+from algorithms.model import BoardModel
+from algorithms.steps import Op
 from spirtes.block_sprites import BlockSprite
 
 
@@ -272,5 +287,286 @@ class TestBubbleSort(unittest.TestCase):
         assert self.sorter.algorithm_info() == expected_output
 
 
+class TestStepEngine(unittest.TestCase):
+    def setUp(self):
+        self.block_values = [201, 101, 301, 51, 1, 151, 401, 351, 251]
+
+    def make_blocks(self):
+        return [BlockSprite(0, h, (0, 0, 0)) for h in self.block_values]
+
+    def test_advance_granularity(self):
+        sorter = BubbleSort(BoardModel(self.block_values))
+        step = sorter.advance("comparison")
+        assert step.op is Op.COMPARE and sorter.position == 1
+        step = sorter.advance("swap")
+        assert step.op is Op.SWAP and (step.i, step.j) == (0, 1)
+        assert sorter.position == 2
+        step = sorter.advance("pass")
+        assert step.op is Op.PASS and sorter.counter == 1
+        counting = CountingSort(BoardModel(self.block_values))
+        assert counting.advance("comparison").op is Op.PASS
+        while counting.advance("comparison") is not None:
+            pass
+        assert counting.finished
+        with self.assertRaises(KeyError):
+            sorter.advance("block")
+
+    def test_step_yields_typed_operations(self):
+        sorter = BubbleSort(self.make_blocks())
+        step = sorter.step()
+        assert step.op is Op.COMPARE
+        assert (step.i, step.j) == (0, 1)
+        step = sorter.step()
+        assert step.op is Op.SWAP
+        assert [b.height for b in sorter.blocks][:2] == [101, 201]
+
+    def test_steps_run_to_completion(self):
+        for sort_class in (InsertionSort, SelectionSort, BubbleSort):
+            sorter = sort_class(self.make_blocks())
+            while sorter.step() is not None:
+                pass
+            assert sorter.finished is True
+            assert sorter.done is True
+            assert sorter.counter == len(self.block_values)
+            assert [b.height for b in sorter.blocks] == sorted(self.block_values)
+
+    def test_pass_boundaries_match_sort_calls(self):
+        for sort_class in (InsertionSort, SelectionSort, BubbleSort):
+            stepped = sort_class(self.make_blocks())
+            called = sort_class(self.make_blocks())
+            for _ in range(4):
+                step = stepped.step()
+                while step.op is not Op.PASS:
+                    step = stepped.step()
+                called.sort()
+            assert stepped.counter == called.counter == 4
+            assert [b.height for b in stepped.blocks] == [
+                b.height for b in called.blocks
+            ]
+
+    def test_insertion_sort_writes(self):
+        sorter = InsertionSort(self.make_blocks())
+        ops = []
+        while (step := sorter.step()) is not None:
+            ops.append(step.op)
+        assert Op.WRITE in ops
+        assert Op.SWAP not in ops
+
+
+class TestLogLinearSorts(unittest.TestCase):
+    def setUp(self):
+        self.block_values = [201, 101, 301, 51, 1, 151, 401, 351, 251]
+        self.COMPLETED_SORT = [1, 51, 101, 151, 201, 251, 301, 351, 401]
+
+    def make_sorters(self):
+        yield MergeSort(BoardModel(self.block_values))
+        yield HeapSort(BoardModel(self.block_values))
+        for pivot in QuickSort.pivots:
+            yield QuickSort(BoardModel(self.block_values), pivot=pivot, seed=1)
+        for gaps in ShellSort.gap_sequences:
+            yield ShellSort(BoardModel(self.block_values), gaps=gaps)
+
+    def test_sort_until_done(self):
+        for sorter in self.make_sorters():
+            calls = 0
+            while not sorter.done:
+                sorter.sort()
+                calls += 1
+            assert sorter.blocks == self.COMPLETED_SORT
+            assert calls <= len(self.block_values) + 1
+
+    def test_sort_with_blocks(self):
+        blocks = [BlockSprite(0, h, (0, 0, 0)) for h in self.block_values]
+        sorter = MergeSort(blocks)
+        while not sorter.done:
+            sorter.sort()
+        assert [b.height for b in sorter.blocks] == self.COMPLETED_SORT
+        assert set(sorter.blocks) == set(blocks)
+
+    def test_sort_duplicates_and_edge_sizes(self):
+        for values in ([], [5], [2, 1], [3, 2, 1, 2, 3, 3, 1]):
+            self.block_values = values
+            for sorter in self.make_sorters():
+                while sorter.step() is not None:
+                    pass
+                assert sorter.blocks == sorted(values)
+
+    def test_merge_sort_is_stable(self):
+        values = [2, 1, 2, 1, 2]
+        model = BoardModel(values)
+        sorter = MergeSort(model)
+        while sorter.step() is not None:
+            pass
+        assert list(model.order) == [1, 3, 0, 2, 4]
+
+    def test_merge_sort_aux_buffer(self):
+        sorter = MergeSort(BoardModel(self.block_values))
+        step = sorter.step()
+        assert step.op is Op.AUX_WRITE
+        assert list(sorter.aux_lanes) == ["Buffer"]
+        assert sorter.aux_lanes["Buffer"][0] == 201
+
+    def test_shell_sort_gaps(self):
+        values = list(range(100))
+        assert ShellSort(BoardModel(values), gaps="shell").gaps() == [
+            50, 25, 12, 6, 3, 1
+        ]
+        assert ShellSort(BoardModel(values), gaps="knuth").gaps() == [40, 13, 4, 1]
+        assert ShellSort(BoardModel(values), gaps="hibbard").gaps() == [
+            63, 31, 15, 7, 3, 1
+        ]
+        assert ShellSort(BoardModel(values), gaps="ciura").gaps() == [57, 23, 10, 4, 1]
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            QuickSort([], pivot="best")
+        with self.assertRaises(ValueError):
+            ShellSort([], gaps="fibonacci")
+
+    def test_select_options(self):
+        options = {"pivot": "median3", "gaps": "knuth", "colour": "red"}
+        assert QuickSort.select_options(options) == {"pivot": "median3"}
+        assert ShellSort.select_options(options) == {"gaps": "knuth"}
+        assert MergeSort.select_options(options) == {}
+        assert QuickSort.select_options({"pivot": None}) == {}
+        assert QuickSort.select_options(None) == {}
+
+    def test_algorithm_info(self):
+        for sort_class in (MergeSort, QuickSort, HeapSort, ShellSort):
+            info = sort_class.algorithm_info()
+            assert any(line.startswith("Time complexity") for line in info)
+            assert any(line.startswith("Space Complexity") for line in info)
+
+
+class TestOpCounts(unittest.TestCase):
+    classes = [
+        InsertionSort,
+        SelectionSort,
+        BubbleSort,
+        MergeSort,
+        QuickSort,
+        HeapSort,
+        ShellSort,
+    ]
+
+    def run_to_end(self, sorter):
+        while sorter.step() is not None:
+            pass
+        return sorter
+
+    def test_off_by_default(self):
+        sorter = BubbleSort(BoardModel([3, 1, 2]))
+        assert sorter.counts is None
+        assert sorter.values is sorter.model.values
+
+    def test_bubble_sort_counts(self):
+        sorter = self.run_to_end(
+            BubbleSort(BoardModel(range(10, 0, -1)), count_ops=True)
+        )
+        assert isinstance(sorter.values, CountingArray)
+        assert sorter.counts.as_dict() == {
+            "reads": 180,
+            "writes": 90,
+            "comparisons": 45,
+            "swaps": 45,
+        }
+
+    def test_counting_does_not_change_the_run(self):
+        values = [201, 101, 301, 51, 1, 151, 401, 351, 251, 101]
+        for cls in self.classes:
+            plain = cls(BoardModel(values))
+            counted = cls(BoardModel(values), count_ops=True)
+            steps = []
+            while (step := plain.step()) is not None:
+                steps.append(step)
+            counted_steps = []
+            while (step := counted.step()) is not None:
+                counted_steps.append(step)
+            assert counted_steps == steps
+            ops = [step.op for step in steps]
+            assert counted.counts.comparisons == ops.count(Op.COMPARE)
+            assert counted.counts.swaps == ops.count(Op.SWAP)
+            assert counted.counts.reads > 0
+            assert counted.model.is_sorted()
+
+    def test_merge_sort_counts_buffer_writes(self):
+        sorter = self.run_to_end(MergeSort(BoardModel([4, 3, 2, 1]), count_ops=True))
+        # Two levels of merging, each copying every element to the buffer
+        # and back.
+        assert sorter.counts.writes == 16
+        assert sorter.counts.swaps == 0
+
+
+class TestDistributionSorts(unittest.TestCase):
+    def setUp(self):
+        self.block_values = [201, 101, 301, 51, 1, 151, 401, 351, 251, 101, 0]
+
+    def make_sorters(self, values):
+        yield CountingSort(BoardModel(values))
+        yield BucketSort(BoardModel(values))
+        yield BucketSort(BoardModel(values), buckets=1)
+        for radix in (2, 10, 256):
+            yield LSDRadixSort(BoardModel(values), radix=radix)
+            yield MSDRadixSort(BoardModel(values), radix=radix)
+
+    def test_sorts_stably(self):
+        for values in (self.block_values, [7, 7, 7, 3], [5], []):
+            for sorter in self.make_sorters(values):
+                while not sorter.done:
+                    sorter.sort()
+                assert list(sorter.model.values) == sorted(values)
+                order = sorter.model.order
+                for a, b in zip(order, order[1:]):
+                    if values[a] == values[b]:
+                        assert a < b
+
+    def test_steps_replay_onto_a_copy(self):
+        for sorter in self.make_sorters(self.block_values):
+            replay = BoardModel(self.block_values)
+            while (step := sorter.step()) is not None:
+                if step.op is Op.WRITE:
+                    replay.write(step.i, step.value)
+                elif step.op is Op.SWAP:
+                    replay.swap(step.i, step.j)
+            assert replay.order == sorter.model.order
+
+    def test_lanes(self):
+        sorter = LSDRadixSort(BoardModel(self.block_values), radix=10)
+        sorter.sort()
+        assert len(sorter.aux_lanes["Buckets"]) == 10
+        assert sum(sorter.aux_lanes["Buckets"]) == len(self.block_values)
+        assert len(sorter.aux_lanes["Buffer"]) == len(self.block_values)
+        counting = CountingSort(BoardModel(self.block_values))
+        counting.sort()
+        assert len(counting.aux_lanes["Buckets"]) == 402
+        assert counting.aux_lanes["Buckets"][101] == 2
+
+    def test_few_passes_are_not_done_early(self):
+        sorter = CountingSort(BoardModel([3, 2, 1]))
+        passes = 0
+        while not sorter.done:
+            sorter.sort()
+            passes += 1
+        assert list(sorter.model.values) == [1, 2, 3]
+        assert sorter.counter == 3
+        assert passes == 4
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            LSDRadixSort(BoardModel([1, 2]), radix=1)
+        with self.assertRaises(ValueError):
+            MSDRadixSort(BoardModel([-1, 2]))
+        with self.assertRaises(ValueError):
+            BucketSort(BoardModel([1, 2]), buckets=0)
+
+    def test_linear_step_count(self):
+        values = list(range(1000, 0, -1))
+        sorter = LSDRadixSort(BoardModel(values), radix=10, count_ops=True)
+        while sorter.step() is not None:
+            pass
+        assert sorter.position == 4 * (3 * len(values) + 3)
+        assert sorter.counts.comparisons == 0
+
+
 if __name__ == "__main__":
     unittest.main()
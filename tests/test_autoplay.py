@@ -0,0 +1,55 @@
+import unittest
+from unittest.mock import patch
+
+from gui.autoplay import AutoPlayer
+
+
+class Counter:
+    def __init__(self, limit=None):
+        self.calls = 0
+        self.limit = limit
+
+    def __call__(self):
+        if self.limit is not None and self.calls >= self.limit:
+            return None
+        self.calls += 1
+        return self.calls
+
+
+class TestAutoPlayer(unittest.TestCase):
+    def test_whole_steps(self):
+        player = AutoPlayer(steps_per_frame=5)
+        step = Counter()
+        assert player.run(step) == 5
+        assert step.calls == 5
+
+    def test_fractional_steps_carry_over(self):
+        player = AutoPlayer(steps_per_frame=0.25)
+        step = Counter()
+        assert [player.run(step) for _ in range(8)] == [0, 0, 0, 1, 0, 0, 0, 1]
+
+    def test_stops_when_finished(self):
+        player = AutoPlayer(steps_per_frame=10)
+        player.toggle()
+        assert player.run(Counter(limit=3)) == 3
+        assert player.playing is False
+
+    def test_frame_budget(self):
+        player = AutoPlayer(steps_per_frame=1000, budget_ms=1)
+        times = iter(range(0, 10**6))
+        with patch("gui.autoplay.perf_counter", side_effect=lambda: next(times)):
+            done = player.run(Counter())
+        assert done == 32
+
+    def test_speed_limits(self):
+        player = AutoPlayer(steps_per_frame=1)
+        for _ in range(30):
+            player.faster()
+        assert player.steps_per_frame == AutoPlayer.max_steps_per_frame
+        for _ in range(60):
+            player.slower()
+        assert player.steps_per_frame == AutoPlayer.min_steps_per_frame
+
+
+if __name__ == "__main__":
+    unittest.main()
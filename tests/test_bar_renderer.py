@@ -0,0 +1,44 @@
+import unittest
+
+import pygame
+
+from algorithms.model import BoardModel
+from gui.bar_renderer import BarRenderer
+
+COLORS = [(255, 0, 0), (0, 0, 255)]
+BACKGROUND = (248, 244, 234)
+
+
+@unittest.skipUnless(BarRenderer.available(), "numpy is not installed")
+class TestBarRenderer(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((900, 500))
+
+    def test_render_wide_bars(self):
+        renderer = BarRenderer((0, 0, 100, 100), COLORS, BACKGROUND, 100)
+        surface = renderer.render(BoardModel([50, 100]))
+        assert surface.get_at((10, 10))[:3] == COLORS[0]
+        assert surface.get_at((10, 60))[:3] == BACKGROUND
+        assert surface.get_at((60, 99))[:3] == COLORS[1]
+
+    def test_render_aggregates_columns(self):
+        renderer = BarRenderer((0, 0, 10, 100), COLORS, BACKGROUND, 100)
+        values = [1] * 1000
+        values[5] = 100
+        surface = renderer.render(BoardModel(values))
+        # The tallest value in the first column's range wins.
+        assert surface.get_at((0, 99))[:3] != BACKGROUND
+        assert surface.get_at((1, 99))[:3] == BACKGROUND
+
+    def test_render_follows_model(self):
+        renderer = BarRenderer((0, 0, 100, 100), COLORS, BACKGROUND, 100)
+        model = BoardModel([100, 10])
+        model.swap(0, 1)
+        surface = renderer.render(model)
+        assert surface.get_at((10, 50))[:3] == BACKGROUND
+        assert surface.get_at((60, 50))[:3] == COLORS[0]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import csv
+import io
+import json
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from algorithms import benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_run_one(self):
+        result = benchmark.run_one("bubble", "reversed", 10)
+        assert result.completed is True
+        assert result.comparisons == 45
+        assert result.swaps == 45
+        assert result.steps == 45 + 45 + 10
+
+    def test_run_one_count_ops(self):
+        assert benchmark.run_one("bubble", "reversed", 10).reads is None
+        result = benchmark.run_one("bubble", "reversed", 10, count_ops=True)
+        assert result.comparisons == 45
+        assert result.reads == 180
+        assert result.array_writes == 90
+
+    def test_run_one_time_limit(self):
+        result = benchmark.run_one("selection", "random", 3000, time_limit=0)
+        assert result.completed is False
+        assert result.steps < 3000 * 3000
+
+    def test_run_variants(self):
+        results = benchmark.run(
+            ["quick", "bubble"],
+            ["random"],
+            [50],
+            options={"pivot": ["last", "median3"], "gaps": ["knuth"]},
+        )
+        assert [(r.algorithm, r.variant) for r in results] == [
+            ("quick", "pivot=last"),
+            ("quick", "pivot=median3"),
+            ("bubble", ""),
+        ]
+        assert all(r.completed for r in results)
+        assert results[0].comparisons != results[1].comparisons
+
+    def test_main_gaps(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            benchmark.main(
+                ["--algorithms", "shell", "--sizes", "50", "--gaps", "shell,ciura"]
+            )
+        results = json.loads(out.getvalue())
+        assert [r["variant"] for r in results] == ["gaps=shell", "gaps=ciura"]
+
+    def test_main_rejects_unknown_pivot(self):
+        with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+            benchmark.main(["--pivots", "best"])
+
+    def test_main_json(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            benchmark.main(["--sizes", "9,20", "--algorithms", "insertion"])
+        results = json.loads(out.getvalue())
+        assert [r["size"] for r in results] == [9, 20]
+        assert all(r["completed"] for r in results)
+
+    def test_main_csv(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            benchmark.main(["--sizes", "9", "--format", "csv"])
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        assert [r["algorithm"] for r in rows] == benchmark.registry.keys()
+        assert all(r["completed"] == "True" for r in rows)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,4 @@
 import unittest
-from unittest.mock import patch
 
 import pygame
 from gui.button import Button
@@ -32,40 +31,20 @@ class TestScreen(unittest.TestCase):
         assert isinstance(self.button.text_rect, pygame.Rect)
         assert self.button.clicked is False
 
+    def test_text_rendered_on_first_use(self):
+        button = Button((0, 0), 100, 100, "Lazy", self.test_surface)
+        assert button._text_surf is None
+        button.draw_button()
+        surface = button._text_surf
+        assert surface is not None
+        assert button.text_rect.center == button.top_rect.center
+        button.draw_button()
+        assert button.text_surf is surface
+
     def test_draw_button(self):
         self.button.draw_button()
         assert self.test_surface.get_at((5, 5)) == self.button.button_color
 
-    @patch("pygame.mouse.get_pressed", return_value=[True, False, False])
-    @patch("pygame.mouse.get_pos", return_value=(0, 0))
-    def test_check_button_clicked(self, mock_get_pos, mock_get_pressed):
-        # Create a mock rect that always returns True for collide point
-        mock_rect = MockRect(0, 0, 100, 100)
-        mock_rect._collidepoint_return_value = True
-
-        # Set the top_rect attribute of my_obj to the mock rect
-        self.button.top_rect = mock_rect
-
-        # Call check_button_clicked and assert that it returns True
-        assert self.button.check_button_clicked() is True
-        assert self.button.top_color == self.button.hover_color
-
-        # Set the mock rect to always return False for collide point
-        mock_rect._collidepoint_return_value = False
-
-        # Call check_button_clicked and assert that it returns False
-        assert self.button.check_button_clicked() is False
-        assert self.button.top_color == self.button.button_color
-
-
-class MockRect(pygame.Rect):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._collidepoint_return_value = False
-
-    def collidepoint(self, *args):
-        return self._collidepoint_return_value
-
 
 if __name__ == "__main__":
     unittest.main()
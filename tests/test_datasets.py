@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from algorithms import datasets
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestGenerate(unittest.TestCase):
+    def test_every_distribution(self):
+        for name in datasets.DISTRIBUTIONS:
+            for size in (0, 1, 9, 500):
+                values = datasets.generate(name, size, 3)
+                assert len(values) == size
+                assert all(1 <= value <= max(size, 1) for value in values)
+                assert values == datasets.generate(name, size, 3)
+
+    def test_seed_changes_random_inputs(self):
+        for name in ("random", "nearly-sorted", "uniform", "few-unique", "zipf"):
+            assert datasets.generate(name, 200, 1) != datasets.generate(name, 200, 2)
+
+    def test_shapes(self):
+        assert list(datasets.generate("sorted", 5, 0)) == [1, 2, 3, 4, 5]
+        assert list(datasets.generate("reversed", 5, 0)) == [5, 4, 3, 2, 1]
+        assert sorted(datasets.generate("random", 50, 0)) == list(range(1, 51))
+        nearly = datasets.generate("nearly-sorted", 100, 0)
+        assert sum(v != k + 1 for k, v in enumerate(nearly)) <= 10
+        assert len(set(datasets.generate("few-unique", 1000, 0))) <= 8
+        saw = datasets.generate("sawtooth", 100, 0)
+        assert sum(b < a for a, b in zip(saw, saw[1:])) in (3, 4)
+        zipf = datasets.generate("zipf", 1000, 0)
+        assert zipf.count(1) > zipf.count(2) > zipf.count(50)
+
+    def test_load_without_cache(self):
+        assert list(datasets.load("sorted", 5, 0, None)) == [1, 2, 3, 4, 5]
+        assert datasets.load("random", 50, 1, None) == datasets.generate("random", 50, 1)
+        with self.assertRaises(ValueError):
+            datasets.load("spiral", 5, 0, None)
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            datasets.generate("spiral", 5, 0)
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.directory.name, "cache")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_npy_round_trip(self):
+        path = os.path.join(self.directory.name, "values.npy")
+        values = datasets.generate("uniform", 1000, 4)
+        datasets.write_npy(path, values)
+        with open(path, "rb") as f:
+            header_end = f.read().index(b"\n") + 1
+        assert header_end % 64 == 0
+        assert datasets.read_npy(path) == values
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_reads_the_cache(self):
+        path = os.path.join(self.directory.name, "values.npy")
+        values = datasets.generate("zipf", 100, 4)
+        datasets.write_npy(path, values)
+        assert numpy.load(path).tolist() == list(values)
+
+    def test_large_inputs_are_cached(self):
+        size = datasets.CACHE_MIN_SIZE
+        values = datasets.load("random", size, 7, self.cache_dir)
+        path = datasets.cache_path(self.cache_dir, "random", size, 7)
+        assert os.path.exists(path)
+        with patch.object(datasets, "generate") as generate:
+            assert datasets.load("random", size, 7, self.cache_dir) == values
+            generate.assert_not_called()
+
+    def test_small_and_unseeded_inputs_are_not_cached(self):
+        datasets.load("random", 100, 7, self.cache_dir)
+        datasets.load("random", datasets.CACHE_MIN_SIZE, None, self.cache_dir)
+        assert not os.path.exists(self.cache_dir)
+
+    def test_corrupt_cache_is_regenerated(self):
+        size = datasets.CACHE_MIN_SIZE
+        os.makedirs(self.cache_dir)
+        path = datasets.cache_path(self.cache_dir, "sorted", size, 0)
+        with open(path, "wb") as f:
+            f.write(b"not a dataset")
+        values = datasets.load("sorted", size, 0, self.cache_dir)
+        assert values == datasets.generate("sorted", size, 0)
+        assert datasets.read_npy(path) == values
+
+
+if __name__ == "__main__":
+    unittest.main()
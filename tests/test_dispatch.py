@@ -0,0 +1,66 @@
+import unittest
+
+import pygame
+
+from gui.dispatch import EventDispatcher
+
+
+class Widget:
+    def __init__(self, rect):
+        self.top_rect = pygame.Rect(rect)
+        self.hovered = False
+        self.clicked = False
+
+    def set_hovered(self, hovered):
+        self.hovered = hovered
+
+
+class TestEventDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.dispatcher = EventDispatcher(cell_size=100)
+        self.a = Widget((0, 0, 150, 50))
+        self.b = Widget((300, 300, 50, 50))
+        self.dispatcher.add(self.a)
+        self.dispatcher.add(self.b)
+
+    def test_widget_spans_cells(self):
+        assert self.dispatcher.widget_cells[self.a] == [(0, 0), (1, 0)]
+        assert self.dispatcher.widget_at((120, 10)) is self.a
+        assert self.dispatcher.widget_at((120, 60)) is None
+        assert self.dispatcher.widget_at((320, 320)) is self.b
+
+    def test_topmost_widget_wins(self):
+        top = Widget((10, 10, 20, 20))
+        self.dispatcher.add(top)
+        assert self.dispatcher.widget_at((15, 15)) is top
+        assert self.dispatcher.widget_at((50, 15)) is self.a
+
+    def test_hover_reports_changes_only(self):
+        assert self.dispatcher.hover((10, 10)) == [self.a]
+        assert self.a.hovered is True
+        assert self.dispatcher.hover((20, 10)) == []
+        assert self.dispatcher.hover((320, 320)) == [self.a, self.b]
+        assert self.a.hovered is False
+        assert self.dispatcher.hover((600, 10)) == [self.b]
+
+    def test_press_and_release(self):
+        assert self.dispatcher.press((10, 10)) is self.a
+        assert self.a.clicked is True
+        assert self.dispatcher.release((10, 10)) is self.a
+        assert self.a.clicked is False
+        self.dispatcher.press((10, 10))
+        assert self.dispatcher.release((320, 320)) is None
+        assert self.dispatcher.press((600, 600)) is None
+
+    def test_remove(self):
+        self.dispatcher.hover((10, 10))
+        self.dispatcher.remove(self.a)
+        assert self.a.hovered is False
+        assert self.dispatcher.widget_at((10, 10)) is None
+        assert (0, 0) not in self.dispatcher.cells
+        self.dispatcher.clear()
+        assert self.dispatcher.widget_cells == {}
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from gui.export import Image, export_frames
+
+
+class TestExportFrames(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def export(self, name, **kwargs):
+        output = os.path.join(self.directory.name, name)
+        return export_frames("Bubble Sort", output, seed=4, workers=2, **kwargs)
+
+    def read(self, paths):
+        contents = []
+        for path in paths:
+            with open(path, "rb") as f:
+                contents.append(f.read())
+        return contents
+
+    def test_png_frames_are_reproducible(self):
+        first = self.export("a", every=10)
+        second = self.export("b", every=10)
+        assert len(first) > 2
+        assert all(path.endswith(".png") for path in first)
+        assert self.read(first) == self.read(second)
+        frame = pygame.image.load(first[-1])
+        assert frame.get_size() == (900, 500)
+
+    def test_max_frames(self):
+        assert len(self.export("c", every=1, max_frames=3)) == 3
+
+    @unittest.skipIf(Image is None, "Pillow is not installed")
+    def test_gif(self):
+        gif = os.path.join(self.directory.name, "run.gif")
+        paths = self.export("d", every=20, gif_path=gif)
+        with Image.open(gif) as image:
+            assert image.n_frames == len(paths)
+
+
+if __name__ == "__main__":
+    unittest.main()
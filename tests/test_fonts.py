@@ -0,0 +1,77 @@
+import unittest
+
+import pygame
+
+from gui.fonts import FontRegistry, TextRenderCache, fonts, get_font, text_cache
+from spirtes.text_sprites import TextSprite
+
+
+class TestFontRegistry(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.registry = FontRegistry(maxsize=2)
+
+    def test_get_returns_cached_font(self):
+        font = self.registry.get(20)
+        assert isinstance(font, pygame.font.Font)
+        assert self.registry.get(20) is font
+        assert len(self.registry) == 1
+
+    def test_lru_eviction(self):
+        small = self.registry.get(10)
+        self.registry.get(20)
+        self.registry.get(10)
+        self.registry.get(30)
+        assert len(self.registry) == 2
+        assert self.registry.get(10) is small
+
+    def test_cleared_on_quit(self):
+        self.registry.get(20)
+        pygame.quit()
+        assert len(self.registry) == 0
+        pygame.init()
+        assert self.registry.get(20).render("x", True, (0, 0, 0))
+
+    def test_get_font_uses_shared_registry(self):
+        assert get_font(17) is fonts.get(17)
+
+
+class TestTextRenderCache(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.cache = TextRenderCache(maxsize=2)
+
+    def test_render_hits_and_misses(self):
+        surface = self.cache.render("Index: 1", 30, (0, 0, 0))
+        assert self.cache.render("Index: 1", 30, (0, 0, 0)) is surface
+        assert self.cache.render("Index: 1", 30, (255, 0, 0)) is not surface
+        assert self.cache.hits == 1
+        assert self.cache.misses == 2
+        assert self.cache.hit_rate == 1 / 3
+        assert self.cache.bytes > 0
+
+    def test_lru_eviction(self):
+        first = self.cache.render("a", 20, (0, 0, 0))
+        self.cache.render("b", 20, (0, 0, 0))
+        self.cache.render("a", 20, (0, 0, 0))
+        self.cache.render("c", 20, (0, 0, 0))
+        assert len(self.cache) == 2
+        assert self.cache.render("a", 20, (0, 0, 0)) is first
+        assert self.cache.stats()["entries"] == 2
+
+    def test_byte_limit(self):
+        cache = TextRenderCache(max_bytes=1)
+        cache.render("a", 20, (0, 0, 0))
+        assert len(cache) == 0
+        assert cache.bytes == 0
+
+    def test_text_sprite_does_not_render_when_cached(self):
+        TextSprite("Complete!", 100, (0, 0, 0), 200, 0)
+        misses = text_cache.misses
+        sprite = TextSprite("Complete!", 100, (0, 0, 0), 200, 0)
+        assert text_cache.misses == misses
+        assert isinstance(sprite.image, pygame.Surface)
+
+
+if __name__ == "__main__":
+    unittest.main()
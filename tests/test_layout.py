@@ -0,0 +1,42 @@
+import unittest
+
+from gui.layout import BoardLayout
+
+
+class TestBoardLayout(unittest.TestCase):
+    def test_nine_elements_match_original_board(self):
+        layout = BoardLayout.for_window((900, 500), 9)
+        assert list(layout.xs) == [75, 150, 225, 300, 375, 450, 525, 600, 675]
+        assert layout.bar_width == 75
+        assert list(layout.arrow_xs) == [x + 25 for x in layout.xs]
+        assert layout.aggregated is False
+
+    def test_small_boards_keep_maximum_width(self):
+        layout = BoardLayout.for_window((900, 500), 3)
+        assert list(layout.xs) == [75, 150, 225]
+        assert layout.bar_width == 75
+
+    def test_bars_fill_the_board(self):
+        layout = BoardLayout.for_window((900, 500), 100)
+        assert layout.bar_width == 6
+        assert layout.xs[0] == 75
+        assert layout.xs[-1] + layout.bar_width <= layout.rect.right
+        gaps = {b - a for a, b in zip(layout.xs, layout.xs[1:])}
+        assert gaps == {6, 7}
+
+    def test_aggregated(self):
+        layout = BoardLayout.for_window((900, 500), 2000)
+        assert layout.aggregated is True
+        assert layout.bar_width == 1
+        assert layout.xs[0] == layout.xs[1] == 75
+        assert layout.xs[-1] == layout.rect.right - 1
+
+    def test_window_size(self):
+        layout = BoardLayout.for_window((1200, 700), 9)
+        assert layout.rect == (75, 50, 975, 560)
+        assert layout.arrow_x(100) == layout.arrow_xs[-1]
+        assert layout.arrow_x(-1) == layout.arrow_xs[0]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+import pygame
+
+from gui.lru import BoundedLRU
+
+
+class TestBoundedLRU(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+
+    def test_evicts_least_recently_used(self):
+        cache = BoundedLRU(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+
+    def test_byte_budget(self):
+        cache = BoundedLRU(maxsize=10, max_bytes=5, sizeof=len)
+        cache.put("a", "xxx")
+        cache.put("b", "yy")
+        assert cache.bytes == 5
+        cache.put("c", "z")
+        assert cache.get("a") is None
+        assert cache.bytes == 3
+        cache.put("d", "too large")
+        assert len(cache) == 0
+        assert cache.bytes == 0
+
+    def test_cleared_on_quit(self):
+        cache = BoundedLRU(maxsize=2)
+        cache.put("a", 1)
+        pygame.quit()
+        assert len(cache) == 0
+        pygame.init()
+        cache.put("a", 1)
+        pygame.quit()
+        assert len(cache) == 0
+        pygame.init()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from algorithms.algorithms import BubbleSort, InsertionSort, SelectionSort
+from algorithms.model import BoardModel
+
+
+class TestBoardModel(unittest.TestCase):
+    def setUp(self):
+        self.model = BoardModel([30, 10, 20])
+
+    def test_init(self):
+        assert list(self.model.values) == [30, 10, 20]
+        assert list(self.model.order) == [0, 1, 2]
+        assert list(self.model.initial) == [30, 10, 20]
+        assert len(self.model) == 3
+
+    def test_swap(self):
+        self.model.swap(0, 2)
+        assert list(self.model.values) == [20, 10, 30]
+        assert list(self.model.order) == [2, 1, 0]
+
+    def test_write(self):
+        self.model.write(2, 1)
+        assert list(self.model.values) == [30, 10, 10]
+        assert list(self.model.order) == [0, 1, 1]
+
+    def test_copy(self):
+        copy = self.model.copy()
+        copy.swap(0, 1)
+        assert list(self.model.values) == [30, 10, 20]
+        assert list(copy.values) == [10, 30, 20]
+
+    def test_is_sorted(self):
+        assert self.model.is_sorted() is False
+        assert BoardModel([1, 2, 2, 3]).is_sorted() is True
+
+
+class TestAlgorithmsOnModel(unittest.TestCase):
+    def test_sorts_large_board(self):
+        values = [(i * 7919) % 1000 for i in range(1000)]
+        for sort_class in (InsertionSort, SelectionSort, BubbleSort):
+            model = BoardModel(values)
+            sorter = sort_class(model)
+            while sorter.step() is not None:
+                pass
+            assert list(model.values) == sorted(values)
+            assert [model.initial[e] for e in model.order] == sorted(values)
+            assert sorter.blocks == sorted(values)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+import pygame
+
+from gui.pool import SpritePool, SurfacePool
+from spirtes.block_sprites import BlockSprite
+from spirtes.text_sprites import TextSprite
+
+
+class TestSurfacePool(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+
+    def test_shares_surfaces_by_key(self):
+        pool = SurfacePool()
+        surface = pool.get(10, 20, (255, 0, 0))
+        assert surface.get_size() == (10, 20)
+        assert surface.get_at((5, 5))[:3] == (255, 0, 0)
+        assert pool.get(10, 20, [255, 0, 0]) is surface
+        assert pool.get(10, 21, (255, 0, 0)) is not surface
+        assert len(pool) == 2
+
+    def test_bounded(self):
+        pool = SurfacePool(maxsize=2)
+        first = pool.get(1, 1, (0, 0, 0))
+        pool.get(1, 2, (0, 0, 0))
+        pool.get(1, 3, (0, 0, 0))
+        assert len(pool) == 2
+        assert pool.get(1, 1, (0, 0, 0)) is not first
+        small = SurfacePool(max_bytes=1)
+        small.get(10, 10, (0, 0, 0))
+        assert len(small) == 0
+
+    def test_blocks_share_surfaces(self):
+        a = BlockSprite(0, 30, (1, 2, 3))
+        b = BlockSprite(75, 30, (1, 2, 3), 75)
+        assert a.image is b.image
+        b.set_size(10, 1.0)
+        assert b.image.get_size() == (10, 30)
+        assert b.rect == (75, 50, 10, 30)
+        b.set_size(10, 0.5)
+        assert b.rect == (75, 50, 10, 15)
+        assert b.height == 30
+
+
+class TestSpritePool(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+
+    def test_reuses_released_sprites(self):
+        pool = SpritePool(BlockSprite)
+        group = pygame.sprite.Group()
+        block = pool.acquire(0, 10, (0, 0, 0), 75)
+        rect = block.rect
+        group.add(block)
+        pool.release_group(group)
+        assert len(group) == 0
+        assert len(pool) == 1
+        again = pool.acquire(150, 40, (255, 0, 0), 20)
+        assert again is block
+        assert again.rect is rect
+        assert again.rect == (150, 50, 20, 40)
+        assert again.image.get_at((0, 0))[:3] == (255, 0, 0)
+        assert pool.created == 1
+
+    def test_text_sprites_reset_in_place(self):
+        pool = SpritePool(TextSprite)
+        text = pool.acquire("one", 18, (0, 0, 0), 5, 6)
+        pool.release([text])
+        again = pool.acquire("a longer line", 18, (0, 0, 0), 7, 8)
+        assert again is text
+        assert again.text == "a longer line"
+        assert again.rect.topleft == (7, 8)
+        assert again.rect.size == again.image.get_size()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import csv
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from gui.profiler import FrameProfiler, StartupTimer
+
+
+class TestFrameProfiler(unittest.TestCase):
+    def run_frames(self, profiler, durations, steps=10):
+        # Each frame spends ``duration`` in every phase.
+        clock = [0.0]
+
+        def now():
+            return clock[0]
+
+        with patch("gui.profiler.perf_counter", side_effect=now):
+            for duration in durations:
+                profiler.begin_frame()
+                for phase in profiler.phases:
+                    clock[0] += duration
+                    profiler.mark(phase)
+                profiler.end_frame(steps)
+
+    def test_phases_and_frame_time(self):
+        profiler = FrameProfiler(capacity=4)
+        self.run_frames(profiler, [0.001])
+        assert len(profiler) == 1
+        assert profiler.columns["draw"][0] == 0.001
+        assert abs(profiler.frame_times()[0] - 0.004) < 1e-12
+
+    def test_ring_buffer_keeps_last_frames(self):
+        profiler = FrameProfiler(capacity=3)
+        self.run_frames(profiler, [0.001, 0.002, 0.003, 0.004, 0.005])
+        assert len(profiler) == 3
+        times = [round(t * 1000) for t in profiler.frame_times()]
+        assert times == [12, 16, 20]
+
+    def test_percentiles_and_steps_per_second(self):
+        profiler = FrameProfiler(capacity=100)
+        self.run_frames(profiler, [0.001] * 99 + [0.025])
+        assert round(profiler.percentile(50) * 1000) == 4
+        assert round(profiler.percentile(99) * 1000) == 100
+        assert round(profiler.steps_per_second()) == round(1000 / 0.496)
+        assert FrameProfiler().percentile(50) == 0.0
+        assert FrameProfiler().steps_per_second() == 0.0
+
+    def test_write_csv(self):
+        profiler = FrameProfiler(capacity=2)
+        self.run_frames(profiler, [0.001, 0.002, 0.003])
+        with tempfile.TemporaryDirectory() as directory:
+            path = profiler.write_csv(os.path.join(directory, "profile.csv"))
+            with open(path, newline="") as f:
+                rows = list(csv.reader(f))
+        assert rows[0] == [
+            "events_ms", "step_ms", "draw_ms", "flip_ms", "frame_ms", "steps"
+        ]
+        assert len(rows) == 3
+        assert float(rows[2][0]) == 3.0
+        assert rows[2][-1] == "10"
+
+
+class TestStartupTimer(unittest.TestCase):
+    def test_phases_and_report(self):
+        clock = iter([1.0, 1.25, 1.5, 1.504])
+        with patch("gui.profiler.perf_counter", side_effect=lambda: next(clock)):
+            timer = StartupTimer()
+            timer.mark("imports")
+            timer.mark("init")
+            timer.mark("first frame")
+        assert [name for name, _ in timer.phases] == ["imports", "init", "first frame"]
+        assert round(timer.total, 3) == 0.504
+        assert timer.report().splitlines() == [
+            "imports        250.0 ms",
+            "init           250.0 ms",
+            "first frame      4.0 ms",
+            "total          504.0 ms",
+        ]
+
+
+if __name__ == "__main__":
+    unittest.main()
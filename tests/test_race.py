@@ -0,0 +1,68 @@
+import pickle
+import unittest
+from concurrent.futures import wait
+
+import pygame
+
+from algorithms.algorithms import BubbleSort, HeapSort, MergeSort
+from algorithms.trace import record_trace
+from gui.race import RaceScreen
+
+
+class TestRaceScreen(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.race = RaceScreen(
+            [("bubble", BubbleSort), ("merge", MergeSort), ("heap", HeapSort)],
+            board_size=30,
+            seed=3,
+            workers=2,
+        )
+        wait([lane.future for lane in self.race.lanes])
+
+    def tearDown(self):
+        self.race.shutdown()
+
+    def test_lanes_share_the_board(self):
+        assert len(self.race.lanes) == 3
+        for lane in self.race.lanes:
+            assert lane.poll() is True
+            assert list(lane.trace.initial) == self.race.board
+            assert lane.trace.finished is True
+
+    def test_update_and_draw(self):
+        self.race.autoplayer.steps_per_frame = 50
+        self.race.update()
+        for lane in self.race.lanes:
+            assert lane.position == 50
+            assert 0 < lane.comparisons <= 50
+        self.race.draw()
+        while not self.race.finished:
+            self.race.update()
+        self.race.draw()
+        for lane in self.race.lanes:
+            assert lane.trace.seek(lane.position).is_sorted()
+            assert "done" in lane.status()
+
+    def test_trace_pickles_without_its_generator(self):
+        trace = pickle.loads(pickle.dumps(record_trace(BubbleSort, [3, 1, 2])))
+        assert trace.algorithm is None
+        assert trace.record() == 0
+        assert list(trace.seek(len(trace)).values) == [1, 2, 3]
+
+
+class TestRaceReplay(unittest.TestCase):
+    def test_replay_recorded_traces(self):
+        pygame.init()
+        trace = record_trace(MergeSort, [5, 3, 4, 1, 2])
+        race = RaceScreen(traces=[("merge", trace)])
+        assert race.board == [5, 3, 4, 1, 2]
+        race.autoplayer.steps_per_frame = 1000
+        race.update()
+        race.draw()
+        assert race.finished is True
+        race.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from importlib.metadata import EntryPoint
+from unittest import mock
+
+from algorithms import registry as registry_module
+from algorithms.algorithms import BubbleSort, InsertionSort
+from algorithms.model import BoardModel
+from algorithms.registry import ENTRY_POINT_GROUP, AlgorithmRegistry, AlgorithmSpec
+from algorithms.steps import Op, SortingAlgorithm, Step
+
+
+class GnomeSort(SortingAlgorithm):
+    def steps(self):
+        values, order = self.values, self.model.order
+        position = 0
+        while position < self.block_len:
+            if position == 0:
+                position += 1
+                continue
+            yield Step(Op.COMPARE, position - 1, position)
+            if values[position - 1] <= values[position]:
+                position += 1
+            else:
+                left, right = position - 1, position
+                values[left], values[right] = values[right], values[left]
+                order[left], order[right] = order[right], order[left]
+                yield Step(Op.SWAP, position - 1, position)
+                position -= 1
+        yield Step(Op.PASS, self.block_len - 1)
+
+    @staticmethod
+    def algorithm_info():
+        return ["Gnome sort"]
+
+
+GNOME = AlgorithmSpec(
+    "gnome", "Gnome Sort", f"{__name__}:GnomeSort", True, "O(n^2)", "O(1)"
+)
+
+# Same button name under another key.
+GNOME_AGAIN = AlgorithmSpec(
+    "gnome-2", "Gnome Sort", f"{__name__}:GnomeSort", True, "O(n^2)", "O(1)"
+)
+
+
+def plugin(name, value):
+    return EntryPoint(name, value, ENTRY_POINT_GROUP)
+
+
+class TestAlgorithmRegistry(unittest.TestCase):
+    def make_registry(self, *plugins):
+        registry = AlgorithmRegistry()
+        patcher = mock.patch.object(
+            registry_module, "group_entry_points", return_value=list(plugins)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return registry
+
+    def test_builtins(self):
+        registry = self.make_registry()
+        assert registry.keys()[:3] == ["insertion", "selection", "bubble"]
+        assert len(registry.names()) == 11
+        spec = registry.named("Bubble Sort")
+        assert spec.key == "bubble"
+        assert spec.stable is True
+        assert spec.aux_memory == "O(1)"
+        assert registry.load("bubble") is BubbleSort
+        assert registry.load("insertion").extra_loop is True
+        assert BubbleSort.extra_loop is False
+        with self.assertRaises(KeyError):
+            registry.get("bogo")
+        with self.assertRaises(KeyError):
+            registry.named("Bogo Sort")
+
+    def test_specs_import_lazily(self):
+        # The spec module names the implementation but does not import it.
+        spec_module = (
+            "from algorithms.registry import AlgorithmSpec\n"
+            "LAZY = AlgorithmSpec('lazy', 'Lazy Sort', 'lazy_sort_impl:LazySort',"
+            " True, 'O(n^2)', 'O(1)')\n"
+        )
+        impl_module = "from algorithms.algorithms import BubbleSort as LazySort\n"
+        with tempfile.TemporaryDirectory() as directory:
+            for name, source in (
+                ("lazy_sort_spec", spec_module),
+                ("lazy_sort_impl", impl_module),
+            ):
+                with open(os.path.join(directory, f"{name}.py"), "w") as f:
+                    f.write(source)
+                self.addCleanup(sys.modules.pop, name, None)
+            sys.path.insert(0, directory)
+            self.addCleanup(sys.path.remove, directory)
+            registry = self.make_registry(plugin("lazy", "lazy_sort_spec:LAZY"))
+            spec = registry.named("Lazy Sort")
+            assert not spec.loaded
+            assert "lazy_sort_impl" not in sys.modules
+            assert registry.load("lazy") is BubbleSort
+            assert spec.loaded
+            assert "lazy_sort_impl" in sys.modules
+
+    def test_builtins_load_on_first_use(self):
+        # A fresh interpreter, since this one has imported every sort already.
+        code = (
+            "import sys\n"
+            "import gui.screen, algorithms.worker, algorithms.trace_file\n"
+            "from algorithms.registry import registry\n"
+            "registry.names()\n"
+            "assert 'algorithms.algorithms' not in sys.modules\n"
+            "registry.load('bubble')\n"
+            "assert 'algorithms.algorithms' in sys.modules\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+    def test_discovers_entry_points(self):
+        registry = self.make_registry(
+            plugin("gnome", f"{__name__}:GNOME"),
+            plugin("gnome-2", f"{__name__}:GNOME_AGAIN"),
+        )
+        assert registry.keys()[-1] == "gnome"
+        assert registry.get("gnome") is GNOME
+        # The second spec reuses the button name, so it is rejected.
+        assert [name for name, _ in registry.errors] == ["gnome-2"]
+        sorter = registry.load("gnome")(BoardModel([3, 1, 2]))
+        sorter.sort()
+        assert list(sorter.model.values) == [1, 2, 3]
+
+    def test_class_entry_points_are_rejected(self):
+        registry = self.make_registry(plugin("gnome", f"{__name__}:GnomeSort"))
+        assert "gnome" not in registry.keys()
+        (name, error), = registry.errors
+        assert name == "gnome"
+        assert isinstance(error, TypeError)
+
+    def test_group_entry_points(self):
+        gnome = plugin("gnome", f"{__name__}:GNOME")
+        with mock.patch.object(
+            registry_module,
+            "entry_points",
+            return_value={ENTRY_POINT_GROUP: [gnome], "other": [plugin("x", "y:z")]},
+        ):
+            assert list(registry_module.group_entry_points(ENTRY_POINT_GROUP)) == [
+                gnome
+            ]
+        assert list(registry_module.group_entry_points("no.such.group")) == []
+
+    def test_broken_plugins_are_skipped(self):
+        registry = self.make_registry(
+            plugin("missing", "no_such_module:Sort"),
+            plugin("not-a-sort", "json:loads"),
+            plugin("insertion", f"{__name__}:GnomeSort"),
+        )
+        assert len(registry.specs()) == 11
+        assert [name for name, _ in registry.errors] == [
+            "missing",
+            "not-a-sort",
+            "insertion",
+        ]
+        assert registry.load("insertion") is InsertionSort
+
+    def test_refresh(self):
+        registry = self.make_registry()
+        assert "gnome" not in registry.keys()
+        registry_module.group_entry_points.return_value = [
+            plugin("gnome", f"{__name__}:GNOME")
+        ]
+        assert "gnome" not in registry.keys()
+        registry.refresh()
+        assert "gnome" in registry.keys()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,16 @@
+import os
+import tempfile
+import tracemalloc
 import pygame
 import unittest
 from unittest.mock import patch
+from algorithms.registry import registry
+from gui.profiler import StartupTimer
 from gui.screen import Screen
 from gui.button import Button
 from algorithms.algorithms import BubbleSort, SelectionSort, InsertionSort
+from algorithms.steps import Op
+from algorithms.trace_file import TraceFile
 
 
 class TestScreen(unittest.TestCase):
@@ -116,13 +123,17 @@ class TestScreen(unittest.TestCase):
     def test_create_buttons(self):
         self.screen.create_sorting_buttons()
 
-        assert len(self.screen.alg_buttons) == 3
+        assert len(self.screen.alg_buttons) == len(registry.names())
         assert "Insertion Sort" in self.screen.alg_buttons[0].text
         assert self.screen.alg_buttons[0].pos == (100, 100)
         assert "Selection Sort" in self.screen.alg_buttons[1].text
         assert self.screen.alg_buttons[1].pos == (225, 100)
         assert "Bubble Sort" in self.screen.alg_buttons[2].text
         assert self.screen.alg_buttons[2].pos == (350, 100)
+        assert "Shell Sort" in self.screen.alg_buttons[6].text
+        assert self.screen.alg_buttons[6].pos == (100, 225)
+        for button in self.screen.alg_buttons:
+            assert button.top_rect.right <= self.screen.window.get_width()
 
     def test_create_next_button(self):
         self.screen.create_next_button()
@@ -210,6 +221,15 @@ class TestScreen(unittest.TestCase):
                 assert self.screen.extra_loop is False
             self.screen.extra_loop = False
 
+    def test_set_sorting_method_options(self):
+        screen = Screen(options={"pivot": "median3", "gaps": None})
+        screen.create_board()
+        screen.set_sorting_method("Quick Sort")
+        assert screen.sort_method.pivot == "median3"
+        assert screen.sort_options == {"pivot": "median3"}
+        screen.set_sorting_method("Merge Sort")
+        assert screen.sort_options == {}
+
     def test_event_handler(self):
         self.screen.event_handler()
 
@@ -246,6 +266,14 @@ class TestScreen(unittest.TestCase):
             )
             assert (r, g, b) == arrow_sprite.color
 
+    def test_draw_sprites_on_a_blank_window(self):
+        self.screen.start_up_creation("Bubble Sort")
+        self.screen.window.fill(self.screen.background)
+        self.screen.draw_sprites()
+        for block in self.screen.blocks:
+            r, g, b, _ = self.screen.window.get_at((block.x + 1, block.y))
+            assert (r, g, b) == block.color
+
     def test_cleanup(self):
         self.screen.start_up_creation("Insertion Sort")
         self.screen.cleanup()
@@ -280,16 +308,16 @@ class TestScreen(unittest.TestCase):
 
     def test_event_handler_with_mouse_button_down_insertion_sort(self):
         self.screen.create_sorting_buttons()
-        button_mock = [True, False, False]
+        button = self.screen.alg_buttons[0]
 
         with patch(
             "pygame.event.get",
             return_value=[
                 pygame.event.Event(
-                    pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (100, 100)}
+                    pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": button.top_rect.center}
                 )
             ],
-        ), patch.object(Button, "check_button_clicked", side_effect=button_mock):
+        ):
             assert self.screen.game_running is True
 
             self.screen.event_handler()
@@ -306,16 +334,16 @@ class TestScreen(unittest.TestCase):
 
     def test_event_handler_with_mouse_button_down_selection_sort(self):
         self.screen.create_sorting_buttons()
-        button_mock = [False, True, False]
+        button = self.screen.alg_buttons[1]
 
         with patch(
             "pygame.event.get",
             return_value=[
                 pygame.event.Event(
-                    pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (100, 100)}
+                    pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": button.top_rect.center}
                 )
             ],
-        ), patch.object(Button, "check_button_clicked", side_effect=button_mock):
+        ):
             assert self.screen.game_running is True
             self.screen.event_handler()
             assert self.screen.game_running is True
@@ -331,16 +359,16 @@ class TestScreen(unittest.TestCase):
 
     def test_event_handler_with_mouse_button_down_bubble_sort(self):
         self.screen.create_sorting_buttons()
-        button_mock = [False, False, True]
+        button = self.screen.alg_buttons[2]
 
         with patch(
             "pygame.event.get",
             return_value=[
                 pygame.event.Event(
-                    pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (100, 100)}
+                    pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": button.top_rect.center}
                 )
             ],
-        ), patch.object(Button, "check_button_clicked", side_effect=button_mock):
+        ):
             assert self.screen.game_running is True
             self.screen.event_handler()
             assert self.screen.game_running is True
@@ -357,16 +385,14 @@ class TestScreen(unittest.TestCase):
     def test_event_handler_next_button_shown_alg_info(self):
         self.screen.create_next_button()
 
-        button_mock = [True]
-
         with patch(
             "pygame.event.get",
             return_value=[
                 pygame.event.Event(
-                    pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (100, 100)}
+                    pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (800, 400)}
                 )
             ],
-        ), patch.object(Button, "check_button_clicked", side_effect=button_mock):
+        ):
             # Write a test for self.screen.pause_game
             assert self.screen.game_running is True
             assert self.screen.shown_alg_info is False
@@ -374,6 +400,25 @@ class TestScreen(unittest.TestCase):
             assert self.screen.shown_alg_info is True
             assert self.screen.pause_game is False
 
+    def test_next_button_is_not_clickable_on_the_menu(self):
+        self.screen.create_sorting_buttons()
+        self.screen.start_up_creation("Bubble Sort")
+        self.screen.cleanup()
+        assert self.screen.dispatcher.widget_at((800, 400)) is None
+        with patch(
+            "pygame.event.get",
+            return_value=[
+                pygame.event.Event(
+                    pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (800, 400)}
+                )
+            ],
+        ):
+            self.screen.event_handler()
+        assert self.screen.shown_alg_info is False
+        self.screen.start_up_creation("Bubble Sort")
+        assert self.screen.dispatcher.widget_at((800, 400)) is self.screen.next_button
+        assert self.screen.shown_alg_info is False
+
     def test_event_handler_next_button_alg_button_pressed_check_counter_complete(self):
         # Testing if screen.sort_method.counter >= len(self.blocks) self.complete == True
         self.screen.create_next_button()
@@ -382,21 +427,36 @@ class TestScreen(unittest.TestCase):
         self.screen.create_board()
         self.screen.create_blocks()  # Len of blocks == 9
         self.screen.set_sorting_method("Insertion Sort")
-        button_mock = [True]
-
         with patch(
             "pygame.event.get",
             return_value=[
                 pygame.event.Event(
-                    pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (100, 100)}
+                    pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (800, 400)}
                 )
             ],
-        ), patch.object(Button, "check_button_clicked", side_effect=button_mock):
+        ):
             self.screen.sort_method.counter = 9
             assert self.screen.complete is False
             self.screen.event_handler()
             assert self.screen.complete is True
 
+    def test_only_left_clicks_press_buttons(self):
+        self.screen.create_next_button()
+        self.screen.alg_button_pressed = True
+        self.screen.shown_alg_info = True
+        self.screen.create_board()
+        self.screen.create_blocks()
+        self.screen.set_sorting_method("Bubble Sort")
+        events = [
+            pygame.event.Event(event_type, {"button": button, "pos": (800, 400)})
+            for button in (pygame.BUTTON_RIGHT, pygame.BUTTON_WHEELDOWN)
+            for event_type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+        ]
+        with patch("pygame.event.get", return_value=events):
+            self.screen.event_handler()
+        assert self.screen.sort_method.counter == 0
+        assert self.screen.next_button.clicked is False
+
     def test_event_handler_next_button_and_alg_button_pressed_check_counter_not_completed(
         self,
     ):
@@ -409,16 +469,14 @@ class TestScreen(unittest.TestCase):
         self.screen.create_blocks()
         self.screen.create_index_arrow()
         self.screen.set_sorting_method("Insertion Sort")
-        button_mock = [True]
-
         with patch(
             "pygame.event.get",
             return_value=[
                 pygame.event.Event(
-                    pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (100, 100)}
+                    pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (800, 400)}
                 )
             ],
-        ), patch.object(Button, "check_button_clicked", side_effect=button_mock):
+        ):
             assert self.screen.game_running is True
             assert self.screen.shown_alg_info is True
             assert self.screen.complete is False
@@ -458,16 +516,14 @@ class TestScreen(unittest.TestCase):
         self.screen.sort_method.counter = (
             8  # Setting counter to be larger than the length of self.blocks
         )
-        button_mock = [True]
-
         with patch(
             "pygame.event.get",
             return_value=[
                 pygame.event.Event(
-                    pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (100, 100)}
+                    pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (800, 400)}
                 )
             ],
-        ), patch.object(Button, "check_button_clicked", side_effect=button_mock):
+        ):
             assert self.screen.extra_loop is False
             assert self.screen.complete is False
             self.screen.event_handler()
@@ -489,27 +545,421 @@ class TestScreen(unittest.TestCase):
         self.screen.sort_method.counter = (
             8  # Setting counter to be larger than the length of self.blocks
         )
-        button_mock = [True]
-
         with patch(
             "pygame.event.get",
             return_value=[
                 pygame.event.Event(
-                    pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (100, 100)}
+                    pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (800, 400)}
                 )
             ],
-        ), patch.object(Button, "check_button_clicked", side_effect=button_mock):
+        ):
             assert self.screen.extra_loop is True
             assert self.screen.complete is False
             self.screen.event_handler()
             assert self.screen.complete is False
 
+    def test_update_blocks_marks_moved_blocks_dirty(self):
+        self.screen.create_board()
+        self.screen.create_blocks()
+        self.screen.update_blocks()
+        self.screen.dirty_rects = []
+        self.screen.blocks[0], self.screen.blocks[1] = (
+            self.screen.blocks[1],
+            self.screen.blocks[0],
+        )
+        self.screen.update_blocks()
+        assert len(self.screen.dirty_rects) == 4
+        self.screen.dirty_rects = []
+        self.screen.update_blocks()
+        assert self.screen.dirty_rects == []
+
+    def test_bulk_render_above_threshold(self):
+        self.screen = Screen(board_size=1000)
+        self.screen.start_up_creation("Bubble Sort")
+        assert len(self.screen.board) == 1000
+        assert self.screen.blocks == []
+        assert len(self.screen.block_sprites) == 0
+        if self.screen.bar_renderer is None:
+            self.skipTest("numpy is not installed")
+        self.screen.advance_sort()
+        assert self.screen.sort_method.counter == 1
+        assert self.screen.sort_method.model.values[-1] == max(self.screen.board)
+        self.screen.draw_sprites()
+
+    def test_scrub_timeline(self):
+        self.screen.start_up_creation("Bubble Sort")
+        self.screen.shown_alg_info = True
+        trace = self.screen.trace
+        assert trace.finished is True
+        assert self.screen.timeline.length == len(trace)
+
+        self.screen.scrub_to(self.screen.timeline.rect.right)
+        assert self.screen.scrub_position == len(trace)
+        heights = [block.height for block in self.screen.blocks]
+        assert heights == sorted(heights)
+        assert [block.x for block in self.screen.blocks] == self.screen.pos_list
+
+        self.screen.resume_live()
+        assert self.screen.scrub_position is None
+        assert [b.height for b in self.screen.blocks] == self.screen.board
+
+    def test_autoplay_frame(self):
+        self.screen.start_up_creation("Selection Sort")
+        self.screen.shown_alg_info = True
+        self.screen.toggle_autoplay()
+        assert self.screen.autoplayer.playing is True
+        self.screen.autoplayer.steps_per_frame = 10
+        self.screen.autoplay_frame()
+        assert self.screen.sort_method.position == 10
+        assert self.screen.timeline.position == 10
+
+        self.screen.autoplayer.steps_per_frame = 1000
+        self.screen.autoplay_frame()
+        assert self.screen.autoplayer.playing is False
+        heights = [block.height for block in self.screen.blocks]
+        assert heights == sorted(heights)
+        assert [block.x for block in self.screen.blocks] == self.screen.pos_list
+
+    def test_autoplay_with_worker(self):
+        self.screen = Screen(worker_mode="thread")
+        self.screen.start_up_creation("Bubble Sort")
+        self.screen.shown_alg_info = True
+        self.screen.toggle_autoplay()
+        self.screen.autoplayer.steps_per_frame = 1000
+        while self.screen.autoplayer.playing:
+            self.screen.autoplay_frame()
+        heights = [block.height for block in self.screen.blocks]
+        assert heights == sorted(heights)
+        self.screen.cleanup()
+        assert not self.screen.sort_method.runner.is_alive()
+
+    def test_worker_pass_is_applied_over_frames(self):
+        self.screen = Screen(worker_mode="thread")
+        self.screen.start_up_creation("Bubble Sort")
+        self.screen.shown_alg_info = True
+        click = pygame.event.Event(
+            pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (800, 400)}
+        )
+        clicks = 0
+        with patch("pygame.event.get", return_value=[click]):
+            while not self.screen.complete:
+                self.screen.event_handler()
+                clicks += 1
+                with patch.object(self.screen.sort_method, "advance") as advance:
+                    while self.screen.pass_target is not None:
+                        self.screen.pass_frame()
+                advance.assert_not_called()
+        assert clicks == self.screen.board_length
+        heights = [block.height for block in self.screen.blocks]
+        assert heights == sorted(heights)
+        self.screen.cleanup()
+
+    def test_autoplay_needs_a_run(self):
+        self.screen.toggle_autoplay()
+        assert self.screen.autoplayer.playing is False
+
+    def test_board_larger_than_nine(self):
+        self.screen = Screen(board_size=20, seed=3)
+        self.screen.start_up_creation("Bubble Sort")
+        assert len(self.screen.blocks) == 20
+        assert self.screen.blocks[0].width == 33
+        assert self.screen.pos_list == list(self.screen.layout.xs)
+        self.screen.index = 18
+        self.screen.update_index_display()
+        self.screen.update_index_display()
+        assert self.screen.index == 19
+        self.screen.update_arrow_display()
+        assert self.screen.arrow_sprite.sprite.x == self.screen.layout.arrow_xs[19]
+
+    def test_resize(self):
+        self.screen.start_up_creation("Bubble Sort")
+        self.screen.resize((1200, 600))
+        assert self.screen.layout.rect.width == 975
+        assert self.screen.aux_lane_rect.left == 1060
+        assert [block.x for block in self.screen.blocks] == self.screen.pos_list
+        assert self.screen.blocks[0].width == 75
+        self.screen.resize((450, 500))
+        assert self.screen.blocks[0].width == 25
+        assert self.screen.blocks[0].rect.width == 25
+        assert self.screen.full_redraw is True
+
+    def test_blocks_fit_above_the_footer(self):
+        self.screen.count_ops = True
+        self.screen.start_up_creation("Bubble Sort")
+        for size in ((900, 500), (1200, 700)):
+            self.screen.resize(size)
+            board = self.screen.layout.rect
+            blocks = [block.rect for block in self.screen.blocks]
+            assert max(rect.bottom for rect in blocks) == board.bottom
+            assert all(board.contains(rect) for rect in blocks)
+            rows = [sprite.rect for sprite in self.screen.counts_sprite]
+            rows += [sprite.rect for sprite in self.screen.speed_sprite]
+            rows.append(self.screen.timeline.rect)
+            assert all(row.top >= board.bottom for row in rows)
+            assert all(row.bottom <= size[1] for row in rows)
+
+    def test_profile_overlay_and_dump(self):
+        with patch(
+            "pygame.event.get",
+            return_value=[pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_F3})],
+        ):
+            self.screen.event_handler()
+        assert self.screen.show_profile is True
+        assert len(self.screen.profile_lines) == 2
+        assert self.screen.profile_rect in self.screen.dirty_rects
+        self.screen.window.fill(self.screen.background)
+        self.screen.draw_frame()
+        r, g, b, _ = self.screen.window.get_at(self.screen.profile_rect.topleft)
+        assert (r, g, b) == (225, 215, 198)
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.screen.dump_profile(os.path.join(directory, "p.csv"))
+            assert os.path.exists(path)
+
+    def test_counts_display(self):
+        self.screen.start_up_creation("Bubble Sort")
+        assert self.screen.sort_method.counts is None
+        assert len(self.screen.counts_sprite) == 0
+        self.screen.cleanup()
+        self.screen.count_ops = True
+        self.screen.start_up_creation("Bubble Sort")
+        assert self.screen.counts_sprite.sprite.text.startswith("Comparisons: 0 ")
+        self.screen.advance_sort()
+        counts = self.screen.sort_method.counts
+        assert counts.comparisons == 8
+        assert f"Comparisons: 8  Swaps: {counts.swaps}" in (
+            self.screen.counts_sprite.sprite.text
+        )
+        self.screen.cleanup()
+        assert len(self.screen.counts_sprite) == 0
+
+    def test_create_board_distribution(self):
+        self.screen = Screen(seed=1, distribution="reversed")
+        self.screen.create_board()
+        assert self.screen.board == [401, 351, 301, 251, 201, 151, 101, 51, 1]
+        first = Screen(board_size=50, seed=2, distribution="zipf")
+        second = Screen(board_size=50, seed=2, distribution="zipf")
+        first.create_board()
+        second.create_board()
+        assert first.board == second.board
+
+    def test_create_board_skips_the_dataset_cache(self):
+        self.screen = Screen(board_size=20_000)
+        with patch("algorithms.datasets.write_npy") as write_npy:
+            self.screen.create_board()
+            self.screen.create_board()
+        write_npy.assert_not_called()
+        assert self.screen.board_length == 20_000
+
+    def test_distribution_sort_run_completes(self):
+        self.screen.start_up_creation("MSD Radix Sort")
+        self.screen.shown_alg_info = True
+        self.screen.advance_sort()
+        assert set(self.screen.sort_method.aux_lanes) == {"Buckets", "Buffer"}
+        self.screen.window.fill(self.screen.background)
+        self.screen.draw_sprites()
+        r, g, b, _ = self.screen.window.get_at(self.screen.aux_lane_rect.topleft)
+        assert (r, g, b) == self.screen.aux_lane_color
+        self.screen.toggle_autoplay()
+        while self.screen.autoplayer.playing:
+            self.screen.autoplay_frame()
+        heights = [block.height for block in self.screen.blocks]
+        assert heights == sorted(heights)
+
+    def test_granularity(self):
+        self.screen = Screen(seed=5)
+        self.screen.start_up_creation("Bubble Sort")
+        self.screen.shown_alg_info = True
+        with patch(
+            "pygame.event.get",
+            return_value=[pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_g})],
+        ):
+            self.screen.event_handler()
+        assert self.screen.granularity == "comparison"
+        assert "per comparison" in self.screen.speed_sprite.sprite.text
+        self.screen.advance_sort()
+        assert self.screen.sort_method.position == 1
+        assert self.screen.highlight == (0, 1)
+        self.screen.sync_index()
+        assert self.screen.index == 0
+        self.screen.window.fill(self.screen.background)
+        self.screen.draw_sprites()
+        rect = self.screen.highlight_rects()[1]
+        r, g, b, _ = self.screen.window.get_at((rect.left, rect.bottom - 1))
+        assert (r, g, b) == self.screen.highlight_color
+
+        self.screen.cycle_granularity()
+        assert self.screen.granularity == "swap"
+        assert self.screen.highlight == ()
+        self.screen.advance_sort()
+        ops = self.screen.trace.ops[: self.screen.sort_method.position].tolist()
+        assert ops[-1] in (Op.SWAP, Op.PASS)
+        assert set(ops[:-1]) == {Op.COMPARE}
+
+        self.screen.cycle_granularity()
+        assert self.screen.granularity == "pass"
+        self.screen.advance_sort()
+        assert self.screen.highlight == ()
+        assert self.screen.sort_method.counter >= 1
+
+    def test_back_to_back_runs_reuse_pooled_sprites(self):
+        # Only sprites, block surfaces and the Next button are pooled; the
+        # trace, timeline, layout, model and sorter are rebuilt every run. A
+        # reversed board gives every run the same block surfaces.
+        self.screen = Screen(seed=0, distribution="reversed")
+        self.screen.create_sorting_buttons()
+
+        def run():
+            self.screen.start_up_creation("Bubble Sort")
+            self.screen.shown_alg_info = True
+            self.screen.toggle_autoplay()
+            while self.screen.autoplayer.playing:
+                self.screen.autoplay_frame()
+            self.screen.cleanup()
+            self.screen.create_complete_banner()
+
+        for _ in range(3):
+            run()
+        next_button = self.screen.next_button
+        created = (self.screen.block_pool.created, self.screen.text_pool.created)
+        pooled = [
+            tracemalloc.Filter(True, "*block_sprites.py"),
+            tracemalloc.Filter(True, "*text_sprites.py"),
+            tracemalloc.Filter(True, "*button.py"),
+            tracemalloc.Filter(True, "*pool.py"),
+        ]
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot().filter_traces(pooled)
+            for _ in range(3):
+                run()
+            after = tracemalloc.take_snapshot().filter_traces(pooled)
+        finally:
+            tracemalloc.stop()
+        growth = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+        assert growth < 1024
+        assert self.screen.next_button is next_button
+        assert (
+            self.screen.block_pool.created,
+            self.screen.text_pool.created,
+        ) == created
+
+    def test_algorithm_buttons_inactive_during_a_run(self):
+        self.screen.create_sorting_buttons()
+        first = self.screen.alg_buttons[0].top_rect.center
+        self.screen.mark_hover_changes(first)
+        assert self.screen.dirty_rects == [self.screen.alg_buttons[0].top_rect]
+        self.screen.start_up_creation("Bubble Sort")
+        assert self.screen.dispatcher.widget_at(first) is None
+        assert self.screen.dispatcher.widget_at((800, 400)) is self.screen.next_button
+        self.screen.cleanup()
+        assert self.screen.dispatcher.widget_at(first) is self.screen.alg_buttons[0]
+
+    def test_merge_sort_run_completes(self):
+        self.screen.start_up_creation("Merge Sort")
+        self.screen.shown_alg_info = True
+        clicks = 0
+        while not self.screen.complete and clicks < 20:
+            with patch(
+                "pygame.event.get",
+                return_value=[
+                    pygame.event.Event(
+                        pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (800, 400)}
+                    )
+                ],
+            ):
+                self.screen.event_handler()
+            clicks += 1
+        assert self.screen.complete is True
+        heights = [block.height for block in self.screen.blocks]
+        assert heights == sorted(heights)
+
+    def test_draw_aux_lanes(self):
+        self.screen.start_up_creation("Merge Sort")
+        self.screen.shown_alg_info = True
+        self.screen.advance_sort()
+        self.screen.window.fill(self.screen.background)
+        self.screen.draw_sprites()
+        r, g, b, _ = self.screen.window.get_at(self.screen.aux_lane_rect.topleft)
+        assert (r, g, b) == self.screen.aux_lane_color
+
+    def test_save_trace(self):
+        self.screen.start_up_creation("Heap Sort")
+        with tempfile.TemporaryDirectory() as directory:
+            assert self.screen.trace.finished
+            with patch("algorithms.trace_file.record_to_file") as record_to_file:
+                path = self.screen.save_trace(os.path.join(directory, "heap.svtr"))
+            record_to_file.assert_not_called()
+            self.screen.save_thread.join(timeout=10)
+            assert os.listdir(directory) == ["heap.svtr"]
+            with TraceFile(path) as replay:
+                assert replay.algorithm_name == "HeapSort"
+                assert list(replay.initial) == self.screen.board
+                assert replay.seek(len(replay)).is_sorted()
+
+    def test_save_trace_records_unfinished_runs_off_thread(self):
+        self.screen.trace_preview_steps = 10
+        self.screen.start_up_creation("Bubble Sort")
+        assert not self.screen.trace.finished
+        with tempfile.TemporaryDirectory() as directory:
+            with patch("algorithms.trace_file.write_trace") as write_trace:
+                path = self.screen.save_trace(os.path.join(directory, "bubble.svtr"))
+            write_trace.assert_not_called()
+            self.screen.save_thread.join(timeout=10)
+            assert os.listdir(directory) == ["bubble.svtr"]
+            with TraceFile(path) as replay:
+                assert replay.algorithm_name == "BubbleSort"
+                assert replay.seek(len(replay)).is_sorted()
+                assert len(replay) > len(self.screen.trace)
+
+    def test_render_full_redraw(self):
+        self.screen.create_sorting_buttons()
+        with patch("pygame.display.flip") as flip, patch(
+            "pygame.display.update"
+        ) as update:
+            self.screen.render()
+            flip.assert_called_once()
+            update.assert_not_called()
+        assert self.screen.full_redraw is False
+
+    def test_render_idle_frame_does_nothing(self):
+        self.screen.create_sorting_buttons()
+        self.screen.render()
+        with patch("pygame.display.flip") as flip, patch(
+            "pygame.display.update"
+        ) as update, patch.object(self.screen, "draw_frame") as draw_frame:
+            self.screen.render()
+            flip.assert_not_called()
+            update.assert_not_called()
+            draw_frame.assert_not_called()
+
+    def test_render_dirty_rects(self):
+        self.screen.create_sorting_buttons()
+        self.screen.render()
+        rect = pygame.Rect(10, 10, 20, 20)
+        self.screen.mark_dirty(rect)
+        with patch("pygame.display.flip") as flip, patch(
+            "pygame.display.update"
+        ) as update:
+            self.screen.render()
+            flip.assert_not_called()
+            update.assert_called_once_with([rect])
+        assert self.screen.dirty_rects == []
+
     def test_event_handler_next_button_pause_game(self):
         ...
 
     def test_start(self):
         ...
 
+    def test_start_measures_first_frame(self):
+        startup = StartupTimer()
+        with patch("pygame.display.flip") as flip:
+            self.screen.start(startup)
+        flip.assert_called_once()
+        assert [name for name, _ in startup.phases] == ["buttons", "first frame"]
+        assert len(self.screen.alg_buttons) == len(registry.names())
+        assert all(button._text_surf is not None for button in self.screen.alg_buttons)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from algorithms.algorithms import BubbleSort, InsertionSort, SelectionSort
+from algorithms.model import BoardModel
+from algorithms.trace import Trace
+
+
+class TestTrace(unittest.TestCase):
+    def setUp(self):
+        self.values = [(i * 37) % 50 for i in range(40)]
+
+    def reference_states(self, sort_class):
+        sorter = sort_class(BoardModel(self.values))
+        states = [list(sorter.model.values)]
+        while sorter.step() is not None:
+            states.append(list(sorter.model.values))
+        return states
+
+    def test_record(self):
+        trace = Trace(BubbleSort, self.values, keyframe_interval=100)
+        assert trace.record(10) == 10
+        assert len(trace) == 10
+        assert trace.finished is False
+        trace.record()
+        assert trace.finished is True
+        assert len(trace.keyframes) == len(trace) // 100 + 1
+
+    def test_seek_matches_a_live_run(self):
+        for sort_class in (InsertionSort, SelectionSort, BubbleSort):
+            states = self.reference_states(sort_class)
+            trace = Trace(sort_class, self.values, keyframe_interval=64)
+            trace.record()
+            positions = [0, len(trace), 63, 64, 65, 500, 10, len(trace) - 1, 128]
+            for position in positions:
+                assert list(trace.seek(position).values) == states[position]
+
+    def test_seek_records_lazily(self):
+        trace = Trace(InsertionSort, self.values)
+        trace.seek(50)
+        assert len(trace) == 50
+        assert trace.position == 50
+
+    def test_seek_clamps_past_the_end(self):
+        trace = Trace(SelectionSort, self.values)
+        model = trace.seek(10**9)
+        assert trace.finished is True
+        assert list(model.values) == sorted(self.values)
+
+    def test_passes_at(self):
+        trace = Trace(BubbleSort, [3, 2, 1])
+        trace.record()
+        # Pass 1 is compare, swap, compare, swap, pass.
+        assert trace.passes_at(4) == 0
+        assert trace.passes_at(5) == 1
+        assert trace.passes_at(len(trace)) == 3
+
+
+if __name__ == "__main__":
+    unittest.main()
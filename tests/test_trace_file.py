@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+
+from algorithms.algorithms import BubbleSort, InsertionSort, MergeSort
+from algorithms.trace import record_trace
+from algorithms.trace_file import RECORD, TraceFile, record_to_file, write_trace
+
+
+class TestTraceFile(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "run.svtr")
+        self.values = [(i * 37) % 50 for i in range(40)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        trace = record_trace(BubbleSort, self.values)
+        write_trace(self.path, "BubbleSort", trace, chunk_records=100)
+        with TraceFile(self.path) as replay:
+            assert replay.algorithm_name == "BubbleSort"
+            assert list(replay.initial) == self.values
+            assert len(replay) == len(trace)
+            assert replay.chunk_count == -(-len(trace) // 100)
+            assert list(replay) == list(zip(trace.ops, trace.first, trace.second))
+
+    def test_compressed(self):
+        count = record_to_file(self.path, BubbleSort, self.values)
+        assert os.path.getsize(self.path) < count * RECORD.size
+
+    def test_seek_matches_in_memory_trace(self):
+        for sort_class in (InsertionSort, MergeSort):
+            trace = record_trace(sort_class, self.values)
+            record_to_file(self.path, sort_class, self.values, chunk_records=64)
+            with TraceFile(self.path) as replay:
+                for position in (0, len(trace), 63, 64, 65, 300, 5, len(trace) - 1):
+                    assert list(replay.seek(position).values) == list(
+                        trace.seek(position).values
+                    )
+                    assert replay.passes_at(position) == trace.passes_at(position)
+                assert replay.comparisons_between(10, 200) == (
+                    trace.comparisons_between(10, 200)
+                )
+
+    def test_record_limit(self):
+        assert record_to_file(self.path, BubbleSort, self.values, limit=10) == 10
+        with TraceFile(self.path) as replay:
+            assert len(replay) == 10
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a trace" * 10)
+        with self.assertRaises(ValueError):
+            TraceFile(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+from unittest.mock import patch
+
+from algorithms.algorithms import BubbleSort, InsertionSort, MergeSort
+from algorithms.model import BoardModel
+from algorithms.worker import SortWorker
+from gui.autoplay import AutoPlayer
+
+
+class TestSortWorker(unittest.TestCase):
+    def setUp(self):
+        self.values = [(i * 37) % 101 for i in range(120)]
+        self.worker = None
+
+    def tearDown(self):
+        if self.worker:
+            self.worker.stop()
+
+    def reference(self, sort_class):
+        sorter = sort_class(BoardModel(self.values))
+        while sorter.step() is not None:
+            pass
+        return sorter
+
+    def drain_all(self, worker):
+        total = 0
+        while not worker.finished:
+            done, _ = worker.drain(1000, block=True)
+            total += done
+        return total
+
+    def test_thread_matches_inline_run(self):
+        for sort_class in (BubbleSort, MergeSort):
+            self.worker = SortWorker(
+                sort_class, BoardModel(self.values), batch_size=64, max_batches=2
+            )
+            total = self.drain_all(self.worker)
+            reference = self.reference(sort_class)
+            assert total == reference.position == self.worker.position
+            assert self.worker.counter == reference.counter
+            assert list(self.worker.model.values) == sorted(self.values)
+            self.worker.stop()
+
+    def test_process_mode(self):
+        self.worker = SortWorker(InsertionSort, BoardModel(self.values), mode="process")
+        self.drain_all(self.worker)
+        assert list(self.worker.model.values) == sorted(self.values)
+
+    def test_drain_respects_step_limit(self):
+        self.worker = SortWorker(BubbleSort, BoardModel(self.values), batch_size=64)
+        done, finished = self.worker.drain(10, block=True)
+        assert done == 10
+        assert finished is False
+
+    def test_sort_advances_one_pass(self):
+        self.worker = SortWorker(BubbleSort, BoardModel(self.values))
+        reference = BubbleSort(BoardModel(self.values))
+        for _ in range(3):
+            self.worker.sort()
+            reference.sort()
+        assert self.worker.counter == 3
+        assert self.worker.blocks == reference.blocks
+
+    def test_advance_granularity(self):
+        self.worker = SortWorker(BubbleSort, BoardModel(self.values))
+        reference = BubbleSort(BoardModel(self.values))
+        for granularity in ("comparison", "swap", "pass", "swap"):
+            assert self.worker.advance(granularity) == reference.advance(granularity)
+        assert self.worker.position == reference.position
+
+    def test_advance_pass_drains_in_one_call(self):
+        self.worker = SortWorker(BubbleSort, BoardModel(self.values))
+        reference = BubbleSort(BoardModel(self.values))
+        with patch.object(self.worker, "step") as step:
+            while True:
+                expected = reference.advance("pass")
+                assert self.worker.advance("pass") == expected
+                if expected is None:
+                    break
+        step.assert_not_called()
+        assert self.worker.position == reference.position
+        assert self.worker.blocks == reference.blocks
+
+    def test_done_after_last_pass(self):
+        self.worker = SortWorker(BubbleSort, BoardModel(self.values))
+        reference = BubbleSort(BoardModel(self.values))
+        while not reference.done:
+            assert self.worker.done is False
+            reference.advance("pass")
+            self.worker.advance("pass")
+        assert self.worker.done is True
+        assert self.worker.counter == len(self.values)
+
+    def test_bounded_queue(self):
+        self.worker = SortWorker(
+            BubbleSort, BoardModel(self.values), batch_size=16, max_batches=2
+        )
+        self.worker.drain(1, block=True)
+        assert self.worker.batches.qsize() <= 2
+
+    def test_stop(self):
+        self.worker = SortWorker(BubbleSort, BoardModel(list(range(3000, 0, -1))))
+        self.worker.stop()
+        assert not self.worker.runner.is_alive()
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            SortWorker(BubbleSort, BoardModel(self.values), mode="fiber")
+
+    def test_autoplayer_run_batched(self):
+        self.worker = SortWorker(BubbleSort, BoardModel(self.values))
+        player = AutoPlayer(steps_per_frame=10**6, budget_ms=10**4)
+        player.toggle()
+        while player.playing:
+            player.run_batched(
+                lambda due, deadline: self.worker.drain(due, deadline, block=True)
+            )
+        assert list(self.worker.model.values) == sorted(self.values)
+
+
+if __name__ == "__main__":
+    unittest.main()